@@ -6,15 +6,38 @@ In addition to the command line tool the functionality of cutplace is also
 accessible through a Python API.
 """
 
-import pkg_resources
-
-from cutplace.errors import Location
-from cutplace.interface import Cid
-from cutplace.ranges import Range
-from cutplace.validio import Reader, Writer, rows, validate
-
-#: Package version information.
-__version__ = pkg_resources.get_distribution(__name__).version
+import importlib
 
 #: Public classes and functions.
 __all__ = ["Cid", "Location", "Range", "Reader", "Writer", "validate", "rows", "__version__"]
+
+# Modules defining the public classes and functions, which are imported
+# only when first used to start faster.
+_NAME_TO_MODULE_NAME_MAP = {
+    "Cid": "cutplace.interface",
+    "Location": "cutplace.errors",
+    "Range": "cutplace.ranges",
+    "Reader": "cutplace.validio",
+    "Writer": "cutplace.validio",
+    "rows": "cutplace.validio",
+    "validate": "cutplace.validio",
+}
+
+
+def __getattr__(name):
+    if name == "__version__":
+        # Looking up the version takes a while, so do it only when needed.
+        from importlib import metadata
+
+        result = metadata.version(__name__)
+    else:
+        module_name = _NAME_TO_MODULE_NAME_MAP.get(name)
+        if module_name is None:
+            raise AttributeError("module %r has no attribute %r" % (__name__, name))
+        result = getattr(importlib.import_module(module_name), name)
+    globals()[name] = result
+    return result
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
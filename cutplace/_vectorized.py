@@ -0,0 +1,237 @@
+"""
+Vectorized validation of whole columns of field values using NumPy. This is
+only available if :py:mod:`numpy` is installed, which can be checked with
+:py:data:`has_numpy`.
+
+The functions here only find the values that are certainly valid, for
+example integer numbers consisting of nothing but ASCII digits and an
+optional sign. All other values have to be validated one at a time by the
+field format, so errors end up with the same messages in any case.
+"""
+
+# Copyright (C) 2009-2021 Thomas Aglassinger
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License
+# for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+try:
+    import numpy
+
+    has_numpy = True
+except ImportError:
+    has_numpy = False
+
+#: Minimum number of values for which vectorized validation is worth the overhead.
+MIN_VALUE_COUNT = 64
+
+# Maximum number of digits of integer numbers that certainly fit into a 64 bit integer.
+_MAX_INTEGER_DIGIT_COUNT = 18
+
+# Maximum length of decimal numbers to validate vectorized; longer ones are validated one at a time.
+_MAX_DECIMAL_LENGTH = 40
+
+# Maximum number of choices to compare with each value; with more choices use a set operation.
+_MAX_CHOICE_COUNT_TO_COMPARE = 16
+
+_MIN_INT64 = -(2**63)
+_MAX_INT64 = 2**63 - 1
+
+_DIGIT_0 = ord("0")
+_DIGIT_9 = ord("9")
+_MINUS = ord("-")
+_PLUS = ord("+")
+
+
+def _lengths(values):
+    return numpy.fromiter(map(len, values), dtype=numpy.int64, count=len(values))
+
+
+def _int64_items(items):
+    """
+    The ``(lower, upper)`` items of a :py:class:`cutplace.ranges.Range` with
+    limits outside of 64 bit integers either removed or replaced by ``None``.
+    """
+    result = []
+    for lower, upper in items:
+        if (lower is not None) and (lower <= _MIN_INT64):
+            lower = None
+        if (upper is not None) and (upper >= _MAX_INT64):
+            upper = None
+        is_possible_item = ((lower is None) or (lower <= _MAX_INT64)) and ((upper is None) or (upper >= _MIN_INT64))
+        if is_possible_item:
+            result.append((lower, upper))
+    return result
+
+
+def _within_items_mask(numbers, items):
+    """
+    Mask of all ``numbers`` that are within at least one of the range
+    ``items``; if ``items`` is ``None``, all numbers are within.
+    """
+    if items is None:
+        return numpy.ones(len(numbers), dtype=bool)
+    result = numpy.zeros(len(numbers), dtype=bool)
+    for lower, upper in _int64_items(items):
+        item_mask = numpy.ones(len(numbers), dtype=bool)
+        if lower is not None:
+            item_mask &= numbers >= lower
+        if upper is not None:
+            item_mask &= numbers <= upper
+        result |= item_mask
+    return result
+
+
+def _candidate_array(values, max_length):
+    """
+    Tuple with a NumPy array of all ``values`` with at most ``max_length``
+    characters, their lengths and their indices in ``values``.
+    """
+    candidate_array = None
+    # NumPy removes trailing null characters, so values containing them need the lengths as computed by Python.
+    if "\0" not in "".join(values):
+        candidate_array = numpy.array(values, dtype=str)
+        if candidate_array.itemsize // 4 <= max_length:
+            lengths = numpy.char.str_len(candidate_array)
+            candidate_indices = numpy.arange(len(values))
+        else:
+            candidate_array = None
+    if candidate_array is None:
+        lengths = _lengths(values)
+        candidate_indices = numpy.flatnonzero(lengths <= max_length)
+        lengths = lengths[candidate_indices]
+        candidates = [values[index] for index in candidate_indices.tolist()]
+        candidate_array = numpy.array(candidates, dtype="<U%d" % max(1, max_length))
+    return candidate_array, lengths, candidate_indices
+
+
+def _code_points_and_positions(candidate_array, lengths):
+    """
+    Tuple with a matrix containing the Unicode code points of each value in
+    ``candidate_array`` in a row padded with 0, a mask of the positions
+    inside the actual value according to ``lengths`` and a mask of the
+    positions containing an ASCII digit.
+    """
+    width = candidate_array.itemsize // 4
+    code_points = candidate_array.view(numpy.uint32).reshape(len(candidate_array), width)
+    is_inside = numpy.arange(width) < lengths[:, None]
+    is_digit = (code_points >= _DIGIT_0) & (code_points <= _DIGIT_9)
+    return code_points, is_inside, is_digit
+
+
+def _invalid_indices(value_count, candidate_indices, is_valid_candidate):
+    is_valid = numpy.zeros(value_count, dtype=bool)
+    is_valid[candidate_indices] = is_valid_candidate
+    return numpy.flatnonzero(~is_valid).tolist()
+
+
+def integer_values(values, length_items, range_items):
+    """
+    Vectorized validation of integer numbers in ``values``.
+
+    :param length_items: items of the length range values must be within, \
+      or ``None`` if any length is valid
+    :param range_items: items of the range numbers must be within, \
+      or ``None`` if any number is valid
+    :return: tuple with a list of the indices of the values that are not \
+      certainly valid and a list with the respective :py:class:`int` for \
+      each value, which is only meaningful for valid values
+    """
+    value_count = len(values)
+    candidate_array, lengths, candidate_indices = _candidate_array(values, _MAX_INTEGER_DIGIT_COUNT + 1)
+    code_points, is_inside, is_digit = _code_points_and_positions(candidate_array, lengths)
+    is_digit &= is_inside
+    first_code_points = code_points[:, 0] if code_points.shape[1] else numpy.zeros(len(code_points), numpy.uint32)
+    is_negative = first_code_points == _MINUS
+    has_sign = is_negative | (first_code_points == _PLUS)
+    is_valid_position = is_digit | ~is_inside
+    if code_points.shape[1]:
+        is_valid_position[:, 0] |= has_sign
+    digit_counts = lengths - has_sign
+    is_integer = (
+        is_valid_position.all(axis=1)
+        & (digit_counts >= 1)
+        & (digit_counts <= _MAX_INTEGER_DIGIT_COUNT)
+        & _within_items_mask(lengths, length_items)
+    )
+
+    # Compute the numbers using Horner's method, skipping the sign and positions after the last digit.
+    numbers = numpy.zeros(len(code_points), dtype=numpy.int64)
+    for position in range(code_points.shape[1]):
+        digits = code_points[:, position].astype(numpy.int64) - _DIGIT_0
+        numbers = numpy.where(is_digit[:, position], numbers * 10 + digits, numbers)
+    numbers = numpy.where(is_negative, -numbers, numbers)
+
+    all_numbers = numpy.zeros(value_count, dtype=numpy.int64)
+    all_numbers[candidate_indices] = numbers
+    invalid_indices = _invalid_indices(
+        value_count, candidate_indices, is_integer & _within_items_mask(numbers, range_items)
+    )
+    return invalid_indices, all_numbers.tolist()
+
+
+def _is_choice_mask(candidate_array, choices):
+    if len(choices) <= _MAX_CHOICE_COUNT_TO_COMPARE:
+        result = numpy.zeros(len(candidate_array), dtype=bool)
+        for choice in choices:
+            result |= candidate_array == choice
+    else:
+        result = numpy.isin(candidate_array, choices)
+    return result
+
+
+def choice_invalid_indices(values, length_items, choices):
+    """
+    Vectorized validation of ``values`` that must be one of ``choices``.
+
+    :param length_items: items of the length range values must be within, \
+      or ``None`` if any length is valid
+    :return: list of the indices of the values that are not certainly valid
+    """
+    # Choices with trailing null characters are left to the caller because NumPy would remove them.
+    choices = [choice for choice in choices if not choice.endswith("\0")]
+    if not choices:
+        return list(range(len(values)))
+    candidate_array, lengths, candidate_indices = _candidate_array(values, max(len(choice) for choice in choices))
+    is_valid_candidate = (
+        (lengths >= 1)
+        & (numpy.char.str_len(candidate_array) == lengths)
+        & _within_items_mask(lengths, length_items)
+        & _is_choice_mask(candidate_array, choices)
+    )
+    return _invalid_indices(len(values), candidate_indices, is_valid_candidate)
+
+
+def plain_decimal_mask(values, decimal_separator):
+    """
+    Mask of ``values`` that are plain decimal numbers, meaning they consist
+    of ASCII digits, at most one ``decimal_separator`` and an optional
+    leading sign.
+
+    :return: list that tells for each value if it is a plain decimal number
+    """
+    assert len(decimal_separator) == 1, "decimal_separator=%r" % decimal_separator
+
+    value_count = len(values)
+    candidate_array, lengths, candidate_indices = _candidate_array(values, _MAX_DECIMAL_LENGTH)
+    code_points, is_inside, is_digit = _code_points_and_positions(candidate_array, lengths)
+    is_digit &= is_inside
+    first_code_points = code_points[:, 0] if code_points.shape[1] else numpy.zeros(len(code_points), numpy.uint32)
+    has_sign = (first_code_points == _MINUS) | (first_code_points == _PLUS)
+    is_separator = is_inside & (code_points == ord(decimal_separator))
+    is_valid_position = is_digit | is_separator | ~is_inside
+    if code_points.shape[1]:
+        is_valid_position[:, 0] |= has_sign
+    is_plain_decimal = is_valid_position.all(axis=1) & (is_digit.sum(axis=1) >= 1) & (is_separator.sum(axis=1) <= 1)
+
+    is_valid = numpy.zeros(value_count, dtype=bool)
+    is_valid[candidate_indices] = is_plain_decimal
+    return is_valid.tolist()
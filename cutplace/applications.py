@@ -4,6 +4,7 @@ Front end for command line application. This takes care of parsing the
 command line options, calling the appropriate low level function, reporting
 any errors and setting a proper exit code to be passed to the end user.
 """
+
 # Copyright (C) 2009-2021 Thomas Aglassinger
 #
 # This program is free software: you can redistribute it and/or modify it
@@ -19,18 +20,65 @@ any errors and setting a proper exit code to be passed to the end user.
 # You should have received a copy of the GNU Lesser General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 import argparse
+import concurrent.futures
+import copy
 import logging
+import os.path
 import sys
 
-from cutplace import __version__, _tools, errors, gui, interface, rowio, sql, validio
+import cutplace
+from cutplace import _tools, errors, interface, rowio, validio
 
 DEFAULT_CID_ENCODING = "utf-8"
 DEFAULT_LOG_LEVEL = "info"
 assert DEFAULT_LOG_LEVEL in _tools.LOG_LEVEL_NAME_TO_LEVEL_MAP
 DEFAULT_VALIDATE_UNTIL = -1
+DEFAULT_JOBS = 1
+DEFAULT_VALUE_CACHE_SIZE = 0
+#: Same as :py:data:`cutplace.sql.DEFAULT_LOAD_BATCH_SIZE`, which is only imported for --load-sqlite.
+DEFAULT_LOAD_BATCH_SIZE = 1000
+#: Same as :py:data:`cutplace.sql.DEFAULT_LOAD_TRANSACTION_SIZE`.
+DEFAULT_LOAD_TRANSACTION_SIZE = 0
+#: Same as :py:data:`cutplace.server.DEFAULT_HOST`, which is only imported for --serve.
+DEFAULT_HOST = "localhost"
+#: Same as :py:data:`cutplace.server.DEFAULT_PORT`.
+DEFAULT_PORT = 8778
 
 _log = logging.getLogger("cutplace")
 
+# The application used by parallel workers, set by `_init_validation_worker()`.
+_worker_app = None
+
+
+class _LogRecorder(object):
+    """
+    Stand in for a :py:class:`logging.Logger` that only remembers the
+    messages so parallel workers can pass them to the main process, which
+    then logs them in the order of the data files.
+    """
+
+    def __init__(self):
+        self.records = []
+
+    def info(self, message, *args):
+        self.records.append((logging.INFO, message, args))
+
+    def error(self, message, *args):
+        self.records.append((logging.ERROR, message, args))
+
+
+class _VersionAction(argparse.Action):
+    """
+    Similar to the ``"version"`` action of :py:mod:`argparse` but looks up
+    the version only when the option is used, which takes a while.
+    """
+
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, default=argparse.SUPPRESS, help=None):
+        super().__init__(option_strings=option_strings, dest=dest, default=default, nargs=0, help=help)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        parser.exit(message="%s %s\n" % (parser.prog, cutplace.__version__))
+
 
 class CutplaceApp(object):
     """
@@ -47,10 +95,19 @@ class CutplaceApp(object):
         self.cid_path = None
         self.is_gui = False
         self.is_create_sql = False
+        self.is_cid_cached = False
+        self.is_stats = False
+        self.is_serve = False
+        self.port = DEFAULT_PORT
+        self.load_sqlite_path = None
+        self.load_batch_size = DEFAULT_LOAD_BATCH_SIZE
+        self.load_transaction_size = DEFAULT_LOAD_TRANSACTION_SIZE
         self.data_paths = None
         self.last_validation_was_ok = False
         self.all_validations_were_ok = True
         self.validate_until = None
+        self.jobs = DEFAULT_JOBS
+        self.value_cache_size = DEFAULT_VALUE_CACHE_SIZE
 
     def set_options(self, argv):
         """
@@ -59,9 +116,14 @@ class CutplaceApp(object):
         assert argv is not None
 
         description = "validate DATA-FILE against interface description CID-FILE"
-        version = "%(prog)s " + __version__
 
         parser = argparse.ArgumentParser(description=description)
+        parser.add_argument(
+            "--cache",
+            action="store_true",
+            dest="is_cid_cached",
+            help="cache CID-FILE in $XDG_CACHE_HOME/cutplace or ~/.cache/cutplace to read it faster next time",
+        )
         parser.add_argument(
             "--create",
             "-C",
@@ -76,6 +138,39 @@ class CutplaceApp(object):
             dest="is_gui",
             help="provide a graphical user interface to set CID-FILE and DATA-FILE",
         )
+        parser.add_argument(
+            "--jobs",
+            "-j",
+            metavar="COUNT",
+            dest="jobs",
+            default=DEFAULT_JOBS,
+            type=int,
+            help="number of processes to validate several DATA-FILEs or chunks of a single DATA-FILE in parallel "
+            "(default: %d)" % DEFAULT_JOBS,
+        )
+        parser.add_argument(
+            "--load-batch",
+            metavar="COUNT",
+            dest="load_batch_size",
+            default=DEFAULT_LOAD_BATCH_SIZE,
+            type=int,
+            help="number of rows --load-sqlite inserts at once (default: %d)" % DEFAULT_LOAD_BATCH_SIZE,
+        )
+        parser.add_argument(
+            "--load-sqlite",
+            metavar="DATABASE",
+            dest="load_sqlite_path",
+            help="insert the validated rows of DATA-FILE(s) in a table named after CID-FILE in the SQLite DATABASE",
+        )
+        parser.add_argument(
+            "--load-transaction",
+            metavar="COUNT",
+            dest="load_transaction_size",
+            default=DEFAULT_LOAD_TRANSACTION_SIZE,
+            type=int,
+            help="number of rows after which --load-sqlite commits; 0=all rows of a DATA-FILE at once (default: %d)"
+            % DEFAULT_LOAD_TRANSACTION_SIZE,
+        )
         parser.add_argument(
             "--log",
             metavar="LEVEL",
@@ -91,6 +186,26 @@ class CutplaceApp(object):
             dest="plugins_folder",
             help="folder to scan for plugins (default: no plugins)",
         )
+        parser.add_argument(
+            "--port",
+            metavar="PORT",
+            dest="port",
+            default=DEFAULT_PORT,
+            type=int,
+            help="port for --serve to listen on (default: %d)" % DEFAULT_PORT,
+        )
+        parser.add_argument(
+            "--serve",
+            action="store_true",
+            dest="is_serve",
+            help="keep running and validate data posted to http://%s:PORT/validate" % DEFAULT_HOST,
+        )
+        parser.add_argument(
+            "--stats",
+            action="store_true",
+            dest="is_stats",
+            help="log the time spent on and the values rejected by each field and check",
+        )
         parser.add_argument(
             "--until",
             "-u",
@@ -100,7 +215,16 @@ class CutplaceApp(object):
             type=int,
             help="maximum number of rows to validate; -1=all, 0=none (default: %d)" % DEFAULT_VALIDATE_UNTIL,
         )
-        parser.add_argument("--version", action="version", version=version)
+        parser.add_argument(
+            "--value-cache",
+            metavar="COUNT",
+            dest="value_cache_size",
+            default=DEFAULT_VALUE_CACHE_SIZE,
+            type=int,
+            help="number of recently validated values to remember for each field; 0=none (default: %d)"
+            % DEFAULT_VALUE_CACHE_SIZE,
+        )
+        parser.add_argument("--version", action=_VersionAction, help="show program's version number and exit")
         parser.add_argument(
             "cid_path", metavar="CID-FILE", nargs="?", help="file containing a cutplace interface definition (CID)"
         )
@@ -109,7 +233,11 @@ class CutplaceApp(object):
 
         self._log.setLevel(_tools.LOG_LEVEL_NAME_TO_LEVEL_MAP[args.log_level])
         self.is_create_sql = args.is_create_sql
+        self.is_cid_cached = args.is_cid_cached
         self.is_gui = args.is_gui
+        self.is_stats = args.is_stats
+        self.is_serve = args.is_serve
+        self.load_sqlite_path = args.load_sqlite_path
 
         if args.validate_until is not None:
             if args.validate_until == -1:
@@ -118,31 +246,66 @@ class CutplaceApp(object):
                 self.validate_until = args.validate_until
             else:
                 parser.error("option --until is %d but must be at least -1" % args.validate_until)
+        if args.jobs >= 1:
+            self.jobs = args.jobs
+        else:
+            parser.error("option --jobs is %d but must be at least 1" % args.jobs)
+        if 0 <= args.port <= 65535:
+            self.port = args.port
+        else:
+            parser.error("option --port is %d but must be between 0 and 65535" % args.port)
+        if args.load_batch_size >= 1:
+            self.load_batch_size = args.load_batch_size
+        else:
+            parser.error("option --load-batch is %d but must be at least 1" % args.load_batch_size)
+        if args.load_transaction_size >= 0:
+            self.load_transaction_size = args.load_transaction_size
+        else:
+            parser.error("option --load-transaction is %d but must be at least 0" % args.load_transaction_size)
+        if (self.load_sqlite_path is not None) and (self.validate_until is not None):
+            parser.error("option --until cannot be combined with --load-sqlite because all rows have to be validated")
+        if (self.load_sqlite_path is not None) and (self.jobs > 1):
+            parser.error(
+                "option --jobs cannot be combined with --load-sqlite because rows are loaded one file at a time"
+            )
+        if (self.load_sqlite_path is not None) and not args.data_paths:
+            parser.error("option --load-sqlite requires at least one DATA-FILE")
+        if args.value_cache_size >= 0:
+            self.value_cache_size = args.value_cache_size
+        else:
+            parser.error("option --value-cache is %d but must be at least 0" % args.value_cache_size)
         if args.plugins_folder is not None:
             interface.import_plugins(args.plugins_folder)
         if args.data_paths is not None:
             self.data_paths = args.data_paths
         if args.is_gui:
+            from cutplace import gui
+
             if not gui.has_tk:
                 parser.error("tkinter package must be installed in order for --gui to work")
         if args.cid_path is not None:
             self.set_cid_from_path(args.cid_path)
-        elif not args.is_gui:
-            parser.error("CID_PATH or --gui must be specified")
+        elif not (args.is_gui or args.is_serve):
+            parser.error("CID_PATH, --gui or --serve must be specified")
 
-        self._log.debug("cutplace %s", __version__)
+        if self._log.isEnabledFor(logging.DEBUG):
+            self._log.debug("cutplace %s", cutplace.__version__)
         self._log.debug("arguments=%s", args)
 
     def set_cid_from_path(self, cid_path):
         """
         Read the :py:class:`cutplace.interface.Cid` to be used by this
-        application from ``cid_path``.
+        application from ``cid_path``, possibly using
+        :py:func:`cutplace.interface.cached_cid` if ``is_cid_cached``.
         """
         assert cid_path is not None
-        new_cid = interface.Cid()
         _log.info('read CID from "%s"', cid_path)
-        cid_rows = rowio.auto_rows(cid_path)
-        new_cid.read(cid_path, cid_rows)
+        if self.is_cid_cached:
+            new_cid = interface.cached_cid(cid_path)
+        else:
+            new_cid = interface.Cid()
+            cid_rows = rowio.auto_rows(cid_path)
+            new_cid.read(cid_path, cid_rows)
         self.cid = new_cid
         self.cid_path = cid_path
 
@@ -155,15 +318,130 @@ class CutplaceApp(object):
         assert self.cid is not None
         assert (self.validate_until is None) or (self.validate_until >= 0)
 
-        _log.info('validate "%s"', data_path)
+        self._log.info('validate "%s"', data_path)
 
+        reader = None
         try:
-            with validio.Reader(self.cid, data_path, validate_until=self.validate_until) as reader:
+            with validio.Reader(
+                self.cid,
+                data_path,
+                validate_until=self.validate_until,
+                workers=self.jobs,
+                collect_stats=self.is_stats,
+                value_cache_size=self.value_cache_size,
+            ) as reader:
                 reader.validate_rows()
-            _log.info("  accepted %d rows", reader.accepted_rows_count)
+            self._log.info("  accepted %d rows", reader.accepted_rows_count)
         except errors.CutplaceError as error:
-            _log.error("  %s", error)
+            self._log.error("  %s", error)
             self.all_validations_were_ok = False
+        if (reader is not None) and (reader.stats is not None):
+            for stats_line in reader.stats.lines():
+                self._log.info("  %s", stats_line)
+
+    def validate_all(self, data_paths):
+        """
+        Validate data stored in files ``data_paths`` similar to
+        :py:meth:`validate`. If ``jobs`` is greater than 1, validate several
+        files in parallel processes, each validating a whole file. The log
+        still shows the results in the order of ``data_paths``.
+
+        :raises EnvironmentError: if a data file cannot be read; the files \
+          before it have been validated and logged
+        """
+        assert data_paths is not None
+        assert self.cid is not None
+
+        if (self.jobs >= 2) and (len(data_paths) >= 2):
+            # Each worker validates whole files in a single process.
+            worker_app = copy.copy(self)
+            worker_app.jobs = 1
+            with concurrent.futures.ProcessPoolExecutor(
+                min(self.jobs, len(data_paths)), None, _init_validation_worker, (worker_app,)
+            ) as executor:
+                for data_path, (log_records, all_validations_were_ok, environment_error) in zip(
+                    data_paths, executor.map(_validate_in_worker, data_paths)
+                ):
+                    for level, message, args in log_records:
+                        self._log.log(level, message, *args)
+                    if not all_validations_were_ok:
+                        self.all_validations_were_ok = False
+                    if environment_error is not None:
+                        raise EnvironmentError("cannot read data file %r: %s" % (data_path, environment_error))
+        else:
+            for data_path in data_paths:
+                try:
+                    self.validate(data_path)
+                except (EnvironmentError, OSError) as error:
+                    raise EnvironmentError("cannot read data file %r: %s" % (data_path, error))
+
+    def load_sqlite(self, data_path):
+        """
+        Validate data stored in file ``data_path`` and insert them into the
+        SQLite database ``load_sqlite_path`` as described by
+        :py:func:`cutplace.sql.load_sqlite`. The table is named after the
+        CID file. Errors of type :py:exc:`cutplace.errors.CutplaceError` are
+        logged and roll back the rows inserted since the last commit.
+
+        :raises EnvironmentError: if ``data_path`` cannot be read or the \
+          data cannot be stored in the database
+        """
+        assert data_path is not None
+        assert self.cid is not None
+        assert self.load_sqlite_path is not None
+
+        # Import only when needed to start faster.
+        import sqlite3
+
+        from cutplace import sql
+
+        table = os.path.splitext(os.path.basename(self.cid_path))[0]
+        self._log.info('load "%s" into table %s of "%s"', data_path, table, self.load_sqlite_path)
+
+        reader = None
+        try:
+            with validio.Reader(
+                self.cid, data_path, collect_stats=self.is_stats, value_cache_size=self.value_cache_size
+            ) as reader:
+                loaded_rows_count = sql.load_sqlite(
+                    reader, self.load_sqlite_path, table, self.load_batch_size, self.load_transaction_size
+                )
+            self._log.info("  loaded %d rows", loaded_rows_count)
+        except errors.CutplaceError as error:
+            self._log.error("  %s", error)
+            self.all_validations_were_ok = False
+        except sqlite3.Error as error:
+            raise EnvironmentError("cannot load data into %r: %s" % (self.load_sqlite_path, error))
+        except (EnvironmentError, OSError) as error:
+            raise EnvironmentError("cannot read data file %r: %s" % (data_path, error))
+        if (reader is not None) and (reader.stats is not None):
+            for stats_line in reader.stats.lines():
+                self._log.info("  %s", stats_line)
+
+
+def _init_validation_worker(cutplace_app):
+    global _worker_app
+    _worker_app = cutplace_app
+
+
+def _validate_in_worker(data_path):
+    """
+    Validate ``data_path`` in a parallel worker process.
+
+    :return: tuple of the log records as tuples of level, message and \
+      arguments, whether the data were valid, and the text of the \
+      :py:exc:`EnvironmentError` in case the data could not be read or \
+      ``None``
+    """
+    log_recorder = _LogRecorder()
+    _worker_app._log = log_recorder
+    _worker_app.all_validations_were_ok = True
+    environment_error = None
+    try:
+        _worker_app.validate(data_path)
+    except (EnvironmentError, OSError) as error:
+        environment_error = str(error)
+    return log_recorder.records, _worker_app.all_validations_were_ok, environment_error
 
 
 def process(argv=None):
@@ -185,18 +463,28 @@ def process(argv=None):
     result = 0
     cutplace_app = CutplaceApp()
     cutplace_app.set_options(argv)
+    # Import modules only used by certain options when needed to start faster.
     if cutplace_app.is_gui:
+        from cutplace import gui
+
         data_path = cutplace_app.data_paths[0] if len(cutplace_app.data_paths) >= 1 else None
         gui.open_gui(cutplace_app.cid_path, data_path)
+    elif cutplace_app.is_serve:
+        from cutplace import server
+
+        server.serve(port=cutplace_app.port)
     elif cutplace_app.is_create_sql:
+        from cutplace import sql
+
         cid_reader = interface.Cid()
         sql.write_create(cutplace_app.cid_path, cid_reader)
-    elif cutplace_app.data_paths:
+    elif cutplace_app.load_sqlite_path is not None:
         for data_path in cutplace_app.data_paths:
-            try:
-                cutplace_app.validate(data_path)
-            except (EnvironmentError, OSError) as error:
-                raise EnvironmentError("cannot read data file %r: %s" % (data_path, error))
+            cutplace_app.load_sqlite(data_path)
+        if not cutplace_app.all_validations_were_ok:
+            result = 1
+    elif cutplace_app.data_paths:
+        cutplace_app.validate_all(cutplace_app.data_paths)
         if not cutplace_app.all_validations_were_ok:
             result = 1
     return result
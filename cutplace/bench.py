@@ -0,0 +1,524 @@
+"""
+Benchmarks to measure the performance of reading, validating and writing
+data using synthetic data sets. For the same number of rows and seed, the
+data sets are always the same, so results of different runs can be
+compared. Results are stored as JSON and can be checked against the
+results of a previous run used as baseline.
+"""
+
+# Copyright (C) 2009-2021 Thomas Aglassinger
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License
+# for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import argparse
+import io
+import itertools
+import json
+import logging
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import zipfile
+from concurrent import futures
+from xml.sax import saxutils
+
+try:
+    import resource
+
+    has_resource = True
+except ImportError:
+    has_resource = False
+
+from cutplace import _tools, data, interface, rowio, validio
+
+DEFAULT_ROW_COUNT = 10000
+DEFAULT_SEED = 1
+#: Percentage by which rows per second can drop compared to the baseline before being considered a regression.
+DEFAULT_TOLERANCE = 10
+DEFAULT_FOLDER = os.path.join("build", "bench")
+
+#: Data formats for which data sets can be generated.
+DATA_FORMATS = (data.FORMAT_DELIMITED, data.FORMAT_EXCEL, data.FORMAT_FIXED, data.FORMAT_ODS)
+
+_DATA_FORMAT_TO_SUFFIX_MAP = {
+    data.FORMAT_DELIMITED: ".csv",
+    data.FORMAT_EXCEL: ".xlsx",
+    data.FORMAT_FIXED: ".prn",
+    data.FORMAT_ODS: ".ods",
+}
+
+# Number of times to read the CID in order to get a measurable duration.
+_CID_READ_COUNT = 100
+
+# Number of times to start a new Python process importing cutplace to measure the startup time.
+_STARTUP_COUNT = 5
+
+# Maximum number of different rows to keep in memory for benchmarks of writers and field formats.
+_MAX_ROWS_IN_MEMORY = 10000
+
+_LOWER_LETTERS = "abcdefghijklmnopqrstuvwxyz"
+_UPPER_LETTERS = _LOWER_LETTERS.upper()
+
+_log = logging.getLogger("cutplace.bench")
+
+
+def _random_text(randomizer, characters, length):
+    return "".join(randomizer.choice(characters) for _ in range(length))
+
+
+# Fields of the data sets: name, length, field format, rule and a function to compute a random value of the
+# field from a randomizer and the row index. All values have exactly the length of the field, so the same
+# values can be used for fixed data.
+_FIELDS = (
+    ("id", 10, "Integer", "", lambda randomizer, row_index: "%d" % (1000000000 + row_index)),
+    ("amount", 9, "Decimal", "", lambda randomizer, row_index: "%09.2f" % (randomizer.randint(0, 99999999) / 100)),
+    ("grade", 2, "Choice", "AA, BB, CC, DD", lambda randomizer, row_index: randomizer.choice(["AA", "BB", "CC", "DD"])),
+    (
+        "date_of_birth",
+        10,
+        "DateTime",
+        "YYYY-MM-DD",
+        lambda randomizer, row_index: "%04d-%02d-%02d"
+        % (randomizer.randint(1930, 2020), randomizer.randint(1, 12), randomizer.randint(1, 28)),
+    ),
+    (
+        "code",
+        6,
+        "Pattern",
+        "??-*",
+        lambda randomizer, row_index: _random_text(randomizer, _UPPER_LETTERS, 2)
+        + "-%03d" % randomizer.randint(0, 999),
+    ),
+    ("word", 8, "RegEx", "[a-z]+", lambda randomizer, row_index: _random_text(randomizer, _LOWER_LETTERS, 8)),
+    ("comment", 20, "Text", "", lambda randomizer, row_index: _random_text(randomizer, _LOWER_LETTERS + " ", 20)),
+)
+
+#: Names of the fields in the data sets, one for each field format.
+FIELD_NAMES = tuple(field_name for field_name, _, _, _, _ in _FIELDS)
+
+
+def dataset_rows(row_count, seed=DEFAULT_SEED):
+    """
+    Rows of a data set with ``row_count`` rows, which are the same for the
+    same ``seed``.
+    """
+    assert row_count >= 0
+
+    randomizer = random.Random(seed)
+    for row_index in range(row_count):
+        yield [create_value(randomizer, row_index) for _, _, _, _, create_value in _FIELDS]
+
+
+def cid_rows(data_format_name):
+    """
+    Rows of a CID describing the data sets for ``data_format_name``.
+    """
+    assert data_format_name in DATA_FORMATS, "data_format_name=%r" % data_format_name
+
+    result = [["d", "format", data_format_name]]
+    if data_format_name in (data.FORMAT_DELIMITED, data.FORMAT_FIXED):
+        result.append(["d", "encoding", "utf-8"])
+    if data_format_name == data.FORMAT_FIXED:
+        result.append(["d", "line delimiter", "lf"])
+    for field_name, field_length, field_format_name, rule, _ in _FIELDS:
+        if (field_format_name == "Decimal") and (data_format_name in (data.FORMAT_EXCEL, data.FORMAT_ODS)):
+            # Spreadsheets have no decimal separator, which decimal fields require.
+            field_format_name = "Text"
+        result.append(["f", field_name, "", "", str(field_length), field_format_name, rule])
+    return result
+
+
+def _write_ods(ods_path, rows):
+    """
+    Write ``rows`` to the first sheet of the ODS document at ``ods_path``.
+    """
+    table_namespace = rowio._OOO_NAMESPACES["table"]
+    with zipfile.ZipFile(ods_path, "w", zipfile.ZIP_DEFLATED) as ods_archive:
+        ods_archive.writestr("mimetype", "application/vnd.oasis.opendocument.spreadsheet")
+        with ods_archive.open("content.xml", "w") as content_stream:
+            with io.TextIOWrapper(content_stream, encoding="utf-8") as content_file:
+                content_file.write(
+                    '<?xml version="1.0" encoding="UTF-8"?>\n'
+                    '<office:document-content xmlns:office="%s" xmlns:table="%s" xmlns:text="%s">'
+                    '<office:body><office:spreadsheet><table:table table:name="data">'
+                    % (rowio._OOO_NAMESPACES["office"], table_namespace, rowio._OOO_NAMESPACES["text"])
+                )
+                for row in rows:
+                    content_file.write("<table:table-row>")
+                    for value in row:
+                        content_file.write(
+                            "<table:table-cell><text:p>%s</text:p></table:table-cell>" % saxutils.escape(value)
+                        )
+                    content_file.write("</table:table-row>")
+                content_file.write("</table:table></office:spreadsheet></office:body></office:document-content>")
+
+
+def write_cid(folder, data_format_name):
+    """
+    Write a CID describing the data sets for ``data_format_name`` to
+    ``folder``.
+
+    :return: the path to the CID
+    """
+    assert folder is not None
+    assert data_format_name in DATA_FORMATS, "data_format_name=%r" % data_format_name
+
+    _tools.mkdirs(folder)
+    result = os.path.join(folder, "bench_%s_cid.csv" % data_format_name)
+    cid_data_format = data.DataFormat(data.FORMAT_DELIMITED)
+    cid_data_format.validate()
+    with rowio.DelimitedRowWriter(result, cid_data_format) as cid_writer:
+        cid_writer.write_rows(cid_rows(data_format_name))
+    return result
+
+
+def write_dataset(folder, data_format_name, row_count, seed=DEFAULT_SEED):
+    """
+    Write a CID and a data set with ``row_count`` rows in
+    ``data_format_name`` to ``folder`` unless they already exist there.
+
+    :return: tuple with the path to the CID and the path to the data
+    """
+    assert folder is not None
+    assert data_format_name in DATA_FORMATS, "data_format_name=%r" % data_format_name
+    assert row_count >= 0
+
+    cid_path = write_cid(folder, data_format_name)
+    base_path = os.path.join(folder, "bench_%s" % data_format_name)
+    data_path = "%s_%d_%d%s" % (base_path, row_count, seed, _DATA_FORMAT_TO_SUFFIX_MAP[data_format_name])
+    if not os.path.exists(data_path):
+        _log.info('write %d rows to "%s"', row_count, data_path)
+        # Write to a temporary file first so a data set that was only partially written is never reused.
+        temp_data_path = base_path + "_temp" + _DATA_FORMAT_TO_SUFFIX_MAP[data_format_name]
+        rows = dataset_rows(row_count, seed)
+        if data_format_name == data.FORMAT_ODS:
+            _write_ods(temp_data_path, rows)
+        elif data_format_name == data.FORMAT_EXCEL:
+            with rowio.XlsxRowWriter(temp_data_path) as excel_writer:
+                for row in rows:
+                    excel_writer.write_row(row)
+        else:
+            cid = interface.Cid(cid_path)
+            with validio.Writer(cid, temp_data_path) as writer:
+                writer.write_rows(rows)
+        os.replace(temp_data_path, data_path)
+    return cid_path, data_path
+
+
+def _peak_rss_kb():
+    """
+    The peak resident set size of the current process in kilobytes or
+    ``None`` if it cannot be determined.
+    """
+    result = None
+    if has_resource:
+        result = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == "darwin":
+            # Mac OS reports bytes instead of kilobytes.
+            result //= 1024
+    return result
+
+
+def _measured(name, rows):
+    """
+    Measurement of consuming all ``rows``.
+    """
+    start_time = time.perf_counter()
+    time_to_first_row = None
+    row_count = 0
+    for _ in rows:
+        if time_to_first_row is None:
+            time_to_first_row = time.perf_counter() - start_time
+        row_count += 1
+    seconds = time.perf_counter() - start_time
+    return {
+        "name": name,
+        "rows": row_count,
+        "seconds": seconds,
+        "rows_per_second": row_count / seconds if seconds > 0 else None,
+        "time_to_first_row": time_to_first_row,
+        "peak_rss_kb": _peak_rss_kb(),
+    }
+
+
+def _raw_rows(cid, data_path):
+    data_format = cid.data_format
+    if data_format.format == data.FORMAT_DELIMITED:
+        result = rowio.delimited_rows(data_path, data_format)
+    elif data_format.format == data.FORMAT_EXCEL:
+        result = rowio.excel_rows(data_path, data_format.sheet)
+    elif data_format.format == data.FORMAT_FIXED:
+        result = rowio.fixed_rows(
+            data_path, data_format.encoding, interface.field_names_and_lengths(cid), data_format.line_delimiter
+        )
+    else:
+        assert data_format.format == data.FORMAT_ODS, "format=%r" % data_format.format
+        result = rowio.ods_rows(data_path, data_format.sheet)
+    return result
+
+
+def _bench_rowio(cid_path, data_path):
+    cid = interface.Cid(cid_path)
+    return _measured("rowio-%s" % cid.data_format.format, _raw_rows(cid, data_path))
+
+
+def _bench_reader(cid_path, data_path):
+    cid = interface.Cid(cid_path)
+    with validio.Reader(cid, data_path) as reader:
+        result = _measured("reader-%s" % cid.data_format.format, reader.rows())
+    return result
+
+
+def _written_rows(writer, rows):
+    for row in rows:
+        writer.write_row(row)
+        yield row
+
+
+def _bench_writer(cid_path, target_path, row_count, seed):
+    cid = interface.Cid(cid_path)
+    rows_in_memory = list(dataset_rows(min(row_count, _MAX_ROWS_IN_MEMORY), seed))
+    rows_to_write = itertools.islice(itertools.cycle(rows_in_memory), row_count) if rows_in_memory else []
+    with validio.Writer(cid, target_path) as writer:
+        result = _measured("writer-%s" % cid.data_format.format, _written_rows(writer, rows_to_write))
+    return result
+
+
+def _read_cids(cid_path):
+    for _ in range(_CID_READ_COUNT):
+        yield interface.Cid(cid_path)
+
+
+def _bench_cid(cid_path):
+    return _measured("cid", _read_cids(cid_path))
+
+
+def _started_processes():
+    for _ in range(_STARTUP_COUNT):
+        subprocess.run([sys.executable, "-c", "import cutplace.applications"], check=True)
+        yield None
+
+
+def _bench_startup():
+    result = _measured("startup", _started_processes())
+    # The memory was used by the started processes.
+    result["peak_rss_kb"] = None
+    return result
+
+
+def _validated_field_values(field_format, values):
+    for value in values:
+        yield field_format.validated(value)
+
+
+def _bench_field(cid_path, field_name, row_count, seed):
+    cid = interface.Cid(cid_path)
+    field_index = cid.field_index(field_name)
+    field_format = cid.field_formats[field_index]
+    values = [row[field_index] for row in dataset_rows(min(row_count, _MAX_ROWS_IN_MEMORY), seed)]
+    values_to_validate = itertools.islice(itertools.cycle(values), row_count) if values else []
+    result = _measured("field-%s" % field_name, _validated_field_values(field_format, values_to_validate))
+    result["field_format"] = field_format.__class__.__name__
+    return result
+
+
+def _result_in_separate_process(function, *arguments):
+    """
+    The result of calling ``function`` with ``arguments`` in a new process
+    so that its peak memory usage is not influenced by previous benchmarks.
+    """
+    with futures.ProcessPoolExecutor(1) as executor:
+        return executor.submit(function, *arguments).result()
+
+
+def run_benchmarks(
+    folder=DEFAULT_FOLDER, row_count=DEFAULT_ROW_COUNT, data_format_names=DATA_FORMATS, seed=DEFAULT_SEED
+):
+    """
+    Run all benchmarks for data sets with ``row_count`` rows in each of
+    ``data_format_names`` stored in ``folder``.
+
+    :return: the results as :py:class:`dict` that can be stored as JSON
+    """
+    assert folder is not None
+    assert row_count >= 0
+    for data_format_name in data_format_names:
+        assert data_format_name in DATA_FORMATS, "data_format_name=%r" % data_format_name
+
+    # Import here to prevent a circular import.
+    from cutplace import __version__
+
+    results = []
+    for data_format_name in data_format_names:
+        cid_path, data_path = write_dataset(folder, data_format_name, row_count, seed)
+        _log.info("benchmark %s", data_format_name)
+        results.append(_result_in_separate_process(_bench_rowio, cid_path, data_path))
+        results.append(_result_in_separate_process(_bench_reader, cid_path, data_path))
+        if data_format_name in (data.FORMAT_DELIMITED, data.FORMAT_FIXED):
+            target_path = os.path.join(folder, "bench_written" + _DATA_FORMAT_TO_SUFFIX_MAP[data_format_name])
+            results.append(_result_in_separate_process(_bench_writer, cid_path, target_path, row_count, seed))
+    delimited_cid_path = write_cid(folder, data.FORMAT_DELIMITED)
+    results.append(_result_in_separate_process(_bench_cid, delimited_cid_path))
+    results.append(_bench_startup())
+    for field_name in FIELD_NAMES:
+        results.append(_result_in_separate_process(_bench_field, delimited_cid_path, field_name, row_count, seed))
+    return {
+        "cutplace": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "row_count": row_count,
+        "seed": seed,
+        "results": results,
+    }
+
+
+def regressions(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """
+    Benchmarks in ``results`` that process fewer rows per second than the
+    same benchmark in ``baseline`` by more than ``tolerance`` percent.
+    Benchmarks missing in ``baseline`` are ignored.
+
+    :param dict results: results as returned by :py:func:`run_benchmarks`
+    :param dict baseline: results of a previous run to compare with
+    :return: list of tuples ``(name, baseline_rows_per_second, rows_per_second)``
+    """
+    assert results is not None
+    assert baseline is not None
+    assert tolerance >= 0
+
+    name_to_baseline_rows_per_second_map = {
+        result["name"]: result["rows_per_second"] for result in baseline["results"] if result["rows_per_second"]
+    }
+    result = []
+    for benchmark_result in results["results"]:
+        name = benchmark_result["name"]
+        baseline_rows_per_second = name_to_baseline_rows_per_second_map.get(name)
+        rows_per_second = benchmark_result["rows_per_second"]
+        if (baseline_rows_per_second is not None) and (rows_per_second is not None):
+            if rows_per_second < baseline_rows_per_second * (100 - tolerance) / 100:
+                result.append((name, baseline_rows_per_second, rows_per_second))
+    return result
+
+
+def main(argv=None):
+    """
+    Main routine that logs errors and won't ``sys.exit()`` unless ``argv`` is broken.
+
+    The result can be:
+
+    * 0 - all benchmarks are within the tolerance of the baseline
+    * 1 - at least one benchmark is slower than the baseline
+    * 3 - a proper environment for the program to run must be provided
+    """
+    if argv is None:  # pragma: no cover
+        argv = sys.argv
+    assert argv
+
+    parser = argparse.ArgumentParser(description="benchmark reading, validating and writing synthetic data")
+    parser.add_argument(
+        "--baseline",
+        metavar="FILE",
+        help="JSON file with results of a previous run to compare with",
+    )
+    parser.add_argument(
+        "--folder",
+        metavar="FOLDER",
+        default=DEFAULT_FOLDER,
+        help="folder to store the generated data sets in (default: %s)" % DEFAULT_FOLDER,
+    )
+    parser.add_argument(
+        "--format",
+        "-f",
+        metavar="FORMAT",
+        action="append",
+        choices=DATA_FORMATS,
+        dest="data_format_names",
+        help="data format to benchmark; can be specified multiple times: %s (default: all)"
+        % _tools.human_readable_list(DATA_FORMATS, "and"),
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        metavar="FILE",
+        help="JSON file to store the results in (default: write to standard output)",
+    )
+    parser.add_argument(
+        "--rows",
+        "-r",
+        metavar="COUNT",
+        default=DEFAULT_ROW_COUNT,
+        type=int,
+        help="number of rows in each data set (default: %d)" % DEFAULT_ROW_COUNT,
+    )
+    parser.add_argument(
+        "--seed",
+        metavar="NUMBER",
+        default=DEFAULT_SEED,
+        type=int,
+        help="seed for the random values in the data sets (default: %d)" % DEFAULT_SEED,
+    )
+    parser.add_argument(
+        "--tolerance",
+        metavar="PERCENT",
+        default=DEFAULT_TOLERANCE,
+        type=float,
+        help="percentage by which rows per second can drop compared to the baseline (default: %d)" % DEFAULT_TOLERANCE,
+    )
+    args = parser.parse_args(argv[1:])
+    if args.rows < 0:
+        parser.error("option --rows is %d but must be at least 0" % args.rows)
+    if args.tolerance < 0:
+        parser.error("option --tolerance is %s but must be at least 0" % args.tolerance)
+    data_format_names = args.data_format_names if args.data_format_names else DATA_FORMATS
+
+    result = 0
+    try:
+        baseline = None
+        if args.baseline is not None:
+            with io.open(args.baseline, encoding="utf-8") as baseline_file:
+                baseline = json.load(baseline_file)
+        results = run_benchmarks(args.folder, args.rows, data_format_names, args.seed)
+        results_text = json.dumps(results, indent=2)
+        if args.output is None:
+            print(results_text)
+        else:
+            with io.open(args.output, "w", encoding="utf-8") as output_file:
+                output_file.write(results_text + "\n")
+        if baseline is not None:
+            for name, baseline_rows_per_second, rows_per_second in regressions(results, baseline, args.tolerance):
+                _log.error(
+                    "%s processes %.1f rows per second but baseline processes %.1f",
+                    name,
+                    rows_per_second,
+                    baseline_rows_per_second,
+                )
+                result = 1
+    except (EnvironmentError, OSError) as error:
+        result = 3
+        _log.error("%s", error)
+    return result
+
+
+def main_for_script():  # pragma: no cover
+    """
+    Main routine that reports errors in options to `sys.stderr` and does `sys.exit()`.
+    """
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
+
+
+if __name__ == "__main__":
+    main_for_script()
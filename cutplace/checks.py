@@ -16,12 +16,211 @@ Standard checks that can cover a whole row or data set.
 #
 # You should have received a copy of the GNU Lesser General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import array
+import ast
 import copy
+import hashlib
+import math
+import os
+import tempfile
 import tokenize
+import weakref
 
 from cutplace import _tools, errors, fields
 from cutplace._tools import generated_tokens
 
+#: Default for :py:attr:`IsUniqueCheck.max_keys_in_memory`.
+DEFAULT_MAX_UNIQUE_KEYS_IN_MEMORY = 3000000
+
+# Number of bytes of the digest IsUniqueCheck stores for each key.
+_UNIQUE_KEY_DIGEST_SIZE = 16
+
+_UINT64_MASK = 2**64 - 1
+
+# Number of slots a `_DigestToLineTable` starts with, which must be a power of 2.
+_MIN_DIGEST_TABLE_CAPACITY = 1024
+
+# Bits per spilled key in the filter IsUniqueCheck uses to skip looking up
+# keys that cannot be in the database on disk, and the number of bits each
+# key sets, which yields about 0.25% false positives.
+_SPILL_FILTER_BITS_PER_KEY = 16
+_SPILL_FILTER_PROBE_COUNT = 4
+
+#: Default for :py:attr:`DistinctCountCheck.approximate_error` if the rule
+#: starts with ``approximate:``.
+DEFAULT_APPROXIMATE_DISTINCT_COUNT_ERROR = 0.01
+
+# Maximum precision of `_HyperLogLog`, which needs 256 KB.
+_MAX_HYPER_LOG_LOG_PRECISION = 18
+
+#: Smallest :py:attr:`DistinctCountCheck.approximate_error` supported,
+#: which is about 0.2%.
+MIN_APPROXIMATE_DISTINCT_COUNT_ERROR = 1.04 / math.sqrt(2**_MAX_HYPER_LOG_LOG_PRECISION)
+
+_APPROXIMATE_NAME = "approximate"
+
+# Comparison operators for which `count <operator> <number>` cannot change
+# its result once the count reached a certain value, mapped to a function
+# computing the count at which the result settles and the settled result.
+_COMPARISON_TO_SETTLED_COUNT_AND_RESULT_MAP = {
+    ast.Lt: lambda limit: (limit, False),
+    ast.LtE: lambda limit: (limit + 1, False),
+    ast.Eq: lambda limit: (limit + 1, False),
+    ast.Gt: lambda limit: (limit + 1, True),
+    ast.GtE: lambda limit: (limit, True),
+    ast.NotEq: lambda limit: (limit + 1, True),
+}
+
+
+class _HyperLogLog(object):
+    """
+    Estimate of the number of distinct values using a HyperLogLog sketch,
+    which needs only ``2 ** precision`` bytes no matter how many values are
+    added. The standard error is about ``1.04 / sqrt(2 ** precision)``.
+    """
+
+    def __init__(self, precision):
+        assert 4 <= precision <= _MAX_HYPER_LOG_LOG_PRECISION
+
+        self._precision = precision
+        self._register_count = 1 << precision
+        self._value_bit_count = 64 - precision
+        self._value_mask = (1 << self._value_bit_count) - 1
+        self._registers = bytearray(self._register_count)
+
+    @staticmethod
+    def precision_for_error(error):
+        """
+        The smallest precision with a standard error of at most ``error``.
+        """
+        assert MIN_APPROXIMATE_DISTINCT_COUNT_ERROR <= error < 1, "error=%r" % error
+
+        # Limit the precision in case of rounding errors for the smallest error.
+        return min(max(math.ceil(2 * math.log2(1.04 / error)), 4), _MAX_HYPER_LOG_LOG_PRECISION)
+
+    def add(self, value):
+        digest = int.from_bytes(
+            hashlib.blake2b(repr(value).encode("utf-8", "surrogatepass"), digest_size=8).digest(), "big"
+        )
+        register_index = digest >> self._value_bit_count
+        rank = self._value_bit_count - (digest & self._value_mask).bit_length() + 1
+        if rank > self._registers[register_index]:
+            self._registers[register_index] = rank
+
+    def merge(self, other):
+        assert self._precision == other._precision
+
+        self._registers = bytearray(map(max, self._registers, other._registers))
+
+    def estimate(self):
+        register_count = self._register_count
+        alpha = 0.7213 / (1 + 1.079 / register_count)
+        result = alpha * register_count * register_count / math.fsum(2.0**-rank for rank in self._registers)
+        if result <= 2.5 * register_count:
+            # Use linear counting for small cardinalities.
+            zero_register_count = self._registers.count(0)
+            if zero_register_count > 0:
+                result = register_count * math.log(register_count / zero_register_count)
+        return int(round(result))
+
+
+def _key_digest(row_key):
+    """
+    A compact but practically unique ``int`` for ``row_key`` that is the
+    same in all processes, unlike :py:func:`hash`.
+    """
+    return int.from_bytes(
+        hashlib.blake2b(repr(row_key).encode("utf-8", "surrogatepass"), digest_size=_UNIQUE_KEY_DIGEST_SIZE).digest(),
+        "big",
+    )
+
+
+class _DigestToLineTable:
+    """
+    Open addressing hash table mapping the ``int`` digests of
+    :py:func:`_key_digest` to lines. The digests and lines are packed in
+    arrays of unsigned 64 bit integers, so each slot needs 24 bytes. The
+    table is at most 3/4 full, so each key needs between 32 and 64 bytes
+    instead of over 100 bytes in a ``dict``.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self._set_capacity(_MIN_DIGEST_TABLE_CAPACITY)
+
+    def _set_capacity(self, capacity):
+        assert capacity & (capacity - 1) == 0, "capacity=%d" % capacity
+
+        empty_slots = bytes(8 * capacity)
+        self._slot_mask = capacity - 1
+        self._digest_highs = array.array("Q", empty_slots)
+        self._digest_lows = array.array("Q", empty_slots)
+        # Line plus 1 for each slot so that 0 marks an empty slot.
+        self._lines_plus_1 = array.array("Q", empty_slots)
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def _slot(self, digest_high, digest_low):
+        """
+        Index of the slot containing the digest or of the empty slot where
+        to put it.
+        """
+        slot_mask = self._slot_mask
+        digest_highs = self._digest_highs
+        digest_lows = self._digest_lows
+        lines_plus_1 = self._lines_plus_1
+        # Digests are evenly distributed, so their lowest bits are a good hash.
+        result = digest_low & slot_mask
+        while lines_plus_1[result] != 0 and (digest_lows[result] != digest_low or digest_highs[result] != digest_high):
+            result = (result + 1) & slot_mask
+        return result
+
+    def get(self, digest):
+        """
+        The line stored for ``digest`` or ``None``.
+        """
+        line_plus_1 = self._lines_plus_1[self._slot(digest >> 64, digest & _UINT64_MASK)]
+        return line_plus_1 - 1 if line_plus_1 != 0 else None
+
+    def add(self, digest, line):
+        """
+        Store ``line`` for ``digest``, which must not be in the table yet.
+        """
+        self._put(digest >> 64, digest & _UINT64_MASK, line + 1)
+        if 4 * self._count > 3 * (self._slot_mask + 1):
+            old_slots = zip(self._digest_highs, self._digest_lows, self._lines_plus_1)
+            self._set_capacity(2 * (self._slot_mask + 1))
+            for digest_high, digest_low, line_plus_1 in old_slots:
+                if line_plus_1 != 0:
+                    self._put(digest_high, digest_low, line_plus_1)
+
+    def _put(self, digest_high, digest_low, line_plus_1):
+        slot = self._slot(digest_high, digest_low)
+        assert self._lines_plus_1[slot] == 0, "digest_high=%d, digest_low=%d" % (digest_high, digest_low)
+        self._digest_highs[slot] = digest_high
+        self._digest_lows[slot] = digest_low
+        self._lines_plus_1[slot] = line_plus_1
+        self._count += 1
+
+    def items(self):
+        """
+        Pairs of digest and line in no particular order.
+        """
+        for digest_high, digest_low, line_plus_1 in zip(self._digest_highs, self._digest_lows, self._lines_plus_1):
+            if line_plus_1 != 0:
+                yield (digest_high << 64) | digest_low, line_plus_1 - 1
+
+
+def _remove_spill_file(spill_path):
+    try:
+        os.remove(spill_path)
+    except FileNotFoundError:
+        pass
+
 
 class AbstractCheck(object):
     """
@@ -75,7 +274,9 @@ class AbstractCheck(object):
         Check row and in case it is invalid raise :py:exc:`errors.CheckError`. By default do
         nothing.
 
-        :param str field_name_to_value_map: map of all field names to their respective value for the current row
+        :param field_name_to_value_map: read only map of all field names to their respective value for the \
+            current row; it is reused for the next row, so use ``dict(field_name_to_value_map)`` to keep the values
+        :type field_name_to_value_map: :py:class:`cutplace.validio.RowView`
         :param cutplace.errors.Location location: location where the row started in the input.
         :raises cutplace.errors.CheckError: if the ``row`` does not conform
         """
@@ -96,6 +297,28 @@ class AbstractCheck(object):
         """
         pass
 
+    def merge(self, other_check, line_offset):
+        """
+        Merge the state of ``other_check``, which checked the rows following
+        the rows checked by this check, so that this check ends up in the
+        same state as if it had checked all rows itself. This is used to
+        combine the results of workers validating chunks of the data in
+        parallel.
+
+        Checks that do not implement this cannot be used for parallel
+        validation. The default implementation raises
+        :py:exc:`NotImplementedError`.
+
+        :param AbstractCheck other_check: a check of the same type and rule \
+          that processed the rows of another chunk
+        :param int line_offset: the number of rows before the rows checked by \
+          ``other_check``, which has to be added to all of its locations
+        :raises cutplace.errors.CheckError: for the first row checked by \
+          ``other_check`` that violates the check when combined with the rows \
+          checked by this check
+        """
+        raise NotImplementedError()
+
     def __str__(self):
         return "%s(%r, %r)" % (self.__class__.__name__, self.description, self.rule)
 
@@ -149,6 +372,16 @@ class AbstractCheck(object):
         """
         return self._field_names
 
+    @property
+    def is_settled(self):
+        """
+        ``True`` if the result of the check cannot change anymore no matter
+        which rows follow. Validators then stop calling :py:meth:`check_row`
+        until the next :py:meth:`reset`, though :py:meth:`check_at_end` is
+        still called. By default, ``False``.
+        """
+        return False
+
 
 class IsUniqueCheck(AbstractCheck):
     """
@@ -159,7 +392,10 @@ class IsUniqueCheck(AbstractCheck):
         super().__init__(description, rule, available_field_names, location)
 
         self._field_names_to_check = []
-        self._row_key_to_location_map = None
+        self._max_keys_in_memory = DEFAULT_MAX_UNIQUE_KEYS_IN_MEMORY
+        self._spill_connection = None
+        self._spill_path = None
+        self._spill_finalizer = None
         self.reset()
 
         # Extract field names to check from rule.
@@ -199,26 +435,235 @@ class IsUniqueCheck(AbstractCheck):
                 "rule must contain at least one field name to check for uniqueness", self.location_of_rule
             )
 
+    def __getstate__(self):
+        # Leave out the connection to the spilled keys because it cannot be pickled.
+        result = self.__dict__.copy()
+        result["_spill_connection"] = None
+        result["_spill_finalizer"] = None
+        if self._spill_path is not None:
+            # Hand the spilled keys over to the unpickled check, which then
+            # removes them. Otherwise a parallel worker could remove them when
+            # validating its next chunk before they have been merged.
+            self._connected_spill().commit()
+            self._spill_connection.close()
+            self._spill_connection = None
+            self._spill_finalizer.detach()
+            self._spill_finalizer = None
+            self._spill_path = None
+        return result
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self._spill_path is not None:
+            self._spill_finalizer = weakref.finalize(self, _remove_spill_file, self._spill_path)
+
     def reset(self):
-        self._row_key_to_location_map = {}
+        self.cleanup()
+        self._digest_to_line_table = _DigestToLineTable()
+        self._spilled_key_count = 0
+        self._spill_filter = bytearray()
+        self._spill_filter_bit_count = 0
+        # Location to derive the locations of duplicates found by `merge()` from.
+        self._first_location = None
 
-    def check_row(self, field_name_to_value_map, location):
-        row_key = tuple(field_name_to_value_map[field_name] for field_name in self._field_names_to_check)
-        see_also_location = self._row_key_to_location_map.get(row_key)
-        if see_also_location is not None:
-            raise errors.CheckError(
-                "values for %r must be unique: %s" % (self._field_names_to_check, row_key),
-                location,
-                see_also_message="location of first occurrence",
-                see_also_location=see_also_location,
+    @property
+    def max_keys_in_memory(self):
+        """
+        Maximum number of key digests to keep in memory. When more keys are
+        found, the digests are moved to a temporary SQLite database on
+        disk. Each digest and its line need between 32 and 64 bytes of
+        memory, so the default needs at most about 100 MB.
+        """
+        return self._max_keys_in_memory
+
+    @max_keys_in_memory.setter
+    def max_keys_in_memory(self, new_max_keys_in_memory):
+        assert new_max_keys_in_memory >= 1
+
+        self._max_keys_in_memory = new_max_keys_in_memory
+
+    def _connected_spill(self):
+        """
+        Connection to the SQLite database with the spilled keys, which is
+        created if there is none yet.
+        """
+        if self._spill_connection is None:
+            # Import only when needed because most checks never spill.
+            import sqlite3
+
+            if self._spill_path is None:
+                spill_fd, self._spill_path = tempfile.mkstemp(".sqlite", "cutplace_unique_")
+                os.close(spill_fd)
+                # Remove the spilled keys even if the check is not cleaned up,
+                # for example because validation stopped with an exception.
+                self._spill_finalizer = weakref.finalize(self, _remove_spill_file, self._spill_path)
+            self._spill_connection = sqlite3.connect(self._spill_path)
+            self._spill_connection.execute("pragma journal_mode = off")
+            self._spill_connection.execute("pragma synchronous = off")
+            self._spill_connection.execute(
+                "create table if not exists digest_to_line (digest blob primary key, line integer not null) "
+                "without rowid"
             )
-        else:
-            self._row_key_to_location_map[row_key] = copy.copy(location)
+        return self._spill_connection
+
+    def _spill_filter_bit_indexes(self, digest):
+        for probe_index in range(_SPILL_FILTER_PROBE_COUNT):
+            yield (digest >> (32 * probe_index)) % self._spill_filter_bit_count
+
+    def _add_to_spill_filter(self, digests):
+        spill_filter = self._spill_filter
+        for digest in digests:
+            for bit_index in self._spill_filter_bit_indexes(digest):
+                spill_filter[bit_index >> 3] |= 1 << (bit_index & 7)
+
+    def _might_be_spilled(self, digest):
+        """
+        ``False`` if ``digest`` is certainly not in the database on disk, so
+        only few keys have to be looked up there.
+        """
+        spill_filter = self._spill_filter
+        return all(
+            spill_filter[bit_index >> 3] & (1 << (bit_index & 7))
+            for bit_index in self._spill_filter_bit_indexes(digest)
+        )
+
+    def _spill(self):
+        """
+        Move the key digests in memory to the database on disk.
+        """
+        spilled_key_count = self._spilled_key_count + len(self._digest_to_line_table)
+        if spilled_key_count * _SPILL_FILTER_BITS_PER_KEY > self._spill_filter_bit_count:
+            # Double the size of the filter and add the keys already on disk again.
+            self._spill_filter_bit_count = 2 * spilled_key_count * _SPILL_FILTER_BITS_PER_KEY
+            self._spill_filter = bytearray((self._spill_filter_bit_count + 7) // 8)
+            self._add_to_spill_filter(
+                int.from_bytes(digest, "big")
+                for (digest,) in self._connected_spill().execute("select digest from digest_to_line")
+            )
+        self._add_to_spill_filter(digest for digest, _ in self._digest_to_line_table.items())
+        self._connected_spill().executemany(
+            "insert into digest_to_line values (?, ?)",
+            (
+                (digest.to_bytes(_UNIQUE_KEY_DIGEST_SIZE, "big"), line)
+                for digest, line in self._digest_to_line_table.items()
+            ),
+        )
+        self._digest_to_line_table.clear()
+        self._spilled_key_count = spilled_key_count
+
+    def _first_line(self, digest):
+        """
+        The line where the key with ``digest`` occurred first or ``None``
+        if it did not occur yet.
+        """
+        result = self._digest_to_line_table.get(digest)
+        if result is None and self._spill_path is not None and self._might_be_spilled(digest):
+            spilled_row = (
+                self._connected_spill()
+                .execute(
+                    "select line from digest_to_line where digest = ?",
+                    (digest.to_bytes(_UNIQUE_KEY_DIGEST_SIZE, "big"),),
+                )
+                .fetchone()
+            )
+            if spilled_row is not None:
+                result = spilled_row[0]
+        return result
+
+    def _add_digest(self, digest, line):
+        self._digest_to_line_table.add(digest, line)
+        if len(self._digest_to_line_table) >= self._max_keys_in_memory:
+            self._spill()
+
+    def _digests_and_lines(self):
+        """
+        All key digests and their lines, ordered by line.
+        """
+        digests_and_lines = list(self._digest_to_line_table.items())
+        if self._spill_path is not None:
+            digests_and_lines.extend(
+                (int.from_bytes(digest, "big"), line)
+                for digest, line in self._connected_spill().execute("select digest, line from digest_to_line")
+            )
+        digests_and_lines.sort(key=lambda digest_and_line: digest_and_line[1])
+        return digests_and_lines
+
+    def _duplicate_error(self, row_key, location, first_line):
+        see_also_location = copy.copy(location)
+        see_also_location.line = first_line
+        message = "values for %r must be unique" % self._field_names_to_check
+        if row_key is not None:
+            message += ": %s" % (row_key,)
+        return errors.CheckError(
+            message,
+            location,
+            see_also_message="location of first occurrence",
+            see_also_location=see_also_location,
+        )
+
+    def _row_key(self, field_name_to_value_map):
+        return tuple(field_name_to_value_map[field_name] for field_name in self._field_names_to_check)
+
+    def duplicate_error_with_row_key(self, error, field_name_to_value_map):
+        """
+        Same as ``error`` found by :py:meth:`merge()` but mentioning the
+        values of the key fields in ``field_name_to_value_map`` of the
+        duplicate row like :py:meth:`check_row()` does. Checks only keep
+        the digests of the keys, so the row has to be read again for this.
+        """
+        assert error.see_also_location is not None
+
+        return self._duplicate_error(
+            self._row_key(field_name_to_value_map), error.location, error.see_also_location.line
+        )
+
+    def check_row(self, field_name_to_value_map, location):
+        row_key = self._row_key(field_name_to_value_map)
+        digest = _key_digest(row_key)
+        first_line = self._first_line(digest)
+        if first_line is not None:
+            raise self._duplicate_error(row_key, location, first_line)
+        self._add_digest(digest, location.line)
+        if self._first_location is None:
+            self._first_location = copy.copy(location)
+
+    def merge(self, other_check, line_offset):
+        assert isinstance(other_check, IsUniqueCheck)
+        assert line_offset >= 0
+
+        try:
+            for digest, line in other_check._digests_and_lines():
+                line += line_offset
+                first_line = self._first_line(digest)
+                if first_line is not None:
+                    location = copy.copy(other_check._first_location)
+                    location.line = line
+                    raise self._duplicate_error(None, location, first_line)
+                self._add_digest(digest, line)
+            if self._first_location is None and other_check._first_location is not None:
+                self._first_location = copy.copy(other_check._first_location)
+                self._first_location.line += line_offset
+        finally:
+            other_check.cleanup()
+
+    def cleanup(self):
+        if self._spill_connection is not None:
+            self._spill_connection.close()
+            self._spill_connection = None
+        if self._spill_path is not None:
+            self._spill_finalizer()
+            self._spill_finalizer = None
+            self._spill_path = None
 
 
 class DistinctCountCheck(AbstractCheck):
     """
     Check to ensure that the number of different values in a field matches an expression.
+
+    The rule can start with ``approximate:`` or for example
+    ``approximate(0.02):`` to only estimate the count with a relative error
+    of about 1% or 2% using a constant amount of memory. The error must be
+    at least :py:data:`MIN_APPROXIMATE_DISTINCT_COUNT_ERROR`.
     """
 
     _COUNT_NAME = "count"
@@ -226,9 +671,45 @@ class DistinctCountCheck(AbstractCheck):
     def __init__(self, description, rule, available_field_names, location=None):
         super().__init__(description, rule, available_field_names, location)
 
+        self._approximate_error = None
         tokens = generated_tokens(rule)
         first_token = next(tokens)
 
+        # Obtain optional approximation.
+        if first_token[0] == tokenize.NAME and first_token[1] == _APPROXIMATE_NAME:
+            next_token = next(tokens)
+            approximate_error = DEFAULT_APPROXIMATE_DISTINCT_COUNT_ERROR
+            has_approximate_error = next_token[:2] == (tokenize.OP, "(")
+            if has_approximate_error:
+                error_token = next(tokens)
+                closing_token = next(tokens)
+                if error_token[0] != tokenize.NUMBER or closing_token[:2] != (tokenize.OP, ")"):
+                    raise errors.InterfaceError(
+                        "%s( must be followed by a number and ')'" % _APPROXIMATE_NAME, self.location_of_rule
+                    )
+                approximate_error = float(error_token[1])
+                if not 0 < approximate_error < 1:
+                    raise errors.InterfaceError(
+                        "error of %s must be greater than 0 and less than 1 but is: %s"
+                        % (_APPROXIMATE_NAME, error_token[1]),
+                        self.location_of_rule,
+                    )
+                if approximate_error < MIN_APPROXIMATE_DISTINCT_COUNT_ERROR:
+                    raise errors.InterfaceError(
+                        "error of %s must be at least %.5f but is: %s"
+                        % (_APPROXIMATE_NAME, MIN_APPROXIMATE_DISTINCT_COUNT_ERROR, error_token[1]),
+                        self.location_of_rule,
+                    )
+                next_token = next(tokens)
+            if next_token[:2] == (tokenize.OP, ":"):
+                self._approximate_error = approximate_error
+                first_token = next(tokens)
+            elif has_approximate_error:
+                raise errors.InterfaceError(
+                    "%s option must be followed by a colon (:)" % _APPROXIMATE_NAME, self.location_of_rule
+                )
+            # Otherwise the rule just counts a field that happens to be named like the option.
+
         # Obtain and validate field to count.
         if first_token[0] != tokenize.NAME:
             raise errors.InterfaceError(
@@ -242,20 +723,88 @@ class DistinctCountCheck(AbstractCheck):
 
         # Build and test Python expression for validation.
         self._expression = DistinctCountCheck._COUNT_NAME + rule[column_where_field_name_ends:]
-        self._distinct_value_to_count_map = None
+        self._settled_count_and_result = self._settled_count_and_result_for_expression()
+        self._distinct_values = None
+        self._sketch = None
+        self._settled_count = None
         self.reset()
         self._eval()
 
+    def _settled_count_and_result_for_expression(self):
+        """
+        For expressions like ``count < 10`` a tuple of the distinct count
+        after which the expression cannot change its result anymore and that
+        result; otherwise ``None``.
+        """
+        result = None
+        try:
+            expression = ast.parse(self._expression.strip(), mode="eval").body
+        except SyntaxError:
+            # Let `_eval()` report the error.
+            expression = None
+        if (
+            isinstance(expression, ast.Compare)
+            and isinstance(expression.left, ast.Name)
+            and expression.left.id == DistinctCountCheck._COUNT_NAME
+            and len(expression.ops) == 1
+            and isinstance(expression.comparators[0], ast.Constant)
+            and type(expression.comparators[0].value) is int
+        ):
+            settled_count_and_result = _COMPARISON_TO_SETTLED_COUNT_AND_RESULT_MAP.get(type(expression.ops[0]))
+            if settled_count_and_result is not None:
+                result = settled_count_and_result(expression.comparators[0].value)
+        return result
+
+    @property
+    def approximate_error(self):
+        """
+        The relative error the distinct count may have, or ``None`` to count
+        exactly. Setting this also resets the check.
+        """
+        return self._approximate_error
+
+    @approximate_error.setter
+    def approximate_error(self, new_approximate_error):
+        assert new_approximate_error is None or MIN_APPROXIMATE_DISTINCT_COUNT_ERROR <= new_approximate_error < 1
+
+        self._approximate_error = new_approximate_error
+        self.reset()
+
+    @property
+    def is_settled(self):
+        return self._settled_count is not None
+
     def reset(self):
-        self._distinct_value_to_count_map = {}
+        self._settled_count = None
+        if self._approximate_error is None:
+            self._distinct_values = set()
+            self._sketch = None
+        else:
+            self._distinct_values = None
+            self._sketch = _HyperLogLog(_HyperLogLog.precision_for_error(self._approximate_error))
 
     def _distinct_count(self):
-        return len(self._distinct_value_to_count_map)
+        if self._settled_count is not None:
+            result = self._settled_count
+        elif self._sketch is not None:
+            result = self._sketch.estimate()
+        else:
+            result = len(self._distinct_values)
+        return result
+
+    def _settle_if_decided(self, distinct_count):
+        if self._settled_count_and_result is not None and distinct_count >= self._settled_count_and_result[0]:
+            self._settled_count = distinct_count
+            # Release the memory for values that do not matter anymore.
+            self._distinct_values = None
+            self._sketch = None
 
     def _eval(self):
         """
         The current result of `self._expression`.
         """
+        if self._settled_count is not None:
+            return self._settled_count_and_result[1]
         local_variables = {DistinctCountCheck._COUNT_NAME: self._distinct_count()}
         try:
             result = eval(self._expression, {}, local_variables)
@@ -272,14 +821,37 @@ class DistinctCountCheck(AbstractCheck):
         return result
 
     def check_row(self, field_name_to_value_map, location):
-        value = field_name_to_value_map[self._field_name_to_count]
-        try:
-            self._distinct_value_to_count_map[value] += 1
-        except KeyError:
-            self._distinct_value_to_count_map[value] = 1
+        if self._distinct_values is not None:
+            distinct_values = self._distinct_values
+            distinct_count_before = len(distinct_values)
+            distinct_values.add(field_name_to_value_map[self._field_name_to_count])
+            if len(distinct_values) != distinct_count_before:
+                self._settle_if_decided(distinct_count_before + 1)
+        elif self._sketch is not None:
+            # NOTE: Approximate counts never settle early because computing
+            # the estimate for each row would take too long.
+            self._sketch.add(field_name_to_value_map[self._field_name_to_count])
+
+    def merge(self, other_check, line_offset):
+        assert isinstance(other_check, DistinctCountCheck)
+        assert self._approximate_error == other_check._approximate_error
+
+        if self._settled_count is not None or other_check._settled_count is not None:
+            self._settle_if_decided(max(self._distinct_count(), other_check._distinct_count()))
+        elif self._sketch is not None:
+            self._sketch.merge(other_check._sketch)
+        else:
+            self._distinct_values |= other_check._distinct_values
+            self._settle_if_decided(len(self._distinct_values))
 
     def check_at_end(self, location):
         if not self._eval():
+            if self._settled_count is not None:
+                count_text = "at least %d" % self._settled_count
+            elif self._sketch is not None:
+                count_text = "about %d" % self._distinct_count()
+            else:
+                count_text = "%d" % self._distinct_count()
             raise errors.CheckError(
-                "distinct count is %d but check requires: %r" % (self._distinct_count(), self._expression), location
+                "distinct count is %s but check requires: %r" % (count_text, self._expression), location
             )
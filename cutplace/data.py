@@ -63,6 +63,7 @@ FORMAT_FIXED = "fixed"
 FORMAT_ODS = "ods"
 
 KEY_ALLOWED_CHARACTERS = "allowed_characters"
+KEY_CACHED_FIELDS = "cached_fields"
 KEY_ENCODING = "encoding"
 KEY_ESCAPE_CHARACTER = "escape_character"
 KEY_FORMAT = "format"
@@ -118,6 +119,8 @@ class DataFormat(object):
         self._header = 0
         self._is_valid = False
         self._allowed_characters = None
+        self._cached_fields = []
+        self._cid_folder = None
         self._encoding = "cp1252"
         if self.format == FORMAT_DELIMITED:
             self._escape_character = '"'
@@ -176,6 +179,33 @@ class DataFormat(object):
 
         self._allowed_characters = new_allowed_characters
 
+    @property
+    def cached_fields(self):
+        """
+        List of names of fields that remember the results for recently
+        validated values, see
+        :py:attr:`cutplace.fields.AbstractFieldFormat.value_cache_size`.
+        """
+        return self._cached_fields
+
+    @cached_fields.setter
+    def cached_fields(self, new_cached_fields):
+        assert new_cached_fields is not None
+
+        self._cached_fields = list(new_cached_fields)
+
+    @property
+    def cid_folder(self):
+        """
+        Folder containing the CID that declares the data format, which
+        relative paths in rules refer to; ``None`` means the current folder.
+        """
+        return self._cid_folder
+
+    @cid_folder.setter
+    def cid_folder(self, new_cid_folder):
+        self._cid_folder = new_cid_folder
+
     @property
     def escape_character(self):
         return self._escape_character
@@ -340,6 +370,15 @@ class DataFormat(object):
                     % (_compat.text_repr(KEY_ALLOWED_CHARACTERS), error),
                     location,
                 )
+        elif name == KEY_CACHED_FIELDS:
+            cached_fields = [field_name.strip() for field_name in value.split(",")]
+            if "" in cached_fields:
+                raise errors.InterfaceError(
+                    "data format property %s must be a comma separated list of field names but is: %s"
+                    % (_compat.text_repr(KEY_CACHED_FIELDS), _compat.text_repr(value)),
+                    location,
+                )
+            self.cached_fields = cached_fields
         elif name == KEY_DECIMAL_SEPARATOR:
             self.decimal_separator = DataFormat._validated_choice(
                 KEY_DECIMAL_SEPARATOR, value, _VALID_DECIMAL_SEPARATORS, location
@@ -530,6 +569,8 @@ class DataFormat(object):
             KEY_ENCODING: self.encoding,
             KEY_HEADER: self.header,
         }
+        if self.cached_fields:
+            key_to_value_map[KEY_CACHED_FIELDS] = self.cached_fields
         if self.format == FORMAT_DELIMITED:
             key_to_value_map[KEY_ESCAPE_CHARACTER] = self.escape_character
             key_to_value_map[KEY_ITEM_DELIMITER] = self.item_delimiter
@@ -136,11 +136,16 @@ class Location(object):
         assert self._has_column
         return self._column
 
-    @property
-    def line(self):
-        """The current line or row in the input."""
+    def _get_line(self):
         return self._line
 
+    def _set_line(self, new_line):
+        assert new_line is not None
+        assert new_line >= 0
+        self._line = new_line
+
+    line = property(_get_line, _set_line, doc="The current line or row in the input.")
+
     def _get_sheet(self):
         assert self._has_sheet
         return self._sheet
@@ -16,13 +16,21 @@ Standard field formats supported by cutplace.
 #
 # You should have received a copy of the GNU Lesser General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import collections
+import copy
+import datetime
 import decimal
 import fnmatch
+import functools
+import io
+import itertools
 import keyword
+import os
 import re
 import string
 import sys
 import time
+import token
 from typing import Any, Optional
 
 from cutplace import _compat, _tools, data, errors, ranges
@@ -35,6 +43,204 @@ _FieldFormatClassSuffix = "FieldFormat"
 _ASCII_LETTERS = set(string.ascii_letters)
 _ASCII_LETTERS_DIGITS_AND_UNDERSCORE = set(string.ascii_letters + string.digits + "_")
 
+# Decimal number without exponent after separators have been translated.
+_PLAIN_DECIMAL_REGEX = re.compile(r"([+-]?\d+)(?:\.(\d*))?")
+
+# Marker for empty values during :py:meth:`AbstractFieldFormat.validated_values()`.
+_EMPTY_VALUE = object()
+
+
+def _unchanged_value(value):
+    return value
+
+
+@functools.lru_cache(maxsize=None)
+def _invalid_character_search(allowed_code_point_items):
+    """
+    The ``search`` method of a regular expression that finds the first
+    character not within any of the ``(lower, upper)`` code point limits in
+    ``allowed_code_point_items``. This replaces validating each character
+    of a value against a :py:class:`cutplace.ranges.Range` by a single scan.
+    """
+    assert allowed_code_point_items
+
+    character_class = ""
+    for lower, upper in allowed_code_point_items:
+        lower = 0 if lower is None else max(0, lower)
+        upper = sys.maxunicode if upper is None else min(sys.maxunicode, upper)
+        if lower <= upper:
+            character_class += "\\U%08x-\\U%08x" % (lower, upper)
+    pattern = "[^%s]" % character_class if character_class else "(?s)."
+    return re.compile(pattern).search
+
+
+# Name of the option for a ChoiceFieldFormat to ignore the case of values.
+_IGNORE_CASE_NAME = "ignore_case"
+
+# Maximum number of choices listed in an error message.
+_MAX_CHOICE_COUNT_IN_MESSAGE = 20
+
+#: Default for :py:attr:`AbstractFieldFormat.value_cache_size` of fields listed in
+#: :py:attr:`cutplace.data.DataFormat.cached_fields`.
+DEFAULT_VALUE_CACHE_SIZE = 1024
+
+# Number of values after which a value cache checks if it is worth to keep it.
+_VALUE_CACHE_PROBE_COUNT = 10000
+
+# Minimum share of values found in a value cache to keep using it.
+_MIN_VALUE_CACHE_HIT_RATE = 0.5
+
+#: Default number of recently validated values a :py:class:`DateTimeFieldFormat` remembers.
+DEFAULT_DATE_TIME_CACHE_SIZE = 256
+
+# Regular expressions for the strptime directives a human readable date format can result in, same as
+# the ones used by time.strptime().
+_STRPTIME_DIRECTIVE_TO_REGEX_MAP = {
+    "d": r"(?P<d>3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])",
+    "H": r"(?P<H>2[0-3]|[0-1]\d|\d)",
+    "m": r"(?P<m>1[0-2]|0[1-9]|[1-9])",
+    "M": r"(?P<M>[0-5]\d|\d)",
+    "S": r"(?P<S>6[0-1]|[0-5]\d|\d)",
+    "y": r"(?P<y>\d\d)",
+    "Y": r"(?P<Y>\d\d\d\d)",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _compiled_strptime(strptime_format):
+    """
+    A function that takes a value and returns the same
+    :py:class:`time.struct_time` as ``time.strptime(value, strptime_format)``
+    or ``None`` if it cannot parse the value, in which case the caller has
+    to resort to :py:func:`time.strptime()` to find out what is wrong with
+    it. This replaces the generic parser of :py:func:`time.strptime()` by a
+    regular expression with only the groups required and a validation of
+    the resulting date using :py:class:`datetime.date`.
+
+    The result is ``None`` if ``strptime_format`` contains directives other
+    than the ones in :py:data:`_STRPTIME_DIRECTIVE_TO_REGEX_MAP`.
+    """
+    pattern = ""
+    for literal_text, directive in re.findall("([^%]*)(?:%(.)|$)", strptime_format, re.DOTALL):
+        pattern += r"\s+".join(re.escape(part) for part in re.split(r"\s+", literal_text))
+        if directive == "%":
+            pattern += "%"
+        elif directive:
+            directive_regex = _STRPTIME_DIRECTIVE_TO_REGEX_MAP.get(directive)
+            if directive_regex is None:
+                return None
+            pattern += directive_regex
+    try:
+        fullmatch = re.compile(pattern, re.IGNORECASE).fullmatch
+    except re.error:
+        # Some directive is used more than once.
+        return None
+
+    def parsed(value):
+        match = fullmatch(value)
+        if match is None:
+            return None
+        found_map = match.groupdict()
+        if "Y" in found_map:
+            year = int(found_map["Y"])
+        elif "y" in found_map:
+            year = int(found_map["y"])
+            year += 2000 if year <= 68 else 1900
+        else:
+            year = 1900
+        month = int(found_map.get("m", 1))
+        day = int(found_map.get("d", 1))
+        try:
+            date_tuple = datetime.date(year, month, day).timetuple()
+        except ValueError:
+            return None
+        return time.struct_time(
+            (
+                year,
+                month,
+                day,
+                int(found_map.get("H", 0)),
+                int(found_map.get("M", 0)),
+                int(found_map.get("S", 0)),
+                date_tuple.tm_wday,
+                date_tuple.tm_yday,
+                -1,
+            )
+        )
+
+    return parsed
+
+
+def _choices_from_path(choices_path):
+    """
+    List of choices read from the UTF-8 text file at ``choices_path`` with
+    one choice per line, ignoring empty lines and duplicates.
+
+    :raises cutplace.errors.InterfaceError: if the file cannot be read
+    """
+    assert choices_path is not None
+
+    result = []
+    choice_set = set()
+    try:
+        with io.open(choices_path, encoding="utf-8", newline="") as choices_file:
+            for line in choices_file:
+                choice = line.rstrip("\r\n")
+                if choice and choice not in choice_set:
+                    choice_set.add(choice)
+                    result.append(choice)
+    except (OSError, UnicodeError) as error:
+        raise errors.InterfaceError(
+            "cannot read choices from %s: %s" % (_compat.text_repr(choices_path), error), cause=error
+        )
+    return result
+
+
+def _memoized_validated(validated, value_cache_size):
+    """
+    Same as the function ``validated`` but remembering the result or the
+    :py:exc:`~cutplace.errors.FieldValueError` for up to ``value_cache_size``
+    recently validated values. The least recently used value is forgotten
+    first. If less than :py:const:`_MIN_VALUE_CACHE_HIT_RATE` of the first
+    :py:const:`_VALUE_CACHE_PROBE_COUNT` values are found in the cache, it
+    is turned off because there are too many distinct values.
+    """
+    assert value_cache_size >= 1
+
+    value_to_result_and_error_map = collections.OrderedDict()
+    lookup_count = 0
+    hit_count = 0
+    is_caching = True
+
+    def memoized_validated(value):
+        nonlocal hit_count, is_caching, lookup_count
+
+        if not is_caching:
+            return validated(value)
+        lookup_count += 1
+        result_and_error = value_to_result_and_error_map.get(value)
+        if result_and_error is None:
+            try:
+                result_and_error = (validated(value), None)
+            except errors.FieldValueError as error:
+                result_and_error = (None, error)
+            value_to_result_and_error_map[value] = result_and_error
+            if len(value_to_result_and_error_map) > value_cache_size:
+                value_to_result_and_error_map.popitem(last=False)
+        else:
+            hit_count += 1
+            value_to_result_and_error_map.move_to_end(value)
+        if lookup_count == _VALUE_CACHE_PROBE_COUNT and hit_count < _MIN_VALUE_CACHE_HIT_RATE * lookup_count:
+            is_caching = False
+            value_to_result_and_error_map.clear()
+        result, error = result_and_error
+        if error is not None:
+            # Raise a copy because the caller might change the message and location.
+            raise copy.copy(error)
+        return result
+
+    return memoized_validated
+
 
 class AbstractFieldFormat(object):
     """
@@ -65,6 +271,7 @@ class AbstractFieldFormat(object):
         self._data_format = data_format
         self._empty_value = empty_value
         self._example = None
+        self._value_cache_size = 0
 
     @property
     def field_name(self):
@@ -122,6 +329,23 @@ class AbstractFieldFormat(object):
         """
         return self._empty_value
 
+    @property
+    def value_cache_size(self):
+        """
+        The number of recently validated values for which the function
+        returned by :py:meth:`compiled_validated()` remembers the result or
+        error instead of validating them again; 0 means no values are
+        remembered. This speeds up fields with only a few distinct values,
+        for example country codes.
+        """
+        return self._value_cache_size
+
+    @value_cache_size.setter
+    def value_cache_size(self, new_value_cache_size):
+        assert new_value_cache_size >= 0
+
+        self._value_cache_size = new_value_cache_size
+
     def _get__example(self):
         return self._example
 
@@ -162,24 +386,24 @@ class AbstractFieldFormat(object):
           ``value`` is not allowed
         """
         valid_character_range = self.data_format.allowed_characters
-        if valid_character_range is not None:
-            for character_column, character in enumerate(value, 1):
+        if (valid_character_range is not None) and (valid_character_range.items is not None):
+            invalid_character_match = _invalid_character_search(tuple(valid_character_range.items))(value)
+            if invalid_character_match is not None:
+                character = invalid_character_match.group()
                 character_code = ord(character)
-                try:
-                    valid_character_range.validate("character", character_code)
-                except errors.RangeValueError:
-                    raise errors.FieldValueError(
-                        "character %s (code point U+%04x, decimal %d) in field '%s' at column %d must be an allowed "
-                        "character: %s"
-                        % (
-                            _compat.text_repr(character),
-                            character_code,
-                            character_code,
-                            self.field_name,
-                            character_column,
-                            valid_character_range,
-                        )
+                character_column = invalid_character_match.start() + 1
+                raise errors.FieldValueError(
+                    "character %s (code point U+%04x, decimal %d) in field '%s' at column %d must be an allowed "
+                    "character: %s"
+                    % (
+                        _compat.text_repr(character),
+                        character_code,
+                        character_code,
+                        self.field_name,
+                        character_column,
+                        valid_character_range,
                     )
+                )
 
     def validate_empty(self, value):
         """
@@ -260,6 +484,203 @@ class AbstractFieldFormat(object):
             result = self.empty_value
         return result
 
+    def compiled_validated(self, default_value_cache_size=0):
+        """
+        A function that takes a value and returns the same result as
+        :py:meth:`~cutplace.fields.AbstractFieldFormat.validated()` but
+        skips all validation stages that cannot fail for this field format,
+        for example the check for allowed characters if the data format does
+        not specify any.
+
+        Validators call this once before processing the first row. In case
+        a descendant overrides :py:meth:`validated()` or any of the
+        ``validate_*()`` methods, the result simply is :py:meth:`validated()`.
+
+        The function remembers the results for the number of values
+        specified by :py:attr:`value_cache_size` or, if this is 0,
+        ``default_value_cache_size``.
+        """
+        assert default_value_cache_size >= 0
+
+        result = self._compiled_validated(self.empty_value, self.validated_value)
+        if result is None:
+            result = self.validated
+        value_cache_size = self.value_cache_size or default_value_cache_size
+        if value_cache_size >= 1:
+            result = _memoized_validated(result, value_cache_size)
+        return result
+
+    def _compiled_validated(self, empty_value, validated_value):
+        """
+        Function performing the same validation stages as
+        :py:meth:`validated()` but returning ``empty_value`` for empty values
+        and passing other values to ``validated_value`` at the end; ``None``
+        if a descendant overrides any of the validation stages.
+        """
+        field_format_class = type(self)
+        has_overridden_validation = any(
+            getattr(field_format_class, method_name) is not getattr(AbstractFieldFormat, method_name)
+            for method_name in ("validated", "validate_characters", "validate_empty", "validate_length")
+        )
+        is_fixed = self.data_format.format == data.FORMAT_FIXED
+        if has_overridden_validation or (is_fixed and self.length.lower_limit is None):
+            return None
+
+        is_allowed_to_be_empty = self.is_allowed_to_be_empty
+        allowed_characters = self.data_format.allowed_characters
+        has_allowed_characters = (allowed_characters is not None) and (allowed_characters.items is not None)
+        if has_allowed_characters:
+            invalid_character_search = _invalid_character_search(tuple(allowed_characters.items))
+        fixed_length = self.length.lower_limit if is_fixed else None
+        length_range = self.length if (not is_fixed and self.length.items is not None) else None
+        validate_characters = self.validate_characters
+        validate_length = self.validate_length
+
+        def validated(value):
+            if has_allowed_characters and (invalid_character_search(value) is not None):
+                validate_characters(value)
+            if not value:
+                if not is_allowed_to_be_empty:
+                    raise errors.FieldValueError("value must not be empty")
+                return empty_value
+            if fixed_length is not None:
+                if len(value) > fixed_length:
+                    validate_length(value)
+                value = value.strip()
+                if not value:
+                    return empty_value
+            elif length_range is not None and len(value) not in length_range:
+                validate_length(value)
+            return validated_value(value)
+
+        return validated
+
+    def validated_value_batch(self, values):
+        """
+        Similar to :py:meth:`validated_value()` but for a whole list of
+        ``values`` that all already passed the same checks as described
+        there.
+
+        The result is a list with an item for each value, which is either
+        the value in its native type or the
+        :py:exc:`~cutplace.errors.FieldValueError` that describes why it
+        cannot be accepted.
+
+        The default implementation calls :py:meth:`validated_value()` for
+        each value. Descendants can override this to validate all values in
+        one go, for example by converting them first and then checking the
+        ranges of all of them.
+        """
+        result = []
+        validated_value = self.validated_value
+        for value in values:
+            try:
+                result.append(validated_value(value))
+            except errors.FieldValueError as error:
+                result.append(error)
+        return result
+
+    def validated_values(self, values):
+        """
+        Similar to :py:meth:`validated()` but for a whole list of ``values``,
+        typically all values of this field in a batch of rows.
+
+        The result is a list with an item for each value, which is either
+        the value in its native type or the
+        :py:exc:`~cutplace.errors.FieldValueError` that describes why it
+        cannot be accepted.
+        """
+        result, _ = self._validated_values_and_errors(values)
+        return result
+
+    def _validated_values_and_errors(self, values):
+        """
+        Same as :py:meth:`validated_values()` but as tuple with a map of the
+        index of each value that cannot be accepted to its error as second
+        item.
+        """
+        result = []
+        index_to_error_map = {}
+        prevalidated = self._compiled_validated(_EMPTY_VALUE, _unchanged_value)
+        if prevalidated is None:
+            # Validation stages are overridden and can only be applied to one value at a time.
+            validated = self.validated
+            for index, value in enumerate(values):
+                try:
+                    result.append(validated(value))
+                except errors.FieldValueError as error:
+                    result.append(error)
+                    index_to_error_map[index] = error
+        elif self._can_validate_vectorized(values):
+            invalid_indices, result = self._vectorized_validated_values(values)
+            result = list(result)
+            validated = self._compiled_validated(self.empty_value, self.validated_value)
+            for index in invalid_indices:
+                # Validate remaining values one at a time to get the same result and errors as validated().
+                try:
+                    result[index] = validated(values[index])
+                except errors.FieldValueError as error:
+                    result[index] = error
+                    index_to_error_map[index] = error
+        else:
+            empty_value = self.empty_value
+            indices_to_validate = []
+            values_to_validate = []
+            for index, value in enumerate(values):
+                try:
+                    prevalidated_value = prevalidated(value)
+                except errors.FieldValueError as error:
+                    result.append(error)
+                    index_to_error_map[index] = error
+                    continue
+                if prevalidated_value is _EMPTY_VALUE:
+                    result.append(empty_value)
+                else:
+                    result.append(None)
+                    indices_to_validate.append(index)
+                    values_to_validate.append(prevalidated_value)
+            if values_to_validate:
+                validated_values = self.validated_value_batch(values_to_validate)
+                assert len(validated_values) == len(values_to_validate)
+                for index, validated_value in zip(indices_to_validate, validated_values):
+                    result[index] = validated_value
+                    if isinstance(validated_value, errors.FieldValueError):
+                        index_to_error_map[index] = validated_value
+        return result, index_to_error_map
+
+    def _can_validate_vectorized(self, values):
+        if (type(self)._vectorized_validated_values is AbstractFieldFormat._vectorized_validated_values) or (
+            self.data_format.format == data.FORMAT_FIXED
+        ):
+            return False
+        # Import only when needed because numpy takes a while to import.
+        from cutplace import _vectorized
+
+        return (
+            _vectorized.has_numpy
+            and (len(values) >= _vectorized.MIN_VALUE_COUNT)
+            and (self.data_format.allowed_characters is None)
+        )
+
+    def _vectorized_validated_values(self, values):
+        """
+        Tuple with a list of the indices of ``values`` that are not certainly
+        valid and a list with the respective validated values, which only
+        have to be meaningful for valid values. Values that are not certainly
+        valid are validated one at a time using :py:meth:`validated()`.
+
+        This is only called if NumPy is installed, see
+        :py:mod:`cutplace._vectorized`, and only for delimited data without
+        restrictions on the allowed characters.
+
+        Descendants that override this must make sure that all values reported
+        as valid would also pass :py:meth:`validated()` with the same result.
+        """
+        raise NotImplementedError()
+
+    def _vectorized_length_items(self):
+        return self.length.items
+
     def __str__(self):
         return "%s(%s, %s, %s, %s)" % (
             self.__class__.__name__,
@@ -273,11 +694,19 @@ class AbstractFieldFormat(object):
 class ChoiceFieldFormat(AbstractFieldFormat):
     """
     Field format accepting only values from a pool of choices.
+
+    The rule is either a comma separated list of choices or ``@`` followed
+    by the path of a UTF-8 text file with one choice per line, which is
+    relative to :py:attr:`cutplace.data.DataFormat.cid_folder`. It can start
+    with ``ignore_case:`` to accept values that differ from a choice only in
+    upper and lower case.
     """
 
     def __init__(self, field_name, is_allowed_to_be_empty, length, rule, data_format):
         super().__init__(field_name, is_allowed_to_be_empty, length, rule, data_format, empty_value="")
-        self.choices = []
+        self._choices = []
+        self._choices_path = None
+        self._is_ignoring_case = False
 
         # Split rule into tokens, ignoring white space.
         tokens = _tools.tokenize_without_space(rule)
@@ -285,6 +714,31 @@ class ChoiceFieldFormat(AbstractFieldFormat):
         # Extract choices from rule tokens.
         previous_toky = None
         toky = next(tokens)
+        if (toky[0] == token.NAME) and (toky[1] == _IGNORE_CASE_NAME):
+            ignore_case_toky = toky
+            toky = next(tokens)
+            if (toky[0] == token.OP) and (toky[1] == ":"):
+                self._is_ignoring_case = True
+                toky = next(tokens)
+            else:
+                # Plain choice that happens to be named like the option.
+                tokens = itertools.chain([toky], tokens)
+                toky = ignore_case_toky
+        if (toky[0] == token.OP) and (toky[1] == "@"):
+            toky = next(tokens)
+            if _tools.is_eof_token(toky):
+                raise errors.InterfaceError("path of file containing the choices must follow at sign (@)")
+            choices_path = _tools.token_text(toky)
+            if data_format.cid_folder is not None:
+                choices_path = os.path.join(data_format.cid_folder, choices_path)
+            toky = next(tokens)
+            if not _tools.is_eof_token(toky):
+                raise errors.InterfaceError(
+                    "path of file containing the choices must be followed by nothing but found: %s"
+                    % _compat.text_repr(toky[1])
+                )
+            self._choices = _choices_from_path(choices_path)
+            self._choices_path = os.path.abspath(choices_path)
         while not _tools.is_eof_token(toky):
             if _tools.is_comma_token(toky):
                 # Handle comma after comma without choice.
@@ -300,7 +754,7 @@ class ChoiceFieldFormat(AbstractFieldFormat):
                 raise errors.InterfaceError(
                     "choice field must be allowed to be empty instead of containing an empty choice"
                 )
-            self.choices.append(choice)
+            self._choices.append(choice)
             toky = next(tokens)
             if not _tools.is_eof_token(toky):
                 if not _tools.is_comma_token(toky):
@@ -312,19 +766,60 @@ class ChoiceFieldFormat(AbstractFieldFormat):
                 toky = next(tokens)
                 if _tools.is_eof_token(toky):
                     raise errors.InterfaceError("trailing comma (,) must be removed")
-        if not self.is_allowed_to_be_empty and not self.choices:
+        if not self.is_allowed_to_be_empty and not self._choices:
             raise errors.InterfaceError("choice field without any choices must be allowed to be empty")
+        self._choice_set = frozenset(
+            choice.casefold() if self._is_ignoring_case else choice for choice in self._choices
+        )
+
+    @property
+    def choices(self):
+        """
+        List of the valid values in the order they were declared.
+        """
+        return self._choices
+
+    @property
+    def choices_path(self):
+        """
+        Absolute path of the file the choices were read from or ``None`` if
+        the rule lists them.
+        """
+        return self._choices_path
+
+    @property
+    def is_ignoring_case(self):
+        """
+        ``True`` if values that differ from a choice only in upper and lower
+        case are accepted.
+        """
+        return self._is_ignoring_case
 
     def validated_value(self, value):
         assert value
 
-        if value not in self.choices:
+        if (value.casefold() if self._is_ignoring_case else value) not in self._choice_set:
+            choice_count = len(self._choices)
+            if choice_count <= _MAX_CHOICE_COUNT_IN_MESSAGE:
+                choices_text = _tools.human_readable_list(self._choices)
+            else:
+                choices_text = "%s, ... (%d more)" % (
+                    ", ".join(_compat.text_repr(choice) for choice in self._choices[:_MAX_CHOICE_COUNT_IN_MESSAGE]),
+                    choice_count - _MAX_CHOICE_COUNT_IN_MESSAGE,
+                )
             raise errors.FieldValueError(
-                "value is %s but must be one of: %s"
-                % (_compat.text_repr(value), _tools.human_readable_list(self.choices))
+                "value is %s but must be one of: %s" % (_compat.text_repr(value), choices_text)
             )
         return value
 
+    def _can_validate_vectorized(self, values):
+        return not self._is_ignoring_case and super()._can_validate_vectorized(values)
+
+    def _vectorized_validated_values(self, values):
+        from cutplace import _vectorized
+
+        return _vectorized.choice_invalid_indices(values, self._vectorized_length_items(), self._choices), values
+
 
 class ConstantFieldFormat(AbstractFieldFormat):
     """
@@ -383,44 +878,108 @@ class DecimalFieldFormat(AbstractFieldFormat):
     def __init__(self, field_name, is_allowed_to_be_empty, length_text, rule, data_format, empty_value=None):
         super().__init__(field_name, is_allowed_to_be_empty, "", "", data_format, empty_value)
         assert rule is not None, 'to specify "no rule" use "" instead of None'
-        self.decimal_separator = data_format.decimal_separator
-        self.thousands_separator = data_format.thousands_separator
+        self._decimal_separator = data_format.decimal_separator
+        self._thousands_separator = data_format.thousands_separator
         self.valid_range = ranges.DecimalRange(rule, ranges.DEFAULT_DECIMAL_RANGE_TEXT)
         self._length = ranges.DecimalRange(length_text)
 
         self._precision = self.valid_range.precision
         self._scale = self.valid_range.scale
+        self._scaled_range_items = [
+            tuple(None if limit is None else int(limit.scaleb(self._precision)) for limit in item)
+            for item in self.valid_range.items
+        ]
+        self._compile_separators()
+
+    def _get_decimal_separator(self):
+        return self._decimal_separator
+
+    def _set_decimal_separator(self, new_decimal_separator):
+        self._decimal_separator = new_decimal_separator
+        self._compile_separators()
+
+    decimal_separator = property(
+        _get_decimal_separator, _set_decimal_separator, doc="Character separating the fractional part."
+    )
+
+    def _get_thousands_separator(self):
+        return self._thousands_separator
+
+    def _set_thousands_separator(self, new_thousands_separator):
+        self._thousands_separator = new_thousands_separator
+        self._compile_separators()
+
+    thousands_separator = property(
+        _get_thousands_separator,
+        _set_thousands_separator,
+        doc="Character separating groups of thousands or ``''`` if there is none.",
+    )
+
+    def _compile_separators(self):
+        """
+        Setup the translation table to turn a value into a text
+        :py:class:`decimal.Decimal` understands and the function that finds
+        a character that needs to be translated; ``None`` if there is no
+        such character.
+        """
+        characters_to_translate = {}
+        if self._decimal_separator != ".":
+            characters_to_translate[self._decimal_separator] = "."
+        if self._thousands_separator:
+            characters_to_translate[self._thousands_separator] = None
+        self._translation_table = str.maketrans(characters_to_translate)
+        self._separator_search = (
+            re.compile("[%s]" % re.escape("".join(characters_to_translate))).search if characters_to_translate else None
+        )
 
     def sql_ansi_type(self):
         return ("decimal", self._scale, self._precision)
 
+    def _validate_separators(self, value):
+        """
+        Validate that ``value`` contains at most one decimal separator and
+        thousands separators only before it.
+        """
+        decimal_separator_index = value.find(self._decimal_separator)
+        if decimal_separator_index != -1:
+            next_decimal_separator_index = value.find(self._decimal_separator, decimal_separator_index + 1)
+            next_thousands_separator_index = (
+                value.find(self._thousands_separator, decimal_separator_index + 1) if self._thousands_separator else -1
+            )
+            if next_thousands_separator_index != -1 and (
+                next_decimal_separator_index == -1 or next_thousands_separator_index < next_decimal_separator_index
+            ):
+                raise errors.FieldValueError(
+                    "decimal field must contain thousands separator (%r) only before "
+                    "decimal separator (%r): %r " % (self._thousands_separator, self._decimal_separator, value)
+                )
+            if next_decimal_separator_index != -1:
+                raise errors.FieldValueError(
+                    "decimal field must contain only one decimal separator (%s): %s"
+                    % (_compat.text_repr(self._decimal_separator), _compat.text_repr(value))
+                )
+
+    def _translated_value(self, value):
+        """
+        The ``value`` as text :py:class:`decimal.Decimal` understands,
+        without thousands separators and with ``'.'`` as decimal separator.
+        """
+        if self._separator_search is None or self._separator_search(value) is None:
+            result = value
+        else:
+            self._validate_separators(value)
+            result = value.translate(self._translation_table)
+        return result
+
     def validated_value(self, value):
         assert value
 
-        translated_value = ""
-        found_decimal_separator = False
-        for character_to_process in value:
-            if character_to_process == self.decimal_separator:
-                if found_decimal_separator:
-                    raise errors.FieldValueError(
-                        "decimal field must contain only one decimal separator (%s): %s"
-                        % (_compat.text_repr(self.decimal_separator), _compat.text_repr(value))
-                    )
-                translated_value += "."
-                found_decimal_separator = True
-            elif self.thousands_separator and (character_to_process == self.thousands_separator):
-                if found_decimal_separator:
-                    raise errors.FieldValueError(
-                        "decimal field must contain thousands separator (%r) only before "
-                        "decimal separator (%r): %r " % (self.thousands_separator, self.decimal_separator, value)
-                    )
-            else:
-                translated_value += character_to_process
-
+        translated_value = self._translated_value(value)
         try:
             result = decimal.Decimal(translated_value)
-        except Exception as error:
-            # TODO: limit exception handler to decimal exception or whatever decimal.Decimal raises.
+        except decimal.InvalidOperation as error:
+            # Find out if the value was broken because of separators in wrong places.
+            self._validate_separators(value)
             message = "value is %r but must be a decimal number: %s" % (value, error)
             raise errors.FieldValueError(message)
 
@@ -431,6 +990,63 @@ class DecimalFieldFormat(AbstractFieldFormat):
 
         return result
 
+    def validated_scaled_value(self, value):
+        """
+        Similar to :py:meth:`validated_value()` but the result is an
+        ``int`` with the value multiplied by 10 to the power of the
+        :py:attr:`~cutplace.ranges.DecimalRange.precision` of
+        :py:attr:`valid_range`, for example ``1234`` for ``'12.34'`` and a
+        precision of 2. This avoids the overhead of
+        :py:class:`decimal.Decimal` for applications that compute with
+        amounts in their smallest unit.
+
+        :raises cutplace.errors.FieldValueError: if ``value`` is invalid \
+          or has more digits after the decimal separator than the precision
+        """
+        assert value
+
+        precision = self._precision
+        plain_decimal_match = _PLAIN_DECIMAL_REGEX.fullmatch(self._translated_value(value))
+        if plain_decimal_match is not None:
+            integer_digits, fraction_digits = plain_decimal_match.groups()
+            if fraction_digits is None:
+                fraction_digits = ""
+            if len(fraction_digits) <= precision:
+                result = int(integer_digits + fraction_digits.ljust(precision, "0"))
+                for lower, upper in self._scaled_range_items:
+                    if (lower is None or lower <= result) and (upper is None or result <= upper):
+                        return result
+
+        # Use the slow path for special cases and to get the same errors as validated_value().
+        scaled_result = self.validated_value(value).scaleb(precision)
+        if scaled_result != scaled_result.to_integral_value():
+            raise errors.FieldValueError(
+                "value is %r but must have at most %d digits after the decimal separator" % (value, precision)
+            )
+        return int(scaled_result)
+
+    def _vectorized_validated_values(self, values):
+        from cutplace import _vectorized
+
+        decimal_separator = self.decimal_separator
+        valid_range = self.valid_range
+        # Same as with validate_length(), values of the wrong length are validated one at a time to get the error.
+        length_range = self.length if self.length.items is not None else None
+        invalid_indices = []
+        result = []
+        for index, (value, is_plain_decimal) in enumerate(
+            zip(values, _vectorized.plain_decimal_mask(values, decimal_separator))
+        ):
+            value_as_decimal = None
+            if is_plain_decimal and ((length_range is None) or (len(value) in length_range)):
+                value_as_decimal = decimal.Decimal(value.replace(decimal_separator, "."))
+                if value_as_decimal not in valid_range:
+                    value_as_decimal = None
+            if value_as_decimal is None:
+                invalid_indices.append(index)
+            result.append(value_as_decimal)
+        return invalid_indices, result
+
 
 class IntegerFieldFormat(AbstractFieldFormat):
     """
@@ -527,6 +1143,26 @@ class IntegerFieldFormat(AbstractFieldFormat):
             raise errors.FieldValueError(str(error))
         return value_as_int
 
+    def _vectorized_validated_values(self, values):
+        from cutplace import _vectorized
+
+        return _vectorized.integer_values(values, self._vectorized_length_items(), self.valid_range.items)
+
+    def validated_value_batch(self, values):
+        try:
+            result = [int(value) for value in values]
+        except ValueError:
+            # At least one value is broken, so fall back to validating each value on its own.
+            return super().validated_value_batch(values)
+        valid_range = self.valid_range
+        for index, value_as_int in enumerate(result):
+            if value_as_int not in valid_range:
+                try:
+                    valid_range.validate("value", value_as_int)
+                except errors.RangeValueError as error:
+                    result[index] = errors.FieldValueError(str(error))
+        return result
+
 
 class DateTimeFieldFormat(AbstractFieldFormat):
     """
@@ -550,8 +1186,18 @@ class DateTimeFieldFormat(AbstractFieldFormat):
     _NO_EXCEL_TIME = " 00:00:00"
     _NO_EXCEL_TIME_LENGTH = len(_NO_EXCEL_TIME)
 
-    def __init__(self, field_name, is_allowed_to_be_empty, length, rule, data_format, empty_value=None):
+    def __init__(
+        self,
+        field_name,
+        is_allowed_to_be_empty,
+        length,
+        rule,
+        data_format,
+        empty_value=None,
+        cache_size=DEFAULT_DATE_TIME_CACHE_SIZE,
+    ):
         super().__init__(field_name, is_allowed_to_be_empty, length, rule, data_format, empty_value)
+        assert cache_size >= 0
         self.human_readable_format = rule
 
         self.strptime_format = rule
@@ -563,6 +1209,59 @@ class DateTimeFieldFormat(AbstractFieldFormat):
         self._has_date = any(
             directive in self.strptime_format for directive in DateTimeFieldFormat._STRPTIME_DATE_DIRECTIVES
         )
+        self._cache_size = cache_size
+        self._compile_parsed()
+
+    def __getstate__(self):
+        # Leave out the compiled parser because it cannot be pickled.
+        result = self.__dict__.copy()
+        del result["_parsed"]
+        return result
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._compile_parsed()
+
+    @property
+    def has_date(self):
+        """
+        ``True`` if the format contains any part of a date.
+        """
+        return self._has_date
+
+    @property
+    def has_time(self):
+        """
+        ``True`` if the format contains any part of a time.
+        """
+        return self._has_time
+
+    @property
+    def cache_size(self):
+        """
+        The number of recently validated values for which the result is
+        remembered instead of parsing them again; 0 means no values are
+        remembered. Columns with only a few distinct dates benefit from a
+        larger cache.
+        """
+        return self._cache_size
+
+    @cache_size.setter
+    def cache_size(self, new_cache_size):
+        assert new_cache_size >= 0
+        self._cache_size = new_cache_size
+        self._compile_parsed()
+
+    def _compile_parsed(self):
+        """
+        Setup the function that takes a value and returns the result of
+        :py:func:`time.strptime()` for it or ``None`` if it cannot be parsed
+        without :py:func:`time.strptime()`.
+        """
+        parsed = _compiled_strptime(self.strptime_format)
+        if parsed is not None and self._cache_size > 0:
+            parsed = functools.lru_cache(maxsize=self._cache_size)(parsed)
+        self._parsed = parsed
 
     def sql_ansi_type(self):
         # FIXME: Use timestamp for ANSI, date, datetime and time for others.
@@ -580,6 +1279,9 @@ class DateTimeFieldFormat(AbstractFieldFormat):
         else:
             value_to_validate = value
 
+        result = self._parsed(value_to_validate) if self._parsed is not None else None
+        if result is not None:
+            return result
         try:
             result = time.strptime(value_to_validate, self.strptime_format)
         except ValueError:
@@ -17,12 +17,16 @@ Classes and functions to read and represent cutplace interface definitions.
 # You should have received a copy of the GNU Lesser General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 import glob
+import hashlib
 import importlib.machinery
 import importlib.util
 import inspect
 import io
 import logging
 import os.path
+import pickle
+import sys
+import tempfile
 from pathlib import Path
 
 from cutplace import _compat, _tools, checks, data, errors, fields, rowio
@@ -66,6 +70,18 @@ class Cid(object):
         else:
             self.set_location_to_caller()
 
+    def __getstate__(self):
+        # Leave out the maps of class names because they can contain plugin classes that cannot be pickled.
+        result = self.__dict__.copy()
+        del result["_check_name_to_class_map"]
+        del result["_field_format_name_to_class_map"]
+        return result
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._check_name_to_class_map = Cid._create_name_to_class_map(checks.AbstractCheck)
+        self._field_format_name_to_class_map = Cid._create_name_to_class_map(fields.AbstractFieldFormat)
+
     def __str__(self):
         result = "Cid("
         if self.data_format is not None:
@@ -106,6 +122,14 @@ class Cid(object):
         """
         return self._field_names
 
+    @property
+    def field_name_to_index_map(self):
+        """
+        Map of each field name to its column index starting with 0. Do not
+        modify it.
+        """
+        return self._field_name_to_index_map
+
     @property
     def field_formats(self):
         """
@@ -113,6 +137,19 @@ class Cid(object):
         """
         return self._field_formats
 
+    @property
+    def choices_paths(self):
+        """
+        List of the absolute paths of the files
+        :py:class:`~cutplace.fields.ChoiceFieldFormat` fields read their
+        choices from.
+        """
+        return [
+            field_format.choices_path
+            for field_format in self._field_formats
+            if isinstance(field_format, fields.ChoiceFieldFormat) and (field_format.choices_path is not None)
+        ]
+
     @property
     def check_names(self):
         """
@@ -239,6 +276,8 @@ class Cid(object):
         lower_value = value.lower()
         if self._data_format is None:
             self._data_format = data.DataFormat(lower_value, self._location)
+            if isinstance(self._cid_path, str):
+                self._data_format.cid_folder = os.path.dirname(os.path.abspath(self._cid_path))
         else:
             self._data_format.set_property(name.lower(), value, self._location)
 
@@ -286,6 +325,20 @@ class Cid(object):
         self.data_format.validate()
         if len(self.field_names) == 0:
             raise errors.InterfaceError("fields must be specified", self._location)
+        for cached_field_name in self.data_format.cached_fields:
+            cached_field_format = self._field_name_to_format_map.get(cached_field_name)
+            if cached_field_format is None:
+                raise errors.InterfaceError(
+                    "field %s in data format property %s must be one of: %s"
+                    % (
+                        _compat.text_repr(cached_field_name),
+                        _compat.text_repr(data.KEY_CACHED_FIELDS),
+                        _tools.human_readable_list(self.field_names),
+                    ),
+                    self._location,
+                )
+            if cached_field_format.value_cache_size == 0:
+                cached_field_format.value_cache_size = fields.DEFAULT_VALUE_CACHE_SIZE
 
     def add_field_format(self, field_format):
         """
@@ -590,6 +643,110 @@ def create_cid_from_string(cid_text):
     return result
 
 
+def default_cid_cache_folder():
+    """
+    The folder where :py:func:`cached_cid` stores CIDs by default, which is
+    :file:`cutplace` in ``$XDG_CACHE_HOME`` or :file:`~/.cache`.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    if not cache_home:
+        cache_home = os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "cutplace")
+
+
+def _cid_cache_path(cid_path, cache_folder):
+    """
+    Path in ``cache_folder`` where to cache the CID read from ``cid_path``,
+    which depends on the content of ``cid_path``, its absolute path (which
+    shows up in error messages) and the versions of cutplace and Python.
+    """
+    from cutplace import __version__
+
+    cid_hash = hashlib.sha256()
+    for key_part in (__version__, sys.version, os.path.abspath(cid_path)):
+        cid_hash.update(key_part.encode("utf-8"))
+        cid_hash.update(b"\0")
+    with io.open(cid_path, "rb") as cid_file:
+        for block in iter(lambda: cid_file.read(1024 * 1024), b""):
+            cid_hash.update(block)
+    return os.path.join(cache_folder, cid_hash.hexdigest() + ".pickle")
+
+
+def _stat_keys(paths):
+    """
+    List with a tuple ``(st_mtime_ns, st_size)`` for each of ``paths`` to
+    detect if any of the files changed, or ``None`` if any of them cannot be
+    accessed anymore.
+    """
+    result = []
+    for path in paths:
+        try:
+            path_stat = os.stat(path)
+        except OSError:
+            return None
+        result.append((path_stat.st_mtime_ns, path_stat.st_size))
+    return result
+
+
+def cached_cid(cid_path, cache_folder=None):
+    """
+    A :py:class:`~cutplace.interface.Cid` read from ``cid_path`` similar to
+    ``Cid(cid_path)`` but stored in ``cache_folder`` so later calls for the
+    same CID can skip reading and parsing it.
+
+    The cache is invalidated automatically when the content of
+    ``cid_path``, the modification time or size of any file the CID reads
+    choices from (see :py:attr:`Cid.choices_paths`) or the version of
+    cutplace changes. CIDs that cannot be
+    stored, for example because they use field formats or checks from
+    plugins, are simply read every time.
+
+    :param str cache_folder: folder to store cached CIDs in; if ``None``, \
+      use :py:func:`default_cid_cache_folder()`
+    """
+    assert cid_path is not None
+
+    if cache_folder is None:
+        cache_folder = default_cid_cache_folder()
+    cache_path = _cid_cache_path(cid_path, cache_folder)
+    result = None
+    try:
+        with io.open(cache_path, "rb") as cache_file:
+            cached_result, choices_stat_keys = pickle.load(cache_file)
+        if isinstance(cached_result, Cid) and (choices_stat_keys == _stat_keys(cached_result.choices_paths)):
+            result = cached_result
+            _log.debug('read cached CID from "%s"', cache_path)
+        else:
+            _log.debug('ignore outdated cached CID in "%s"', cache_path)
+    except FileNotFoundError:
+        pass
+    except Exception as error:
+        # Broken cache files are simply replaced.
+        _log.debug('cannot read cached CID from "%s": %s', cache_path, error)
+    if result is None:
+        result = Cid(cid_path)
+        try:
+            pickled_cid = pickle.dumps((result, _stat_keys(result.choices_paths)), pickle.HIGHEST_PROTOCOL)
+        except Exception as error:
+            _log.debug('cannot cache CID "%s": %s', cid_path, error)
+        else:
+            try:
+                os.makedirs(cache_folder, mode=0o700, exist_ok=True)
+                # Write to a temporary file first so concurrent processes never read a partially written file.
+                temp_fd, temp_path = tempfile.mkstemp(".tmp", "", cache_folder)
+                try:
+                    with io.open(temp_fd, "wb") as temp_file:
+                        temp_file.write(pickled_cid)
+                    os.replace(temp_path, cache_path)
+                except BaseException:
+                    os.remove(temp_path)
+                    raise
+                _log.debug('cached CID in "%s"', cache_path)
+            except OSError as error:
+                _log.warning('cannot cache CID in "%s": %s', cache_path, error)
+    return result
+
+
 def field_names_and_lengths(fixed_cid):
     """
     List of tuples ``(field_name, field_length)`` for all field formats in
@@ -608,7 +765,8 @@ def field_names_and_lengths(fixed_cid):
         lower, upper = field_length_range
         assert lower is not None
         assert lower == upper
-        field_length = lower
+        # NOTE: Decimal fields have lengths of type Decimal.
+        field_length = int(lower)
         result.append((field_name, field_length))
     return result
 
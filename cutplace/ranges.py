@@ -4,6 +4,7 @@ particular to specify the length limits for field values and the characters allo
 format.
 """
 
+import bisect
 import decimal
 
 # Copyright (C) 2009-2021 Thomas Aglassinger
@@ -32,6 +33,10 @@ MIN_INTEGER = -(2**31)
 
 DEFAULT_INTEGER_RANGE_TEXT = "%d...%d" % (MIN_INTEGER, MAX_INTEGER)
 
+# Sentinels for missing limits in the sorted intervals used to look up values.
+_NO_LOWER_LIMIT = float("-inf")
+_NO_UPPER_LIMIT = float("inf")
+
 #: Text to describe the upper limit of the default decimal range. 31 digits
 #: are the maximum scale of IBM DB2 decimals, which seems to be the smallest
 #: limit for currently practically relevant databases. Using 12 of these digits
@@ -205,6 +210,8 @@ class Range(object):
             description = default
             has_description = True
 
+        self._interval_lowers = []
+        self._interval_uppers = []
         if not has_description:
             # Use empty ranges.
             self._description = None
@@ -314,15 +321,15 @@ class Range(object):
                     # Handle "x".
                     result = (lower, lower)
                 if result is not None:
-                    for item in self._items:
-                        if self._items_overlap(item, result):
-                            item_text = _compat.text_repr(self._repr_item(item))
-                            result_text = _compat.text_repr(self._repr_item(result))
-                            raise errors.InterfaceError(
-                                "overlapping parts in range must be cleaned up: %s and %s" % (item_text, result_text),
-                                location,
-                            )
-                    self._items.append(result)
+                    item = self._overlapping_item(result)
+                    if item is not None:
+                        item_text = _compat.text_repr(self._repr_item(item))
+                        result_text = _compat.text_repr(self._repr_item(result))
+                        raise errors.InterfaceError(
+                            "overlapping parts in range must be cleaned up: %s and %s" % (item_text, result_text),
+                            location,
+                        )
+                    self._add_item(result)
                 if _tools.is_eof_token(next_token):
                     end_reached = True
 
@@ -391,7 +398,7 @@ class Range(object):
         """
         if item is not None:
             result = ""
-            (lower, upper) = item
+            lower, upper = item
             if lower is None:
                 assert upper is not None
                 result += "...%s" % upper
@@ -460,6 +467,72 @@ class Range(object):
                 result = (value >= lower) and (value <= upper)
         return result
 
+    def _is_in_intervals(self, value):
+        """
+        ``True`` if ``value`` is within any of the items added so far.
+
+        To find out, the items are also kept as sorted intervals without
+        overlaps, which allows to find the only interval that could contain
+        ``value`` using a binary search.
+        """
+        interval_index = bisect.bisect_right(self._interval_lowers, value) - 1
+        return (interval_index >= 0) and (value <= self._interval_uppers[interval_index])
+
+    def _overlapping_interval_indexes(self, lower, upper):
+        """
+        Indexes ``(start, end)`` of the sorted intervals overlapping with the
+        interval from ``lower`` to ``upper``, which are the same if there are
+        none.
+        """
+        return bisect.bisect_left(self._interval_uppers, lower), bisect.bisect_right(self._interval_lowers, upper)
+
+    def _overlapping_item(self, item):
+        """
+        The first of the items added so far that overlaps with ``item`` as
+        determined by :py:meth:`_items_overlap()`, or ``None``.
+        """
+        result = None
+        lower, upper = item
+        start_index, end_index = self._overlapping_interval_indexes(
+            _NO_LOWER_LIMIT if lower is None else lower, _NO_UPPER_LIMIT if upper is None else upper
+        )
+        if start_index < end_index:
+            # Either item can contain the other one.
+            result = next(
+                existing_item
+                for existing_item in self._items
+                if self._items_overlap(existing_item, item) or self._items_overlap(item, existing_item)
+            )
+        return result
+
+    def _add_item(self, item):
+        """
+        Add ``item`` to :py:attr:`items` and merge it into the sorted
+        intervals used by :py:meth:`_is_in_intervals()`.
+        """
+        self._items.append(item)
+        lower, upper = item
+        if lower is None:
+            lower = _NO_LOWER_LIMIT
+        if upper is None:
+            upper = _NO_UPPER_LIMIT
+        # Replace all intervals overlapping with the item by a single interval.
+        start_index, end_index = self._overlapping_interval_indexes(lower, upper)
+        if start_index < end_index:
+            lower = min(lower, self._interval_lowers[start_index])
+            upper = max(upper, self._interval_uppers[end_index - 1])
+        self._interval_lowers[start_index:end_index] = [lower]
+        self._interval_uppers[start_index:end_index] = [upper]
+
+    def __contains__(self, value):
+        """
+        ``True`` if ``value`` is within the range. An empty range contains
+        all values.
+        """
+        assert value is not None
+
+        return (self._items is None) or self._is_in_intervals(value)
+
     def validate(self, name, value, location=None):
         """
         Validate that ``value`` is within the specified range.
@@ -475,23 +548,8 @@ class Range(object):
         assert name
         assert value is not None
 
-        if self._items is not None:
-            is_valid = False
-            item_index = 0
-            while not is_valid and item_index < len(self._items):
-                lower, upper = self._items[item_index]
-                if lower is None:
-                    assert upper is not None
-                    if value <= upper:
-                        is_valid = True
-                elif upper is None:
-                    if value >= lower:
-                        is_valid = True
-                elif (value >= lower) and (value <= upper):
-                    is_valid = True
-                item_index += 1
-            if not is_valid:
-                raise errors.RangeValueError("%s is %r but must be within range: %s" % (name, value, self), location)
+        if value not in self:
+            raise errors.RangeValueError("%s is %r but must be within range: %s" % (name, value, self), location)
 
 
 class DecimalRange(Range):
@@ -542,6 +600,8 @@ class DecimalRange(Range):
             description = default
             has_description = True
 
+        self._interval_lowers = []
+        self._interval_uppers = []
         if not has_description:
             # Use empty ranges.
             self._description = None
@@ -646,16 +706,16 @@ class DecimalRange(Range):
                 if range_item is not None:
                     self._precision = max_digits_after_dot
                     self._scale = max_digits_before_dot + max_digits_after_dot
-                    for item in self._items:
-                        if self._items_overlap(item, range_item):
-                            item_text = _compat.text_repr(self._repr_item(item))
-                            result_text = _compat.text_repr(self._repr_item(range_item))
-                            raise errors.InterfaceError(
-                                "overlapping parts in decimal range must be cleaned up: %s and %s"
-                                % (item_text, result_text),
-                                location,
-                            )
-                    self._items.append(range_item)
+                    item = self._overlapping_item(range_item)
+                    if item is not None:
+                        item_text = _compat.text_repr(self._repr_item(item))
+                        result_text = _compat.text_repr(self._repr_item(range_item))
+                        raise errors.InterfaceError(
+                            "overlapping parts in decimal range must be cleaned up: %s and %s"
+                            % (item_text, result_text),
+                            location,
+                        )
+                    self._add_item(range_item)
                 if _tools.is_eof_token(next_token):
                     end_reached = True
 
@@ -722,7 +782,7 @@ class DecimalRange(Range):
         """
         if item is not None:
             result = ""
-            (lower, upper) = item
+            lower, upper = item
             if lower is None:
                 assert upper is not None
                 result += _decimal_as_text(upper, self.precision)
@@ -757,22 +817,7 @@ class DecimalRange(Range):
         else:
             value_as_decimal = value
 
-        if self._items is not None:
-            is_valid = False
-            item_index = 0
-            while not is_valid and item_index < len(self._items):
-                lower, upper = self._items[item_index]
-                if lower is None:
-                    assert upper is not None
-                    if value_as_decimal <= upper:
-                        is_valid = True
-                elif upper is None:
-                    if value_as_decimal >= lower:
-                        is_valid = True
-                elif (value_as_decimal >= lower) and (value_as_decimal <= upper):
-                    is_valid = True
-                item_index += 1
-            if not is_valid:
-                raise errors.RangeValueError(
-                    "%s is %r but must be within range: %r" % (name, value_as_decimal, self), location
-                )
+        if value_as_decimal not in self:
+            raise errors.RangeValueError(
+                "%s is %r but must be within range: %r" % (name, value_as_decimal, self), location
+            )
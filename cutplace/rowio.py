@@ -17,23 +17,27 @@ format but not any :py:mod:`cutplace.fields` or :py:mod:`cutplace.checks`.
 #
 # You should have received a copy of the GNU Lesser General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import codecs
 import csv
 import datetime
 import io
+import itertools
+import mmap
+import operator
 import os
-import zipfile
-from contextlib import closing
-from xml.etree import ElementTree
-
-import xlrd
-import xlsxwriter
 
 from cutplace import _compat, _tools, data, errors
 
+# NOTE: Modules to read and write Excel and ODS are imported only when needed
+# to start faster when processing other formats.
+
 # Valid line delimiters for  `fixed_rows()`.
 _VALID_FIXED_ANY_LINE_DELIMITERS = ("\n", "\r", "\r\n")
 _VALID_FIXED_LINE_DELIMITERS = data.LINE_DELIMITER_TO_TEXT_MAP.keys()
 
+# Number of characters to read at once for `fixed_rows()`.
+_FIXED_BLOCK_SIZE = 64 * 1024
+
 # Namespaces used by OpenOffice.org documents.
 _OOO_NAMESPACES = {
     "chart": "urn:oasis:names:tc:opendocument:xmlns:chart:1.0",
@@ -66,6 +70,108 @@ _OOO_NAMESPACES = {
     "xsi": "http://www.w3.org/2001/XMLSchema-instance",
 }
 _NUMBER_COLUMNS_REPEATED = "{" + _OOO_NAMESPACES["table"] + "}number-columns-repeated"
+_NUMBER_ROWS_REPEATED = "{" + _OOO_NAMESPACES["table"] + "}number-rows-repeated"
+_OFFICE_BODY = "{" + _OOO_NAMESPACES["office"] + "}body"
+_OFFICE_SPREADSHEET = "{" + _OOO_NAMESPACES["office"] + "}spreadsheet"
+_TABLE_TABLE = "{" + _OOO_NAMESPACES["table"] + "}table"
+_TABLE_TABLE_ROW = "{" + _OOO_NAMESPACES["table"] + "}table-row"
+_TABLE_TABLE_CELL = "{" + _OOO_NAMESPACES["table"] + "}table-cell"
+_TEXT_P = "{" + _OOO_NAMESPACES["text"] + "}p"
+
+# Minimum number of empty rows or cells repeated at the end of a sheet or row
+# to be considered filler, which office applications add to pad the sheet
+# to its maximum size.
+_MIN_ODS_FILLER_REPEATED_COUNT = 256
+
+
+def _is_single_byte_encoding(encoding):
+    """
+    ``True`` if each byte encoded with ``encoding`` decodes to exactly one
+    character, so that byte offsets and character offsets are the same.
+    """
+    assert encoding is not None
+
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    result = True
+    for code in range(256):
+        decoder.reset()
+        if len(decoder.decode(bytes([code]), final=False)) != 1:
+            result = False
+            break
+    return result
+
+
+def _is_ascii_compatible_encoding(encoding):
+    """
+    ``True`` if ASCII characters encoded with ``encoding`` are represented by
+    the same single bytes and these bytes cannot be part of the encoding of
+    any other character.
+    """
+    assert encoding is not None
+
+    codec_name = codecs.lookup(encoding).name
+    if codec_name in ("utf-8", "utf-8-sig"):
+        result = True
+    elif _is_single_byte_encoding(encoding):
+        ascii_text = "".join(chr(code) for code in range(128))
+        try:
+            result = ascii_text.encode(encoding) == ascii_text.encode("ascii")
+        except UnicodeEncodeError:
+            result = False
+    else:
+        result = False
+    return result
+
+
+class _ByteRangeIO(io.RawIOBase):
+    """
+    Binary stream to read the bytes of the file at ``path`` between the
+    offsets ``start`` (inclusive) and ``end`` (exclusive).
+    """
+
+    def __init__(self, path, start, end):
+        assert path is not None
+        assert 0 <= start <= end, "start=%r, end=%r" % (start, end)
+        super().__init__()
+        self.name = path
+        self._remaining_size = end - start
+        self._file = io.open(path, "rb")
+        self._file.seek(start)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        size_to_read = min(len(buffer), self._remaining_size)
+        if size_to_read > 0:
+            data_read = self._file.read(size_to_read)
+            result = len(data_read)
+            buffer[:result] = data_read
+            self._remaining_size -= result
+        else:
+            result = 0
+        return result
+
+    def close(self):
+        if not self.closed:
+            self._file.close()
+        super().close()
+
+
+def open_byte_range(path, start, end, encoding, newline=None):
+    """
+    Text stream to read the characters stored in ``path`` between the byte
+    offsets ``start`` (inclusive) and ``end`` (exclusive) using ``encoding``.
+    The ``name`` of the stream is ``path`` so errors refer to the actual
+    file. Typically the offsets are the result of :py:func:`delimited_chunks`
+    or :py:func:`fixed_chunks`.
+
+    :param str newline: same as for :py:func:`io.open`
+    """
+    assert path is not None
+    assert encoding is not None
+
+    return io.TextIOWrapper(io.BufferedReader(_ByteRangeIO(path, start, end)), encoding=encoding, newline=newline)
 
 
 def _excel_cell_value(cell, datemode):
@@ -87,6 +193,7 @@ def _excel_cell_value(cell, datemode):
       from; refer to the :py:mod:`xlrd` documentation for more details
     """
     assert cell is not None
+    import xlrd
 
     if cell.ctype == xlrd.XL_CELL_DATE:
         cell_tuple = xlrd.xldate_as_tuple(cell.value, datemode)
@@ -124,6 +231,8 @@ def excel_rows(source_path, sheet=1):
     assert source_path is not None
     assert sheet >= 1, "sheet=%r" % sheet
 
+    import xlrd
+
     location = errors.Location(source_path, has_cell=True)
     try:
         with xlrd.open_workbook(source_path) as book:
@@ -203,85 +312,294 @@ def delimited_rows(delimited_source, data_format):
             delimited_stream.close()
 
 
-def _findall(element, xpath, namespaces):
-    # TODO: Cleanup: Replace calls to this function by direct calls to element.findall().
-    result = element.findall(xpath, namespaces)
+def delimited_chunks(delimited_path, data_format, chunk_size):
+    """
+    Byte offsets ``(start, end)`` of chunks of about ``chunk_size`` bytes
+    in the delimited file at ``delimited_path`` that can be read
+    independently of each other because they end after a line feed outside
+    of quotes. In case the file cannot be split safely, the result is
+    ``None``, for example if ``data_format`` uses an escape character
+    that differs from the quote character or an encoding that is not
+    compatible with ASCII.
+
+    Note that quote characters must only be used for quoted items, as
+    required by RFC 4180, otherwise the chunks might not match the rows.
+
+    :return: iterator of ``(start, end)`` tuples or ``None``
+    """
+    assert delimited_path is not None
+    assert data_format is not None
+    assert data_format.format == data.FORMAT_DELIMITED
+    assert chunk_size >= 1
+
+    if data_format.quoting == csv.QUOTE_NONE:
+        quote_byte = None
+    elif data_format.escape_character == data_format.quote_character:
+        quote_byte = data_format.quote_character.encode("ascii")
+    else:
+        quote_byte = False
+    if (quote_byte is False) or not _is_ascii_compatible_encoding(data_format.encoding):
+        result = None
+    else:
+        result = _delimited_chunks(delimited_path, quote_byte, chunk_size)
     return result
 
 
+def _delimited_chunks(delimited_path, quote_byte, chunk_size):
+    block_size = 1024 * 1024
+    with io.open(delimited_path, "rb") as delimited_file:
+        chunk_start = 0
+        block_start = 0
+        is_in_quotes = False
+        block = delimited_file.read(block_size)
+        while block:
+            block_end = block_start + len(block)
+            position = max(chunk_start + chunk_size - block_start, 0)
+            scanned_position = 0
+            while position < len(block):
+                if quote_byte is not None:
+                    is_in_quotes ^= bool(block.count(quote_byte, scanned_position, position) % 2)
+                    scanned_position = position
+                line_feed_position = block.find(b"\n", position)
+                if line_feed_position == -1:
+                    position = len(block)
+                else:
+                    position = line_feed_position + 1
+                    if quote_byte is not None:
+                        is_in_quotes ^= bool(block.count(quote_byte, scanned_position, position) % 2)
+                        scanned_position = position
+                    if not is_in_quotes:
+                        chunk_end = block_start + position
+                        yield chunk_start, chunk_end
+                        chunk_start = chunk_end
+                        position = max(chunk_start + chunk_size - block_start, position)
+            if quote_byte is not None:
+                is_in_quotes ^= bool(block.count(quote_byte, scanned_position) % 2)
+            block_start = block_end
+            block = delimited_file.read(block_size)
+        if chunk_start < block_start:
+            yield chunk_start, block_start
+
+
+def _ods_repeated_count(element, attribute_name, location):
+    """
+    The number of times ``element`` is repeated according to the integer
+    value of its attribute ``attribute_name``, for example
+    ``table:number-columns-repeated``.
+    """
+    repeated_text = element.get(attribute_name)
+    if repeated_text is None:
+        return 1
+    attribute_label = "table:" + attribute_name.split("}")[1]
+    try:
+        result = int(repeated_text)
+    except ValueError:
+        raise errors.DataFormatError(
+            "%s is %s but must be an integer" % (attribute_label, _compat.text_repr(repeated_text)), location
+        )
+    if result < 1:
+        raise errors.DataFormatError(
+            "%s is %s but must be at least 1" % (attribute_label, _compat.text_repr(repeated_text)), location
+        )
+    return result
+
+
+def _ods_row(table_row, location):
+    """
+    Values of the cells in ``table_row`` without trailing filler cells.
+    """
+    result = []
+    table_cells = [child for child in table_row if child.tag == _TABLE_TABLE_CELL]
+    last_cell_index = len(table_cells) - 1
+    for cell_index, table_cell in enumerate(table_cells):
+        repeated_count = _ods_repeated_count(table_cell, _NUMBER_COLUMNS_REPEATED, location)
+        cell_value = None
+        for text_p in table_cell:
+            if text_p.tag == _TEXT_P:
+                cell_value = text_p.text
+                break
+        else:
+            if (cell_index == last_cell_index) and (repeated_count >= _MIN_ODS_FILLER_REPEATED_COUNT):
+                break
+            cell_value = ""
+        if repeated_count == 1:
+            result.append(cell_value)
+        else:
+            result.extend([cell_value] * repeated_count)
+        location.advance_cell(repeated_count)
+    return result
+
+
+def _repeated_ods_rows(row, repeated_count):
+    yield row
+    for _ in range(repeated_count - 1):
+        yield list(row)
+
+
+def _pending_ods_rows(rows_and_repeated_counts):
+    for row, repeated_count in rows_and_repeated_counts:
+        yield from _repeated_ods_rows(row, repeated_count)
+
+
+def _ods_content_events(content_stream, location):
+    """
+    The ``(event, element)`` pairs of :py:func:`xml.etree.ElementTree.iterparse`
+    for the start and end of each element in ``content_stream``.
+    """
+    from xml.etree import ElementTree
+
+    content_events = ElementTree.iterparse(content_stream, ("start", "end"))
+    while True:
+        try:
+            event_and_element = next(content_events)
+        except StopIteration:
+            break
+        except ElementTree.ParseError as error:
+            raise errors.DataFormatError("cannot parse content.xml: %s" % error, location)
+        except Exception as error:
+            raise errors.DataFormatError("cannot extract content.xml for ODS spreadsheet: %s" % error, location)
+        yield event_and_element
+
+
+def _ods_content_rows(content_stream, source_ods_path, sheet):
+    location = errors.Location(source_ods_path, has_cell=True, has_sheet=True)
+    for _ in range(sheet - 1):
+        location.advance_sheet()
+    table_count = 0
+    is_in_sheet = False
+    # Stack of elements from the root to the currently parsed element.
+    elements = []
+    # Empty rows and their repeated counts, which are only yielded if another
+    # row follows or there is no filler at the end of the sheet.
+    pending_empty_rows_and_counts = []
+    for event, element in _ods_content_events(content_stream, errors.Location(source_ods_path)):
+        if event == "start":
+            is_table = (
+                (len(elements) == 3)
+                and (element.tag == _TABLE_TABLE)
+                and (elements[1].tag == _OFFICE_BODY)
+                and (elements[2].tag == _OFFICE_SPREADSHEET)
+            )
+            if is_table:
+                table_count += 1
+                is_in_sheet = table_count == sheet
+            elements.append(element)
+        else:
+            elements.pop()
+            depth = len(elements)
+            if is_in_sheet and (depth == 3):
+                break
+            if is_in_sheet and (depth == 4) and (element.tag == _TABLE_TABLE_ROW):
+                repeated_count = _ods_repeated_count(element, _NUMBER_ROWS_REPEATED, location)
+                row = _ods_row(element, location)
+                if all(value == "" for value in row):
+                    pending_empty_rows_and_counts.append((row, repeated_count))
+                else:
+                    yield from _pending_ods_rows(pending_empty_rows_and_counts)
+                    pending_empty_rows_and_counts = []
+                    yield from _repeated_ods_rows(row, repeated_count)
+                location.advance_line(repeated_count)
+            if 1 <= depth <= 4:
+                # Remove elements that have been processed from the tree so that memory consumption stays flat.
+                elements[-1].remove(element)
+    has_filler = any(
+        repeated_count >= _MIN_ODS_FILLER_REPEATED_COUNT for _, repeated_count in pending_empty_rows_and_counts
+    )
+    if not has_filler:
+        yield from _pending_ods_rows(pending_empty_rows_and_counts)
+    if table_count < sheet:
+        error_message = "ODS must contain at least %d sheet(s) instead of just %d" % (sheet, table_count)
+        raise errors.DataFormatError(error_message, errors.Location(source_ods_path))
+
+
 def ods_rows(source_ods_path, sheet=1):
     """
     Rows stored in ODS document ``source_ods_path`` in ``sheet``.
 
+    The content of the document is parsed while reading the rows, so even
+    large documents need only little memory. Repeated rows and cells are
+    expanded except for a large number of empty ones at the end of the sheet
+    or a row, which office applications add as filler.
+
     :raises cutplace.errors.DataFormarError: if ``source_ods_path`` is not \
       a valid ODS file.
     """
+    assert source_ods_path is not None
     assert sheet >= 1
 
-    def ods_content_root():
-        """
-        `ElementTree` for content.xml in `source_ods_path`.
-        """
-        assert source_ods_path is not None
+    import zipfile
 
-        location = errors.Location(source_ods_path)
+    location = errors.Location(source_ods_path)
+    try:
+        zip_archive = zipfile.ZipFile(source_ods_path, "r")
+    except Exception as error:
+        raise errors.DataFormatError("cannot uncompress ODS spreadsheet: %s" % error, location)
+    with zip_archive:
         try:
-            # HACK: Use ``closing()`` because of Python 2.6.
-            with closing(zipfile.ZipFile(source_ods_path, "r")) as zip_archive:
-                try:
-                    xml_data = zip_archive.read("content.xml")
-                except Exception as error:
-                    raise errors.DataFormatError("cannot extract content.xml for ODS spreadsheet: %s" % error, location)
-        except errors.DataFormatError:
-            raise
+            content_stream = zip_archive.open("content.xml")
         except Exception as error:
-            raise errors.DataFormatError("cannot uncompress ODS spreadsheet: %s" % error, location)
+            raise errors.DataFormatError("cannot extract content.xml for ODS spreadsheet: %s" % error, location)
+        with content_stream:
+            yield from _ods_content_rows(content_stream, source_ods_path, sheet)
 
-        with io.BytesIO(xml_data) as xml_stream:
-            try:
-                tree = ElementTree.parse(xml_stream)
-            except Exception as error:
-                raise errors.DataFormatError("cannot parse content.xml: %s" % error, location)
 
-        return tree.getroot()
+def _fixed_row_splitter(field_name_and_lengths):
+    """
+    Function that splits the text of a fixed row into a list of the values
+    of each field in ``field_name_and_lengths``.
+    """
+    field_end_offsets = list(itertools.accumulate(length for _, length in field_name_and_lengths))
+    field_start_offsets = [0] + field_end_offsets[:-1]
+    if len(field_name_and_lengths) == 1:
 
-    content_root = ods_content_root()
-    table_elements = list(
-        _findall(content_root, "office:body/office:spreadsheet/table:table", namespaces=_OOO_NAMESPACES)
-    )
-    table_count = len(table_elements)
-    if table_count < sheet:
-        error_message = "ODS must contain at least %d sheet(s) instead of just %d" % (sheet, table_count)
-        raise errors.DataFormatError(error_message, errors.Location(source_ods_path))
-    table_element = table_elements[sheet - 1]
-    location = errors.Location(source_ods_path, has_cell=True, has_sheet=True)
-    for _ in range(sheet - 1):
-        location.advance_sheet()
-    for table_row in _findall(table_element, "table:table-row", namespaces=_OOO_NAMESPACES):
-        row = []
-        for table_cell in _findall(table_row, "table:table-cell", namespaces=_OOO_NAMESPACES):
-            repeated_text = table_cell.attrib.get(_NUMBER_COLUMNS_REPEATED, "1")
-            try:
-                repeated_count = int(repeated_text)
-                if repeated_count < 1:
-                    raise errors.DataFormatError(
-                        "table:number-columns-repeated is %s but must be at least 1" % _compat.text_repr(repeated_text),
-                        location,
-                    )
-            except ValueError:
-                raise errors.DataFormatError(
-                    "table:number-columns-repeated is %s but must be an integer" % _compat.text_repr(repeated_text),
-                    location,
-                )
-            text_p = table_cell.find("text:p", namespaces=_OOO_NAMESPACES)
-            if text_p is None:
-                cell_value = ""
-            else:
-                cell_value = text_p.text
-            row.extend([cell_value] * repeated_count)
-            location.advance_cell(repeated_count)
-        yield row
-        location.advance_line()
+        def split_fixed_row(row_text):
+            return [row_text]
+
+    else:
+        row_items = operator.itemgetter(
+            *[slice(start, end) for start, end in zip(field_start_offsets, field_end_offsets)]
+        )
+
+        def split_fixed_row(row_text):
+            return list(row_items(row_text))
+
+    return split_fixed_row
+
+
+def _fixed_incomplete_row_error(remaining_text, field_name_and_lengths, location):
+    """
+    The error describing the first field in ``remaining_text`` of a fixed
+    row at the end of the input that is too short for all fields in
+    ``field_name_and_lengths``. The column of ``location`` is advanced to
+    the start of this field.
+    """
+    field_index = 0
+    field_start_offset = 0
+    for field_name, field_length in field_name_and_lengths:
+        item = remaining_text[field_start_offset : field_start_offset + field_length]
+        if len(item) == field_length:
+            location.advance_column(field_length)
+            field_index += 1
+            field_start_offset += field_length
+        elif item == "":
+            assert field_index > 0
+            names = [name for name, _ in field_name_and_lengths]
+            lengths = [length for _, length in field_name_and_lengths]
+            previous_field_index = field_index - 1
+            characters_needed_count = sum(lengths[field_index:])
+            list_of_missing_field_names = _tools.human_readable_list(names[field_index:], "and")
+            return errors.DataFormatError(
+                "after field '%s' %d characters must follow for: %s"
+                % (names[previous_field_index], characters_needed_count, list_of_missing_field_names),
+                location,
+            )
+        else:
+            return errors.DataFormatError(
+                "cannot read field '%s': need %d characters but found only %d: %s"
+                % (field_name, field_length, len(item), _compat.text_repr(item)),
+                location,
+            )
+    assert False, "remaining_text=%r must be shorter than all fields" % remaining_text
 
 
 def fixed_rows(fixed_source, encoding, field_name_and_lengths, line_delimiter="any"):
@@ -293,9 +611,18 @@ def fixed_rows(fixed_source, encoding, field_name_and_lengths, line_delimiter="a
     and ``'\r\n'``, in which case other values result in a
     `errors.DataFormatError`. Additionally ``'any'`` accepts any of the
     previous values.
+
+    The input is read in large blocks from which the rows are sliced, so
+    even rows with many fields need only few calls to ``read()``. If
+    ``fixed_source`` is a path and there is no line delimiter, the rows are
+    read using :py:func:`mapped_fixed_rows` provided that ``encoding`` uses
+    a single byte per character. Once a block of rows contains a carriage
+    return, which reading in text mode would translate, the remaining rows
+    are read in text mode.
     """
     assert fixed_source is not None
     assert encoding is not None
+    assert len(field_name_and_lengths) >= 1
     for name, length in field_name_and_lengths:
         assert name is not None
         assert length >= 1, "length for %s must be at least 1 but is %s" % (name, length)
@@ -304,127 +631,254 @@ def fixed_rows(fixed_source, encoding, field_name_and_lengths, line_delimiter="a
         _VALID_FIXED_LINE_DELIMITERS,
     )
 
-    # Predefine variable for access in local function.
-    location = errors.Location(fixed_source, has_column=True)
-    fixed_file = None
-    # HACK: list with at most 1 character to be unread after a line feed. We
-    # need to use a list so `_has_data_after_skipped_line_delimiter` can
-    # modify its contents.
-    unread_character_after_line_delimiter = [None]
-
-    def _has_data_after_skipped_line_delimiter():
-        """
-        If `fixed_file` has data, assume they are a line delimiter as specified
-        by `line_delimiter` and read and validate them.
-
-        In case `line_delimiter` is `None`, the result is always ``True`` even
-        if the input has already reached its end.
-        """
-        assert location is not None
-        assert line_delimiter in _VALID_FIXED_LINE_DELIMITERS
-        assert unread_character_after_line_delimiter[0] is None
-
-        result = True
-        if line_delimiter is not None:
-            if line_delimiter == "\r\n":
-                actual_line_delimiter = fixed_file.read(2)
-            else:
-                assert line_delimiter in ("\n", "\r", "any")
-                actual_line_delimiter = fixed_file.read(1)
-            if actual_line_delimiter == "":
-                result = False
-            elif line_delimiter == "any":
-                if actual_line_delimiter == "\r":
-                    # Process the optional '\n' for 'any'.
-                    anticipated_linefeed = fixed_file.read(1)
-                    if anticipated_linefeed == "\n":
-                        actual_line_delimiter += anticipated_linefeed
-                    elif anticipated_linefeed == "":
-                        result = False
-                    else:
-                        # Unread the previous character because it is unrelated to line delimiters.
-                        unread_character_after_line_delimiter[0] = anticipated_linefeed
-                if actual_line_delimiter not in _VALID_FIXED_ANY_LINE_DELIMITERS:
-                    valid_line_delimiters = _tools.human_readable_list(_VALID_FIXED_ANY_LINE_DELIMITERS)
-                    raise errors.DataFormatError(
-                        "line delimiter is %s but must be one of: %s"
-                        % (_compat.text_repr(actual_line_delimiter), valid_line_delimiters),
-                        location,
-                    )
-            elif actual_line_delimiter != line_delimiter:
-                raise errors.DataFormatError(
-                    "line delimiter is %s but must be %s"
-                    % (_compat.text_repr(actual_line_delimiter), _compat.text_repr(line_delimiter)),
-                    location,
-                )
-        return result
+    if isinstance(fixed_source, str) and (line_delimiter is None) and _is_single_byte_encoding(encoding):
+        yield from _fixed_rows_without_line_delimiter(fixed_source, encoding, field_name_and_lengths)
+        return
 
+    location = errors.Location(fixed_source, has_column=True)
     if isinstance(fixed_source, str):
         fixed_file = io.open(fixed_source, "r", encoding=encoding)
         is_opened = True
     else:
         fixed_file = fixed_source
         is_opened = False
+    yield from _text_fixed_rows(fixed_file, is_opened, location, field_name_and_lengths, line_delimiter)
+
+
+def _text_fixed_rows(fixed_file, is_opened, location, field_name_and_lengths, line_delimiter):
+    """
+    Rows read from the text stream ``fixed_file`` as described by
+    :py:func:`fixed_rows`, which is closed at the end if ``is_opened``.
+    """
+    row_width = sum(length for _, length in field_name_and_lengths)
+    split_fixed_row = _fixed_row_splitter(field_name_and_lengths)
+    # Maximum number of characters after a row needed to detect the line delimiter.
+    line_delimiter_lookahead = 0 if line_delimiter is None else 2
 
-    has_data = True
+    def _line_delimiter_length(text, position):
+        """
+        The number of characters of the line delimiter at ``position`` in
+        ``text``, which must contain all characters up to the end of the input
+        or at least 2 characters after ``position``.
+        """
+        assert line_delimiter is not None
+        if line_delimiter == "\r\n":
+            actual_line_delimiter = text[position : position + 2]
+        else:
+            assert line_delimiter in ("\n", "\r", "any")
+            actual_line_delimiter = text[position : position + 1]
+        if line_delimiter == "any":
+            if (actual_line_delimiter == "\r") and (text[position + 1 : position + 2] == "\n"):
+                # Process the optional '\n' for 'any'.
+                actual_line_delimiter = "\r\n"
+            if (actual_line_delimiter != "") and (actual_line_delimiter not in _VALID_FIXED_ANY_LINE_DELIMITERS):
+                valid_line_delimiters = _tools.human_readable_list(_VALID_FIXED_ANY_LINE_DELIMITERS)
+                raise errors.DataFormatError(
+                    "line delimiter is %s but must be one of: %s"
+                    % (_compat.text_repr(actual_line_delimiter), valid_line_delimiters),
+                    location,
+                )
+        elif (actual_line_delimiter != "") and (actual_line_delimiter != line_delimiter):
+            raise errors.DataFormatError(
+                "line delimiter is %s but must be %s"
+                % (_compat.text_repr(actual_line_delimiter), _compat.text_repr(line_delimiter)),
+                location,
+            )
+        return len(actual_line_delimiter)
+
+    # Read the input in blocks and slice rows from them instead of reading each field separately.
+    block_size = max(_FIXED_BLOCK_SIZE, row_width + line_delimiter_lookahead)
+    text = ""
+    position = 0
+    is_at_end = False
     try:
-        while has_data:
-            field_index = 0
-            row = []
-            for field_name, field_length in field_name_and_lengths:
-                if unread_character_after_line_delimiter[0] is None:
-                    item = fixed_file.read(field_length)
-                else:
-                    assert len(unread_character_after_line_delimiter) == 1
-                    item = unread_character_after_line_delimiter[0]
-                    if field_length >= 2:
-                        item += fixed_file.read(field_length - 1)
-                    unread_character_after_line_delimiter[0] = None
-                assert unread_character_after_line_delimiter[0] is None
+        while True:
+            while not is_at_end and (len(text) - position < row_width + line_delimiter_lookahead):
+                block = fixed_file.read(block_size)
                 if not is_opened:
                     # Ensure that the input is a text file, `io.StringIO` or something similar. Binary files,
                     # `io.BytesIO` and the like cannot be used because the return bytes instead of strings.
-                    # NOTE: We do not need to use _compat.text_repr(item) because type `unicode` does not fail here.
-                    assert isinstance(item, str), "%s: fixed_source must yield strings but got type %s, value %r" % (
+                    assert isinstance(block, str), "%s: fixed_source must yield strings but got type %s, value %r" % (
                         location,
-                        type(item),
-                        item,
+                        type(block),
+                        block,
                     )
-                item_length = len(item)
-                if item_length == 0:
-                    if field_index > 0:
-                        names = [name for name, _ in field_name_and_lengths]
-                        lengths = [length for _, length in field_name_and_lengths]
-                        previous_field_index = field_index - 1
-                        characters_needed_count = sum(lengths[field_index:])
-                        list_of_missing_field_names = _tools.human_readable_list(names[field_index:], "and")
-                        raise errors.DataFormatError(
-                            "after field '%s' %d characters must follow for: %s"
-                            % (names[previous_field_index], characters_needed_count, list_of_missing_field_names),
-                            location,
-                        )
-                    # End of input reached.
-                    has_data = False
-                elif item_length == field_length:
-                    row.append(item)
-                    location.advance_column(field_length)
-                    field_index += 1
+                if block == "":
+                    is_at_end = True
                 else:
-                    raise errors.DataFormatError(
-                        "cannot read field '%s': need %d characters but found only %d: %s"
-                        % (field_name, field_length, item_length, _compat.text_repr(item)),
-                        location,
-                    )
-            if has_data and not _has_data_after_skipped_line_delimiter():
-                has_data = False
-            if len(row) > 0:
-                yield row
-                location.advance_line()
+                    text = text[position:] + block
+                    position = 0
+            remaining_length = len(text) - position
+            if remaining_length == 0:
+                break
+            if remaining_length < row_width:
+                raise _fixed_incomplete_row_error(text[position:], field_name_and_lengths, location)
+            row_text = text[position : position + row_width]
+            row = split_fixed_row(row_text)
+            location.advance_column(row_width)
+            position += row_width
+            if line_delimiter is not None:
+                line_delimiter_length = _line_delimiter_length(text, position)
+                # Only the last row can end without line delimiter.
+                assert (line_delimiter_length >= 1) or is_at_end
+                position += line_delimiter_length
+            yield row
+            location.advance_line()
     finally:
         if is_opened:
             fixed_file.close()
 
 
+def _fixed_rows_without_line_delimiter(fixed_path, encoding, field_name_and_lengths, start_row=0, end_row=None):
+    """
+    Rows from index ``start_row`` up to but excluding ``end_row`` of the
+    file at ``fixed_path`` without line delimiter as read by
+    :py:func:`fixed_rows`. The rows are read using
+    :py:func:`mapped_fixed_rows` until a block of rows contains a carriage
+    return, from where on they are read in text mode, which translates
+    carriage returns the same way as for other sources. The lines of
+    locations in errors are relative to ``start_row``.
+    """
+    location = errors.Location(fixed_path, has_column=True)
+    carriage_return_row = yield from _mapped_fixed_rows(
+        fixed_path, encoding, field_name_and_lengths, start_row, end_row, location, True
+    )
+    if carriage_return_row is not None:
+        row_width = sum(length for _, length in field_name_and_lengths)
+        text_end = os.path.getsize(fixed_path) if end_row is None else end_row * row_width
+        text_file = open_byte_range(fixed_path, carriage_return_row * row_width, text_end, encoding)
+        yield from _text_fixed_rows(text_file, True, location, field_name_and_lengths, None)
+
+
+def mapped_fixed_rows(fixed_path, encoding, field_name_and_lengths, start_row=0, end_row=None):
+    """
+    Rows found in the file at ``fixed_path`` containing fixed data without
+    line delimiter, similar to :py:func:`fixed_rows`. Because all rows have
+    the same width in bytes, the file is memory mapped and the position of
+    each row is computed from its index. Consequently this only works for
+    ``encoding`` using a single byte per character.
+
+    Only the rows from index ``start_row`` up to but excluding ``end_row``
+    are read, which allows to read any part of even a large file without
+    having to read the rows before it.
+
+    :param int start_row: index of the first row to read starting with 0
+    :param end_row: index after the last row to read or ``None`` to read \
+      all rows up to the end of the file
+    :raises cutplace.errors.DataFormatError: if the last row is incomplete
+    """
+    assert fixed_path is not None
+    assert encoding is not None
+    assert _is_single_byte_encoding(encoding), "encoding=%r" % encoding
+    assert len(field_name_and_lengths) >= 1
+    assert start_row >= 0
+    assert (end_row is None) or (end_row >= start_row), "start_row=%d, end_row=%r" % (start_row, end_row)
+
+    location = errors.Location(fixed_path, has_column=True)
+    if start_row >= 1:
+        location.advance_line(start_row)
+    yield from _mapped_fixed_rows(fixed_path, encoding, field_name_and_lengths, start_row, end_row, location, False)
+
+
+def _mapped_fixed_rows(
+    fixed_path, encoding, field_name_and_lengths, start_row, end_row, location, is_stopping_at_carriage_return
+):
+    """
+    Rows as described by :py:func:`mapped_fixed_rows` with ``location``
+    advanced for each row. If ``is_stopping_at_carriage_return``, stop
+    before the first block of rows containing a carriage return.
+
+    :return: the index of the row where reading stopped because of a \
+      carriage return or ``None`` if all rows have been read
+    """
+    row_width = sum(length for _, length in field_name_and_lengths)
+    split_fixed_row = _fixed_row_splitter(field_name_and_lengths)
+    carriage_return = "\r".encode(encoding)
+    with io.open(fixed_path, "rb") as fixed_file:
+        fixed_size = os.fstat(fixed_file.fileno()).st_size
+        # NOTE: Empty files cannot be mapped.
+        if fixed_size >= 1:
+            with mmap.mmap(fixed_file.fileno(), 0, access=mmap.ACCESS_READ) as fixed_map:
+                with memoryview(fixed_map) as fixed_view:
+                    complete_row_count = fixed_size // row_width
+                    rows_end = complete_row_count if end_row is None else min(end_row, complete_row_count)
+                    # Decode blocks of rows at once instead of each row separately.
+                    rows_per_block = max(1, _FIXED_BLOCK_SIZE // row_width)
+                    row_index = start_row
+                    while row_index < rows_end:
+                        block_row_count = min(rows_per_block, rows_end - row_index)
+                        block_start = row_index * row_width
+                        block_end = block_start + block_row_count * row_width
+                        if (
+                            is_stopping_at_carriage_return
+                            and fixed_map.find(carriage_return, block_start, block_end) != -1
+                        ):
+                            return row_index
+                        block_text = str(fixed_view[block_start:block_end], encoding)
+                        for row_start in range(0, len(block_text), row_width):
+                            yield split_fixed_row(block_text[row_start : row_start + row_width])
+                            location.advance_line()
+                        row_index += block_row_count
+                    has_incomplete_row = (fixed_size % row_width != 0) and (start_row <= complete_row_count)
+                    if has_incomplete_row and ((end_row is None) or (end_row > complete_row_count)):
+                        remaining_start = complete_row_count * row_width
+                        if is_stopping_at_carriage_return and fixed_map.find(carriage_return, remaining_start) != -1:
+                            return complete_row_count
+                        remaining_text = str(fixed_view[remaining_start:], encoding)
+                        raise _fixed_incomplete_row_error(remaining_text, field_name_and_lengths, location)
+    return None
+
+
+def fixed_chunks(fixed_path, encoding, field_name_and_lengths, line_delimiter, chunk_size):
+    """
+    Byte offsets ``(start, end)`` of chunks of about ``chunk_size`` bytes
+    in the fixed file at ``fixed_path`` that start with a new row and can
+    consequently be read independently of each other. The offsets are
+    computed from the row width, so this only works for ``encoding`` using
+    a single byte per character. The line delimiter after the first row
+    is assumed to be used for all rows; a chunk boundary not preceded by it
+    results in ``None``, as does a multi byte ``encoding``.
+
+    :return: list of ``(start, end)`` tuples or ``None``
+    """
+    assert fixed_path is not None
+    assert encoding is not None
+    assert line_delimiter in _VALID_FIXED_LINE_DELIMITERS
+    assert chunk_size >= 1
+
+    result = None
+    if _is_single_byte_encoding(encoding):
+        row_width = sum(length for _, length in field_name_and_lengths)
+        with io.open(fixed_path, "rb") as fixed_file:
+            fixed_size = fixed_file.seek(0, io.SEEK_END)
+            if line_delimiter is None:
+                row_delimiter = b""
+            else:
+                fixed_file.seek(row_width)
+                possible_row_delimiter = fixed_file.read(2)
+                if possible_row_delimiter == b"\r\n":
+                    row_delimiter = possible_row_delimiter
+                elif possible_row_delimiter[:1] in (b"\n", b"\r"):
+                    row_delimiter = possible_row_delimiter[:1]
+                else:
+                    row_delimiter = None
+            if row_delimiter is not None:
+                row_size = row_width + len(row_delimiter)
+                chunk_size = max(1, chunk_size // row_size) * row_size
+                result = []
+                chunk_start = 0
+                while (chunk_start < fixed_size) and (result is not None):
+                    chunk_end = min(chunk_start + chunk_size, fixed_size)
+                    if (chunk_end < fixed_size) and row_delimiter:
+                        fixed_file.seek(chunk_end - len(row_delimiter))
+                        if fixed_file.read(len(row_delimiter)) != row_delimiter:
+                            result = None
+                    if result is not None:
+                        result.append((chunk_start, chunk_end))
+                        chunk_start = chunk_end
+    return result
+
+
 def auto_rows(source):
     """
     Determine basic data format of `source` based on heuristics and return its contents.
@@ -652,6 +1106,8 @@ class XlsxRowWriter(AbstractRowWriter):
         self._target_stream = None
         self._has_opened_target_stream = False
         self._location = errors.Location(self.target_path, has_cell=True)
+        import xlsxwriter
+
         self._workbook = xlsxwriter.Workbook(self.target_path)
         self._worksheet = self._workbook.add_worksheet()
 
@@ -0,0 +1,245 @@
+"""
+Local HTTP server to validate data without paying for starting Python,
+importing modules and reading the CID on each validation. CIDs are read
+once and kept in a :py:class:`CidRegistry` until their file changes.
+
+To validate a data file, post to ``/validate`` with the paths of the CID
+and data as query parameters, for example::
+
+  curl -X POST 'http://localhost:8778/validate?cid=cid_customers.ods&data=customers.csv'
+
+Instead of a data path, the data can also be sent as request body::
+
+  curl --data-binary @customers.csv 'http://localhost:8778/validate?cid=cid_customers.ods'
+
+The response is a JSON object like::
+
+  {"cid": "cid_customers.ods", "data": "customers.csv", "is_valid": false,
+   "accepted_rows": 2, "rejected_rows": 1, "error_count": 1,
+   "errors": ["customers.csv (R3C1): cannot accept field ..."]}
+
+Relative paths refer to the current folder of the server.
+"""
+
+# Copyright (C) 2009-2021 Thomas Aglassinger
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License
+# for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import http.server
+import io
+import json
+import logging
+import os
+import tempfile
+import urllib.parse
+
+from cutplace import data, errors, interface, rowio, validio
+
+DEFAULT_HOST = "localhost"
+DEFAULT_PORT = 8778
+#: Maximum number of errors a response of the server lists.
+DEFAULT_MAX_ERROR_COUNT = 100
+
+_VALIDATE_PATH = "/validate"
+
+_DATA_FORMAT_TO_SUFFIX_MAP = {
+    data.FORMAT_EXCEL: ".xls",
+    data.FORMAT_ODS: ".ods",
+}
+
+_log = logging.getLogger("cutplace.server")
+
+
+class CidRegistry(object):
+    """
+    Registry of CIDs read from files, which are read again only if the
+    modification time or size of the file or any file the CID reads choices
+    from changed.
+    """
+
+    def __init__(self):
+        self._cid_path_to_stat_and_cid_map = {}
+
+    def cid(self, cid_path):
+        """
+        The :py:class:`cutplace.interface.Cid` stored in ``cid_path``.
+
+        :raises cutplace.errors.InterfaceError: if the CID is broken
+        :raises EnvironmentError: if ``cid_path`` cannot be read
+        """
+        assert cid_path is not None
+
+        full_cid_path = os.path.abspath(cid_path)
+        cid_stat = os.stat(full_cid_path)
+        cid_stat_key = (cid_stat.st_mtime_ns, cid_stat.st_size)
+        stat_and_cid = self._cid_path_to_stat_and_cid_map.get(full_cid_path)
+        is_outdated = (stat_and_cid is None) or (
+            stat_and_cid[0] != (cid_stat_key, interface._stat_keys(stat_and_cid[1].choices_paths))
+        )
+        if is_outdated:
+            _log.info('read CID from "%s"', cid_path)
+            result = interface.Cid()
+            result.read(cid_path, rowio.auto_rows(full_cid_path))
+            stat_key = (cid_stat_key, interface._stat_keys(result.choices_paths))
+            self._cid_path_to_stat_and_cid_map[full_cid_path] = (stat_key, result)
+        else:
+            result = stat_and_cid[1]
+        return result
+
+    @property
+    def cid_paths(self):
+        """
+        Sorted list of the full paths of all CIDs in the registry.
+        """
+        return sorted(self._cid_path_to_stat_and_cid_map.keys())
+
+
+def validation_result(cid, data_stream_or_path, max_error_count=DEFAULT_MAX_ERROR_COUNT):
+    """
+    Validate ``data_stream_or_path`` using ``cid`` and return the result
+    as ``dict`` with the keys ``is_valid``, ``accepted_rows``,
+    ``rejected_rows``, ``error_count`` and ``errors`` containing the first
+    ``max_error_count`` error messages.
+
+    :raises EnvironmentError: if ``data_stream_or_path`` cannot be read
+    """
+    assert cid is not None
+    assert data_stream_or_path is not None
+    assert max_error_count >= 0
+
+    error_messages = []
+    error_count = 0
+    reader = validio.Reader(cid, data_stream_or_path, on_error="yield")
+    try:
+        for row_or_error in reader.rows():
+            if isinstance(row_or_error, errors.DataError):
+                error_count += 1
+                if len(error_messages) < max_error_count:
+                    error_messages.append(str(row_or_error))
+        reader.close()
+    except errors.CutplaceError as error:
+        error_count += 1
+        if len(error_messages) < max_error_count:
+            error_messages.append(str(error))
+    finally:
+        # Release the resources of the checks even if the data were broken.
+        for check in cid.check_map.values():
+            check.cleanup()
+    return {
+        "is_valid": error_count == 0,
+        "accepted_rows": reader.accepted_rows_count,
+        "rejected_rows": reader.rejected_rows_count,
+        "error_count": error_count,
+        "errors": error_messages,
+    }
+
+
+class _ValidationRequestHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):  # noqa: N802
+        if urllib.parse.urlsplit(self.path).path == "/":
+            self._send_json(200, {"cids": self.server.cid_registry.cid_paths})
+        else:
+            self._send_json(404, {"error": "path must be %s but is: %s" % (_VALIDATE_PATH, self.path)})
+
+    def do_POST(self):  # noqa: N802
+        split_path = urllib.parse.urlsplit(self.path)
+        if split_path.path != _VALIDATE_PATH:
+            self._send_json(404, {"error": "path must be %s but is: %s" % (_VALIDATE_PATH, split_path.path)})
+            return
+        query = urllib.parse.parse_qs(split_path.query)
+        cid_path = query.get("cid", [None])[0]
+        data_path = query.get("data", [None])[0]
+        content_length = self.headers.get("Content-Length", "0")
+        try:
+            body_size = int(content_length)
+        except ValueError:
+            self._send_json(400, {"error": "header Content-Length must be a number but is: %r" % content_length})
+            return
+        body = self.rfile.read(body_size) if body_size > 0 else None
+        if cid_path is None:
+            self._send_json(400, {"error": "query parameter 'cid' must be specified"})
+        elif (data_path is None) == (body is None):
+            self._send_json(400, {"error": "either query parameter 'data' or a request body must be specified"})
+        else:
+            try:
+                cid = self.server.cid_registry.cid(cid_path)
+                if data_path is not None:
+                    result = validation_result(cid, data_path, self.server.max_error_count)
+                else:
+                    result = _validation_result_for_body(cid, body, self.server.max_error_count)
+            except errors.CutplaceError as error:
+                self._send_json(400, {"error": str(error)})
+            except UnicodeDecodeError as error:
+                self._send_json(400, {"error": "cannot decode request body: %s" % error})
+            except (EnvironmentError, OSError) as error:
+                self._send_json(400, {"error": "cannot read file: %s" % error})
+            else:
+                result["cid"] = cid_path
+                result["data"] = data_path
+                self._send_json(200, result)
+
+    def _send_json(self, status, result):
+        content = json.dumps(result).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        _log.debug("%s - " + format, self.address_string(), *args)
+
+
+def _validation_result_for_body(cid, body, max_error_count):
+    data_format = cid.data_format
+    if data_format.format in (data.FORMAT_DELIMITED, data.FORMAT_FIXED):
+        newline = "" if data_format.format == data.FORMAT_DELIMITED else None
+        with io.StringIO(body.decode(data_format.encoding), newline=newline) as data_stream:
+            result = validation_result(cid, data_stream, max_error_count)
+    else:
+        # Spreadsheets are read from files, so store the body in a temporary one.
+        data_fd, data_path = tempfile.mkstemp(_DATA_FORMAT_TO_SUFFIX_MAP[data_format.format], "cutplace_")
+        try:
+            with os.fdopen(data_fd, "wb") as data_file:
+                data_file.write(body)
+            result = validation_result(cid, data_path, max_error_count)
+        finally:
+            os.remove(data_path)
+    return result
+
+
+class ValidationServer(http.server.HTTPServer):
+    """
+    HTTP server validating data posted to ``/validate`` as described in
+    :py:mod:`cutplace.server`.
+
+    Requests are processed one at a time because the checks of a CID keep
+    their state while validating.
+    """
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, max_error_count=DEFAULT_MAX_ERROR_COUNT):
+        super().__init__((host, port), _ValidationRequestHandler)
+        self.cid_registry = CidRegistry()
+        self.max_error_count = max_error_count
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT):
+    """
+    Validate data posted to ``http://host:port/validate`` until interrupted.
+    """
+    with ValidationServer(host, port) as server:
+        _log.info("serve validations at http://%s:%d%s", host, server.server_address[1], _VALIDATE_PATH)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            _log.info("stop serving validations")
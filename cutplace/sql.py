@@ -1,5 +1,6 @@
 """
-Methods to create sql statements from existing fields.
+Methods to create sql statements from existing fields and to load validated
+data into SQLite databases.
 """
 
 # Copyright (C) 2009-2013 Thomas Aglassinger
@@ -19,8 +20,12 @@ Methods to create sql statements from existing fields.
 import io
 import logging
 import os.path
+import re
+import sqlite3
+import time
+from contextlib import closing
 
-from cutplace import rowio
+from cutplace import fields, rowio
 
 # TODO: Move to module ``ranges``.
 MAX_TINYINT = 2**8 - 1  # NOTE: Tinyint really is unsigned.
@@ -39,359 +44,388 @@ PL = "PL/SQL"
 
 _INT_TYPES = set(["bigint", "int", "smallint", "tinyint"])
 
+#: Default number of rows :py:func:`load_sqlite` inserts at once.
+DEFAULT_LOAD_BATCH_SIZE = 1000
+#: Default number of rows after which :py:func:`load_sqlite` commits; 0 means all rows are committed at the end.
+DEFAULT_LOAD_TRANSACTION_SIZE = 0
+
+# Pragmas to speed up bulk loading at the expense of losing the database if the operating system crashes meanwhile.
+_SQLITE_BULK_LOAD_PRAGMAS = (
+    "pragma synchronous = off",
+    "pragma journal_mode = memory",
+    "pragma cache_size = -65536",
+)
+
 _log = logging.getLogger("cutplace")
 
+# Keywords of the dialects as tuples, which are cheap to import; the sets
+# used to look them up are built only when a dialect first needs them.
+_ANSI_KEYWORD_NAMES = (
+    "absolute",
+    "action",
+    "add",
+    "after",
+    "all",
+    "allocate",
+    "alter",
+    "and",
+    "any",
+    "are",
+    "array",
+    "as",
+    "asc",
+    "asensitive",
+    "assertion",
+    "asymmetric",
+    "at",
+    "atomic",
+    "authorization",
+    "avg",
+    "before",
+    "begin",
+    "between",
+    "bigint",
+    "binary",
+    "bit",
+    "bit_length",
+    "blob",
+    "boolean",
+    "both",
+    "breadth",
+    "by",
+    "call",
+    "called",
+    "cascade",
+    "cascaded",
+    "case",
+    "cast",
+    "catalog",
+    "char",
+    "character",
+    "character_length",
+    "char_length",
+    "check",
+    "clob",
+    "close",
+    "coalesce",
+    "collate",
+    "collation",
+    "column",
+    "commit",
+    "condition",
+    "connect",
+    "connection",
+    "constraint",
+    "constraints",
+    "constructor",
+    "contains",
+    "continue",
+    "convert",
+    "corresponding",
+    "count",
+    "create",
+    "cross",
+    "cube",
+    "current",
+    "current_date",
+    "current_default_transform_group",
+    "current_path",
+    "current_role",
+    "current_time",
+    "current_timestamp",
+    "current_transform_group_for_type",
+    "current_user",
+    "cursor",
+    "cycle",
+    "data",
+    "date",
+    "day",
+    "deallocate",
+    "dec",
+    "decimal",
+    "declare",
+    "default",
+    "deferrable",
+    "deferred",
+    "delete",
+    "depth",
+    "deref",
+    "desc",
+    "describe",
+    "descriptor",
+    "deterministic",
+    "diagnostics",
+    "disconnect",
+    "distinct",
+    "do",
+    "domain",
+    "double",
+    "drop",
+    "dynamic",
+    "each",
+    "element",
+    "else",
+    "elseif",
+    "end",
+    "equals",
+    "escape",
+    "except",
+    "exception",
+    "exec",
+    "execute",
+    "exists",
+    "exit",
+    "external",
+    "extract",
+    "false",
+    "fetch",
+    "filter",
+    "first",
+    "float",
+    "for",
+    "foreign",
+    "found",
+    "free",
+    "from",
+    "full",
+    "function",
+    "general",
+    "get",
+    "global",
+    "go",
+    "goto",
+    "grant",
+    "group",
+    "grouping",
+    "handler",
+    "having",
+    "hold",
+    "hour",
+    "identity",
+    "if",
+    "immediate",
+    "in",
+    "indicator",
+    "initially",
+    "inner",
+    "inout",
+    "input",
+    "insensitive",
+    "insert",
+    "int",
+    "integer",
+    "intersect",
+    "interval",
+    "into",
+    "is",
+    "isolation",
+    "iterate",
+    "join",
+    "key",
+    "language",
+    "large",
+    "last",
+    "lateral",
+    "leading",
+    "leave",
+    "left",
+    "level",
+    "like",
+    "local",
+    "localtime",
+    "localtimestamp",
+    "locator",
+    "loop",
+    "lower",
+    "map",
+    "match",
+    "max",
+    "member",
+    "merge",
+    "method",
+    "min",
+    "minute",
+    "modifies",
+    "module",
+    "month",
+    "multiset",
+    "names",
+    "national",
+    "natural",
+    "nchar",
+    "nclob",
+    "new",
+    "next",
+    "no",
+    "none",
+    "not",
+    "null",
+    "nullif",
+    "numeric",
+    "object",
+    "octet_length",
+    "of",
+    "old",
+    "on",
+    "only",
+    "open",
+    "option",
+    "or",
+    "order",
+    "ordinality",
+    "out",
+    "outer",
+    "output",
+    "over",
+    "overlaps",
+    "pad",
+    "parameter",
+    "partial",
+    "partition",
+    "path",
+    "position",
+    "precision",
+    "prepare",
+    "preserve",
+    "primary",
+    "prior",
+    "privileges",
+    "procedure",
+    "public",
+    "range",
+    "read",
+    "reads",
+    "real",
+    "recursive",
+    "ref",
+    "references",
+    "referencing",
+    "relative",
+    "release",
+    "repeat",
+    "resignal",
+    "restrict",
+    "result",
+    "return",
+    "returns",
+    "revoke",
+    "right",
+    "role",
+    "rollback",
+    "rollup",
+    "routine",
+    "row",
+    "rows",
+    "savepoint",
+    "schema",
+    "scope",
+    "scroll",
+    "search",
+    "second",
+    "section",
+    "select",
+    "sensitive",
+    "session",
+    "session_user",
+    "set",
+    "sets",
+    "signal",
+    "similar",
+    "size",
+    "smallint",
+    "some",
+    "space",
+    "specific",
+    "specifictype",
+    "sql",
+    "sqlcode",
+    "sqlerror",
+    "sqlexception",
+    "sqlstate",
+    "sqlwarning",
+    "start",
+    "state",
+    "static",
+    "submultiset",
+    "substring",
+    "sum",
+    "symmetric",
+    "system",
+    "system_user",
+    "table",
+    "tablesample",
+    "temporary",
+    "then",
+    "time",
+    "timestamp",
+    "timezone_hour",
+    "timezone_minute",
+    "to",
+    "trailing",
+    "transaction",
+    "translate",
+    "translation",
+    "treat",
+    "trigger",
+    "trim",
+    "true",
+    "under",
+    "undo",
+    "union",
+    "unique",
+    "unknown",
+    "unnest",
+    "until",
+    "update",
+    "upper",
+    "usage",
+    "user",
+    "using",
+    "value",
+    "values",
+    "varchar",
+    "varying",
+    "view",
+    "when",
+    "whenever",
+    "where",
+    "while",
+    "window",
+    "with",
+    "within",
+    "without",
+    "work",
+    "write",
+    "year",
+    "zone",
+)
+
 
 class AnsiSqlDialect:
     """
     ANSI SQL dialect basically but not really supported by several database vendors.
+
+    Dialects have no state, so each dialect class has only one instance.
     """
 
-    def __init__(self):
-        keywords_as_list = [
-            "absolute",
-            "action",
-            "add",
-            "after",
-            "all",
-            "allocate",
-            "alter",
-            "and",
-            "any",
-            "are",
-            "array",
-            "as",
-            "asc",
-            "asensitive",
-            "assertion",
-            "asymmetric",
-            "at",
-            "atomic",
-            "authorization",
-            "avg",
-            "before",
-            "begin",
-            "between",
-            "bigint",
-            "binary",
-            "bit",
-            "bit_length",
-            "blob",
-            "boolean",
-            "both",
-            "breadth",
-            "by",
-            "call",
-            "called",
-            "cascade",
-            "cascaded",
-            "case",
-            "cast",
-            "catalog",
-            "char",
-            "character",
-            "character_length",
-            "char_length",
-            "check",
-            "clob",
-            "close",
-            "coalesce",
-            "collate",
-            "collation",
-            "column",
-            "commit",
-            "condition",
-            "connect",
-            "connection",
-            "constraint",
-            "constraints",
-            "constructor",
-            "contains",
-            "continue",
-            "convert",
-            "corresponding",
-            "count",
-            "create",
-            "cross",
-            "cube",
-            "current",
-            "current_date",
-            "current_default_transform_group",
-            "current_path",
-            "current_role",
-            "current_time",
-            "current_timestamp",
-            "current_transform_group_for_type",
-            "current_user",
-            "cursor",
-            "cycle",
-            "data",
-            "date",
-            "day",
-            "deallocate",
-            "dec",
-            "decimal",
-            "declare",
-            "default",
-            "deferrable",
-            "deferred",
-            "delete",
-            "depth",
-            "deref",
-            "desc",
-            "describe",
-            "descriptor",
-            "deterministic",
-            "diagnostics",
-            "disconnect",
-            "distinct",
-            "do",
-            "domain",
-            "double",
-            "drop",
-            "dynamic",
-            "each",
-            "element",
-            "else",
-            "elseif",
-            "end",
-            "equals",
-            "escape",
-            "except",
-            "exception",
-            "exec",
-            "execute",
-            "exists",
-            "exit",
-            "external",
-            "extract",
-            "false",
-            "fetch",
-            "filter",
-            "first",
-            "float",
-            "for",
-            "foreign",
-            "found",
-            "free",
-            "from",
-            "full",
-            "function",
-            "general",
-            "get",
-            "global",
-            "go",
-            "goto",
-            "grant",
-            "group",
-            "grouping",
-            "handler",
-            "having",
-            "hold",
-            "hour",
-            "identity",
-            "if",
-            "immediate",
-            "in",
-            "indicator",
-            "initially",
-            "inner",
-            "inout",
-            "input",
-            "insensitive",
-            "insert",
-            "int",
-            "integer",
-            "intersect",
-            "interval",
-            "into",
-            "is",
-            "isolation",
-            "iterate",
-            "join",
-            "key",
-            "language",
-            "large",
-            "last",
-            "lateral",
-            "leading",
-            "leave",
-            "left",
-            "level",
-            "like",
-            "local",
-            "localtime",
-            "localtimestamp",
-            "locator",
-            "loop",
-            "lower",
-            "map",
-            "match",
-            "max",
-            "member",
-            "merge",
-            "method",
-            "min",
-            "minute",
-            "modifies",
-            "module",
-            "month",
-            "multiset",
-            "names",
-            "national",
-            "natural",
-            "nchar",
-            "nclob",
-            "new",
-            "next",
-            "no",
-            "none",
-            "not",
-            "null",
-            "nullif",
-            "numeric",
-            "object",
-            "octet_length",
-            "of",
-            "old",
-            "on",
-            "only",
-            "open",
-            "option",
-            "or",
-            "order",
-            "ordinality",
-            "out",
-            "outer",
-            "output",
-            "over",
-            "overlaps",
-            "pad",
-            "parameter",
-            "partial",
-            "partition",
-            "path",
-            "position",
-            "precision",
-            "prepare",
-            "preserve",
-            "primary",
-            "prior",
-            "privileges",
-            "procedure",
-            "public",
-            "range",
-            "read",
-            "reads",
-            "real",
-            "recursive",
-            "ref",
-            "references",
-            "referencing",
-            "relative",
-            "release",
-            "repeat",
-            "resignal",
-            "restrict",
-            "result",
-            "return",
-            "returns",
-            "revoke",
-            "right",
-            "role",
-            "rollback",
-            "rollup",
-            "routine",
-            "row",
-            "rows",
-            "savepoint",
-            "schema",
-            "scope",
-            "scroll",
-            "search",
-            "second",
-            "section",
-            "select",
-            "sensitive",
-            "session",
-            "session_user",
-            "set",
-            "sets",
-            "signal",
-            "similar",
-            "size",
-            "smallint",
-            "some",
-            "space",
-            "specific",
-            "specifictype",
-            "sql",
-            "sqlcode",
-            "sqlerror",
-            "sqlexception",
-            "sqlstate",
-            "sqlwarning",
-            "start",
-            "state",
-            "static",
-            "submultiset",
-            "substring",
-            "sum",
-            "symmetric",
-            "system",
-            "system_user",
-            "table",
-            "tablesample",
-            "temporary",
-            "then",
-            "time",
-            "timestamp",
-            "timezone_hour",
-            "timezone_minute",
-            "to",
-            "trailing",
-            "transaction",
-            "translate",
-            "translation",
-            "treat",
-            "trigger",
-            "trim",
-            "true",
-            "under",
-            "undo",
-            "union",
-            "unique",
-            "unknown",
-            "unnest",
-            "until",
-            "update",
-            "upper",
-            "usage",
-            "user",
-            "using",
-            "value",
-            "values",
-            "varchar",
-            "varying",
-            "view",
-            "when",
-            "whenever",
-            "where",
-            "while",
-            "window",
-            "with",
-            "within",
-            "without",
-            "work",
-            "write",
-            "year",
-            "zone",
-        ]
-        self._keywords = set(keywords_as_list)
+    def __new__(cls):
+        result = cls.__dict__.get("_instance")
+        if result is None:
+            result = super().__new__(cls)
+            cls._instance = result
+        return result
 
     @property
     def keywords(self):
-        return self._keywords
+        """
+        ``frozenset`` of lower case keywords that have to be quoted when used as name.
+        """
+        dialect_name = str(self)
+        result = _DIALECT_NAME_TO_KEYWORDS_MAP.get(dialect_name)
+        if result is None:
+            result = frozenset(_DIALECT_NAME_TO_KEYWORD_NAMES_MAP[dialect_name])
+            _DIALECT_NAME_TO_KEYWORDS_MAP[dialect_name] = result
+        return result
 
     def sql_type(self, sql_ansi_type):
         """
@@ -413,339 +447,338 @@ class AnsiSqlDialect:
         return ANSI
 
 
+_PL_KEYWORD_NAMES = (
+    "a",
+    "add",
+    "agent",
+    "aggregate",
+    "all",
+    "alter",
+    "and",
+    "any",
+    "array",
+    "arrow",
+    "as",
+    "asc",
+    "at",
+    "attribute",
+    "authid",
+    "avg",
+    "begin",
+    "between",
+    "bfile_base",
+    "binary",
+    "blob_base",
+    "block",
+    "body",
+    "both",
+    "bound",
+    "bulk",
+    "by",
+    "byte",
+    "c",
+    "call",
+    "calling",
+    "cascade",
+    "case",
+    "char",
+    "character",
+    "charset",
+    "charsetform",
+    "charsetid",
+    "char_base",
+    "check",
+    "clob_base",
+    "close",
+    "cluster",
+    "clusters",
+    "colauth",
+    "collect",
+    "columns",
+    "comment",
+    "commit",
+    "committed",
+    "compiled",
+    "compress",
+    "connect",
+    "constant",
+    "constructor",
+    "context",
+    "convert",
+    "count",
+    "crash",
+    "create",
+    "current",
+    "cursor",
+    "customdatum",
+    "dangling",
+    "data",
+    "date",
+    "date_base",
+    "day",
+    "decimal",
+    "declare",
+    "default",
+    "define",
+    "delete",
+    "desc",
+    "deterministic",
+    "distinct",
+    "double",
+    "drop",
+    "duration",
+    "element",
+    "else",
+    "elsif",
+    "empty",
+    "end",
+    "escape",
+    "except",
+    "exception",
+    "exceptions",
+    "exclusive",
+    "execute",
+    "exists",
+    "exit",
+    "external",
+    "fetch",
+    "final",
+    "fixed",
+    "float",
+    "for",
+    "forall",
+    "force",
+    "form",
+    "from",
+    "function",
+    "general",
+    "goto",
+    "grant",
+    "group",
+    "hash",
+    "having",
+    "heap",
+    "hidden",
+    "hour",
+    "identified",
+    "if",
+    "immediate",
+    "in",
+    "including",
+    "index",
+    "indexes",
+    "indicator",
+    "indices",
+    "infinite",
+    "insert",
+    "instantiable",
+    "int",
+    "interface",
+    "intersect",
+    "interval",
+    "into",
+    "invalidate",
+    "is",
+    "isolation",
+    "java",
+    "language",
+    "large",
+    "leading",
+    "length",
+    "level",
+    "library",
+    "like",
+    "like2",
+    "like4",
+    "likec",
+    "limit",
+    "limited",
+    "local",
+    "lock",
+    "long",
+    "loop",
+    "map",
+    "max",
+    "maxlen",
+    "member",
+    "merge",
+    "min",
+    "minus",
+    "minute",
+    "mod",
+    "mode",
+    "modify",
+    "month",
+    "multiset",
+    "name",
+    "nan",
+    "national",
+    "native",
+    "nchar",
+    "new",
+    "nocompress",
+    "nocopy",
+    "not",
+    "nowait",
+    "null",
+    "number_base",
+    "object",
+    "ocicoll",
+    "ocidate",
+    "ocidatetime",
+    "ociduration",
+    "ociinterval",
+    "ociloblocator",
+    "ocinumber",
+    "ociraw",
+    "ociref",
+    "ocirefcursor",
+    "ocirowid",
+    "ocistring",
+    "ocitype",
+    "of",
+    "on",
+    "only",
+    "opaque",
+    "open",
+    "operator",
+    "option",
+    "or",
+    "oracle",
+    "oradata",
+    "order,overlaps",
+    "organization",
+    "orlany",
+    "orlvary",
+    "others",
+    "out",
+    "overriding",
+    "package",
+    "parallel_enable",
+    "parameter",
+    "parameters",
+    "partition",
+    "pascal",
+    "pipe",
+    "pipelined",
+    "pragma",
+    "precision",
+    "prior",
+    "private",
+    "procedure",
+    "public",
+    "raise",
+    "range",
+    "raw",
+    "read",
+    "record",
+    "ref",
+    "reference",
+    "rem",
+    "remainder",
+    "rename",
+    "resource",
+    "result",
+    "return",
+    "returning",
+    "reverse",
+    "revoke",
+    "rollback",
+    "row",
+    "sample",
+    "save",
+    "savepoint",
+    "sb1",
+    "sb2",
+    "sb4",
+    "second",
+    "segment",
+    "select",
+    "self",
+    "separate",
+    "sequence",
+    "serializable",
+    "set",
+    "share",
+    "short",
+    "size",
+    "size_t",
+    "some",
+    "sparse",
+    "sql",
+    "sqlcode",
+    "sqldata",
+    "sqlname",
+    "sqlstate",
+    "standard",
+    "start",
+    "static",
+    "stddev",
+    "stored",
+    "string",
+    "struct",
+    "style",
+    "submultiset",
+    "subpartition",
+    "substitutable",
+    "subtype",
+    "sum",
+    "synonym",
+    "tabauth",
+    "table",
+    "tdo",
+    "the",
+    "then",
+    "time",
+    "timestamp",
+    "timezone_abbr",
+    "timezone_hour",
+    "timezone_minute",
+    "timezone_region",
+    "to",
+    "trailing",
+    "transac",
+    "transactional",
+    "trusted",
+    "type",
+    "ub1",
+    "ub2",
+    "ub4",
+    "under",
+    "union",
+    "unique",
+    "unsigned",
+    "untrusted",
+    "update",
+    "use",
+    "using",
+    "valist",
+    "value",
+    "values",
+    "variable",
+    "variance",
+    "varray",
+    "varying",
+    "view",
+    "views",
+    "void",
+    "when",
+    "where",
+    "while",
+    "with",
+    "work",
+    "wrapped",
+    "write",
+    "year",
+    "zone",
+)
+
+
 class PlSqlDialect(AnsiSqlDialect):
     """
     PL/SQL dialect used by Oracle.
     """
 
-    def __init__(self):
-        keywords_as_list = [
-            "a",
-            "add",
-            "agent",
-            "aggregate",
-            "all",
-            "alter",
-            "and",
-            "any",
-            "array",
-            "arrow",
-            "as",
-            "asc",
-            "at",
-            "attribute",
-            "authid",
-            "avg",
-            "begin",
-            "between",
-            "bfile_base",
-            "binary",
-            "blob_base",
-            "block",
-            "body",
-            "both",
-            "bound",
-            "bulk",
-            "by",
-            "byte",
-            "c",
-            "call",
-            "calling",
-            "cascade",
-            "case",
-            "char",
-            "character",
-            "charset",
-            "charsetform",
-            "charsetid",
-            "char_base",
-            "check",
-            "clob_base",
-            "close",
-            "cluster",
-            "clusters",
-            "colauth",
-            "collect",
-            "columns",
-            "comment",
-            "commit",
-            "committed",
-            "compiled",
-            "compress",
-            "connect",
-            "constant",
-            "constructor",
-            "context",
-            "convert",
-            "count",
-            "crash",
-            "create",
-            "current",
-            "cursor",
-            "customdatum",
-            "dangling",
-            "data",
-            "date",
-            "date_base",
-            "day",
-            "decimal",
-            "declare",
-            "default",
-            "define",
-            "delete",
-            "desc",
-            "deterministic",
-            "distinct",
-            "double",
-            "drop",
-            "duration",
-            "element",
-            "else",
-            "elsif",
-            "empty",
-            "end",
-            "escape",
-            "except",
-            "exception",
-            "exceptions",
-            "exclusive",
-            "execute",
-            "exists",
-            "exit",
-            "external",
-            "fetch",
-            "final",
-            "fixed",
-            "float",
-            "for",
-            "forall",
-            "force",
-            "form",
-            "from",
-            "function",
-            "general",
-            "goto",
-            "grant",
-            "group",
-            "hash",
-            "having",
-            "heap",
-            "hidden",
-            "hour",
-            "identified",
-            "if",
-            "immediate",
-            "in",
-            "including",
-            "index",
-            "indexes",
-            "indicator",
-            "indices",
-            "infinite",
-            "insert",
-            "instantiable",
-            "int",
-            "interface",
-            "intersect",
-            "interval",
-            "into",
-            "invalidate",
-            "is",
-            "isolation",
-            "java",
-            "language",
-            "large",
-            "leading",
-            "length",
-            "level",
-            "library",
-            "like",
-            "like2",
-            "like4",
-            "likec",
-            "limit",
-            "limited",
-            "local",
-            "lock",
-            "long",
-            "loop",
-            "map",
-            "max",
-            "maxlen",
-            "member",
-            "merge",
-            "min",
-            "minus",
-            "minute",
-            "mod",
-            "mode",
-            "modify",
-            "month",
-            "multiset",
-            "name",
-            "nan",
-            "national",
-            "native",
-            "nchar",
-            "new",
-            "nocompress",
-            "nocopy",
-            "not",
-            "nowait",
-            "null",
-            "number_base",
-            "object",
-            "ocicoll",
-            "ocidate",
-            "ocidatetime",
-            "ociduration",
-            "ociinterval",
-            "ociloblocator",
-            "ocinumber",
-            "ociraw",
-            "ociref",
-            "ocirefcursor",
-            "ocirowid",
-            "ocistring",
-            "ocitype",
-            "of",
-            "on",
-            "only",
-            "opaque",
-            "open",
-            "operator",
-            "option",
-            "or",
-            "oracle",
-            "oradata",
-            "order,overlaps",
-            "organization",
-            "orlany",
-            "orlvary",
-            "others",
-            "out",
-            "overriding",
-            "package",
-            "parallel_enable",
-            "parameter",
-            "parameters",
-            "partition",
-            "pascal",
-            "pipe",
-            "pipelined",
-            "pragma",
-            "precision",
-            "prior",
-            "private",
-            "procedure",
-            "public",
-            "raise",
-            "range",
-            "raw",
-            "read",
-            "record",
-            "ref",
-            "reference",
-            "rem",
-            "remainder",
-            "rename",
-            "resource",
-            "result",
-            "return",
-            "returning",
-            "reverse",
-            "revoke",
-            "rollback",
-            "row",
-            "sample",
-            "save",
-            "savepoint",
-            "sb1",
-            "sb2",
-            "sb4",
-            "second",
-            "segment",
-            "select",
-            "self",
-            "separate",
-            "sequence",
-            "serializable",
-            "set",
-            "share",
-            "short",
-            "size",
-            "size_t",
-            "some",
-            "sparse",
-            "sql",
-            "sqlcode",
-            "sqldata",
-            "sqlname",
-            "sqlstate",
-            "standard",
-            "start",
-            "static",
-            "stddev",
-            "stored",
-            "string",
-            "struct",
-            "style",
-            "submultiset",
-            "subpartition",
-            "substitutable",
-            "subtype",
-            "sum",
-            "synonym",
-            "tabauth",
-            "table",
-            "tdo",
-            "the",
-            "then",
-            "time",
-            "timestamp",
-            "timezone_abbr",
-            "timezone_hour",
-            "timezone_minute",
-            "timezone_region",
-            "to",
-            "trailing",
-            "transac",
-            "transactional",
-            "trusted",
-            "type",
-            "ub1",
-            "ub2",
-            "ub4",
-            "under",
-            "union",
-            "unique",
-            "unsigned",
-            "untrusted",
-            "update",
-            "use",
-            "using",
-            "valist",
-            "value",
-            "values",
-            "variable",
-            "variance",
-            "varray",
-            "varying",
-            "view",
-            "views",
-            "void",
-            "when",
-            "where",
-            "while",
-            "with",
-            "work",
-            "wrapped",
-            "write",
-            "year",
-            "zone",
-        ]
-        self._keywords = set(keywords_as_list)
-
     def sql_type(self, sql_ansi_type):
         ansi_type = sql_ansi_type[0]
         result = sql_ansi_type
@@ -771,201 +804,200 @@ class PlSqlDialect(AnsiSqlDialect):
         return PL
 
 
+_TRANSACT_KEYWORD_NAMES = (
+    "add",
+    "all",
+    "alter",
+    "and",
+    "any",
+    "as",
+    "asc",
+    "authorization",
+    "backup",
+    "begin",
+    "between",
+    "break",
+    "browse",
+    "bulk",
+    "by",
+    "cascade",
+    "case",
+    "check",
+    "checkpoint",
+    "close",
+    "clustered",
+    "coalesce",
+    "collate",
+    "column",
+    "commit",
+    "compute",
+    "constraint",
+    "contains",
+    "containstable",
+    "continue",
+    "convert",
+    "create",
+    "cross",
+    "current",
+    "current_date",
+    "current_time",
+    "current_timestamp",
+    "current_user",
+    "cursor",
+    "database",
+    "dbcc",
+    "deallocate",
+    "declare",
+    "default",
+    "delete",
+    "deny",
+    "desc",
+    "disk",
+    "distinct",
+    "distributed",
+    "double",
+    "drop",
+    "dump",
+    "else",
+    "end",
+    "errlvl",
+    "escape",
+    "except",
+    "exec",
+    "execute",
+    "exists",
+    "exit",
+    "external",
+    "fetch",
+    "file",
+    "fillfactor",
+    "for",
+    "foreign",
+    "freetext",
+    "freetexttable",
+    "from",
+    "full",
+    "function",
+    "goto",
+    "grant",
+    "group",
+    "having",
+    "holdlock",
+    "identity",
+    "identitycol",
+    "identity_insert",
+    "if",
+    "in",
+    "index",
+    "inner",
+    "insert",
+    "intersect",
+    "into",
+    "is",
+    "join",
+    "key",
+    "kill",
+    "left",
+    "like",
+    "lineno",
+    "load",
+    "merge",
+    "national",
+    "nocheck",
+    "nonclustered",
+    "not",
+    "null",
+    "nullif",
+    "of",
+    "off",
+    "offsets",
+    "on",
+    "open",
+    "opendatasource",
+    "openquery",
+    "openrowset",
+    "openxml",
+    "option",
+    "or",
+    "order",
+    "outer",
+    "over",
+    "percent",
+    "pivot",
+    "plan",
+    "precision",
+    "primary",
+    "print",
+    "proc",
+    "procedure",
+    "public",
+    "raiserror",
+    "read",
+    "readtext",
+    "reconfigure",
+    "references",
+    "replication",
+    "restore",
+    "restrict",
+    "return",
+    "revert",
+    "revoke",
+    "right",
+    "rollback",
+    "rowcount",
+    "rowguidcol",
+    "rule",
+    "save",
+    "schema",
+    "securityaudit",
+    "select",
+    "semantickeyphrasetable",
+    "semanticsimilaritydetailstable",
+    "semanticsimilaritytable",
+    "session_user",
+    "set",
+    "setuser",
+    "shutdown",
+    "some",
+    "statistics",
+    "system_user",
+    "table",
+    "tablesample",
+    "textsize",
+    "then",
+    "to",
+    "top",
+    "tran",
+    "transaction",
+    "trigger",
+    "truncate",
+    "try_convert",
+    "tsequal",
+    "union",
+    "unique",
+    "unpivot",
+    "update",
+    "updatetext",
+    "use",
+    "user",
+    "values",
+    "varying",
+    "view",
+    "waitfor",
+    "when",
+    "where",
+    "while",
+    "with",
+    "withingroup",
+    "writetext",
+)
+
+
 class TransactSqlDialect(AnsiSqlDialect):
     """
     Transact-SQL dialect used by Microsoft SQL Server and Sybase.
     """
 
-    def __init__(self):
-        keywords = [
-            "add",
-            "all",
-            "alter",
-            "and",
-            "any",
-            "as",
-            "asc",
-            "authorization",
-            "backup",
-            "begin",
-            "between",
-            "break",
-            "browse",
-            "bulk",
-            "by",
-            "cascade",
-            "case",
-            "check",
-            "checkpoint",
-            "close",
-            "clustered",
-            "coalesce",
-            "collate",
-            "column",
-            "commit",
-            "compute",
-            "constraint",
-            "contains",
-            "containstable",
-            "continue",
-            "convert",
-            "create",
-            "cross",
-            "current",
-            "current_date",
-            "current_time",
-            "current_timestamp",
-            "current_user",
-            "cursor",
-            "database",
-            "dbcc",
-            "deallocate",
-            "declare",
-            "default",
-            "delete",
-            "deny",
-            "desc",
-            "disk",
-            "distinct",
-            "distributed",
-            "double",
-            "drop",
-            "dump",
-            "else",
-            "end",
-            "errlvl",
-            "escape",
-            "except",
-            "exec",
-            "execute",
-            "exists",
-            "exit",
-            "external",
-            "fetch",
-            "file",
-            "fillfactor",
-            "for",
-            "foreign",
-            "freetext",
-            "freetexttable",
-            "from",
-            "full",
-            "function",
-            "goto",
-            "grant",
-            "group",
-            "having",
-            "holdlock",
-            "identity",
-            "identitycol",
-            "identity_insert",
-            "if",
-            "in",
-            "index",
-            "inner",
-            "insert",
-            "intersect",
-            "into",
-            "is",
-            "join",
-            "key",
-            "kill",
-            "left",
-            "like",
-            "lineno",
-            "load",
-            "merge",
-            "national",
-            "nocheck",
-            "nonclustered",
-            "not",
-            "null",
-            "nullif",
-            "of",
-            "off",
-            "offsets",
-            "on",
-            "open",
-            "opendatasource",
-            "openquery",
-            "openrowset",
-            "openxml",
-            "option",
-            "or",
-            "order",
-            "outer",
-            "over",
-            "percent",
-            "pivot",
-            "plan",
-            "precision",
-            "primary",
-            "print",
-            "proc",
-            "procedure",
-            "public",
-            "raiserror",
-            "read",
-            "readtext",
-            "reconfigure",
-            "references",
-            "replication",
-            "restore",
-            "restrict",
-            "return",
-            "revert",
-            "revoke",
-            "right",
-            "rollback",
-            "rowcount",
-            "rowguidcol",
-            "rule",
-            "save",
-            "schema",
-            "securityaudit",
-            "select",
-            "semantickeyphrasetable",
-            "semanticsimilaritydetailstable",
-            "semanticsimilaritytable",
-            "session_user",
-            "set",
-            "setuser",
-            "shutdown",
-            "some",
-            "statistics",
-            "system_user",
-            "table",
-            "tablesample",
-            "textsize",
-            "then",
-            "to",
-            "top",
-            "tran",
-            "transaction",
-            "trigger",
-            "truncate",
-            "try_convert",
-            "tsequal",
-            "union",
-            "unique",
-            "unpivot",
-            "update",
-            "updatetext",
-            "use",
-            "user",
-            "values",
-            "varying",
-            "view",
-            "waitfor",
-            "when",
-            "where",
-            "while",
-            "with",
-            "withingroup",
-            "writetext",
-        ]
-        self._keywords = set(keywords)
-
     def sql_type(self, sql_ansi_type):
         ansi_type = sql_ansi_type[0]
         if ansi_type == "int":
@@ -991,307 +1023,306 @@ class TransactSqlDialect(AnsiSqlDialect):
         return TRANSACT
 
 
+_DB2_KEYWORD_NAMES = (
+    "add",
+    "after",
+    "all",
+    "allocate",
+    "allow",
+    "alter",
+    "and",
+    "any",
+    "as",
+    "asensitive",
+    "associate",
+    "asutime",
+    "at",
+    "audit",
+    "aux",
+    "auxiliary",
+    "before",
+    "begin",
+    "between",
+    "bufferpool",
+    "by",
+    "call",
+    "capture",
+    "cascaded",
+    "case",
+    "cast",
+    "ccsid",
+    "char",
+    "character",
+    "check",
+    "clone",
+    "close",
+    "cluster",
+    "collection",
+    "collid",
+    "column",
+    "comment",
+    "commit",
+    "concat",
+    "condition",
+    "connect",
+    "connection",
+    "constraint",
+    "contains",
+    "content",
+    "continue",
+    "create",
+    "current",
+    "current_date",
+    "current_lc_ctype",
+    "current_path",
+    "current_schema",
+    "current_time",
+    "current_timestamp",
+    "currval1",
+    "cursor",
+    "data",
+    "database",
+    "day",
+    "days",
+    "dbinfo",
+    "declare",
+    "default",
+    "delete",
+    "descriptor",
+    "deterministic",
+    "disable",
+    "disallow",
+    "distinct",
+    "do",
+    "document",
+    "double",
+    "drop",
+    "dssize",
+    "dynamic",
+    "editproc",
+    "else",
+    "elseif",
+    "encoding",
+    "encryption",
+    "end",
+    "end-exec2",
+    "ending",
+    "erase",
+    "escape",
+    "except",
+    "exception",
+    "execute",
+    "exists",
+    "exit",
+    "explain",
+    "external",
+    "fenced",
+    "fetch",
+    "fieldproc",
+    "final",
+    "first1",
+    "for",
+    "free",
+    "from",
+    "full",
+    "function",
+    "generated",
+    "get",
+    "global",
+    "go",
+    "goto",
+    "grant",
+    "group",
+    "handler",
+    "having",
+    "hold",
+    "hour",
+    "hours",
+    "if",
+    "immediate",
+    "in",
+    "inclusive",
+    "index",
+    "inherit",
+    "inner",
+    "inout",
+    "insensitive",
+    "insert",
+    "intersect",
+    "into",
+    "is",
+    "isobid",
+    "iterate",
+    "jar",
+    "join",
+    "keep",
+    "key",
+    "label",
+    "language",
+    "last1",
+    "lc_ctype",
+    "leave",
+    "left",
+    "like",
+    "local",
+    "locale",
+    "locator",
+    "locators",
+    "lock",
+    "lockmax",
+    "locksize",
+    "long",
+    "loop",
+    "maintained",
+    "materialized",
+    "microsecond",
+    "microseconds",
+    "minute",
+    "minutes",
+    "modifies",
+    "month",
+    "months",
+    "next1",
+    "nextval",
+    "no",
+    "none",
+    "not",
+    "null",
+    "nulls",
+    "numparts",
+    "obid",
+    "of",
+    "old1",
+    "on",
+    "open",
+    "optimization",
+    "optimize",
+    "or",
+    "order",
+    "organization1",
+    "out",
+    "outer",
+    "package",
+    "padded",
+    "parameter",
+    "part",
+    "partition",
+    "partitioned",
+    "partitioning",
+    "path",
+    "period1",
+    "piecesize",
+    "plan",
+    "precision",
+    "prepare",
+    "prevval",
+    "prior1",
+    "priqty",
+    "privileges",
+    "procedure",
+    "program",
+    "psid",
+    "public",
+    "query",
+    "queryno",
+    "reads",
+    "references",
+    "refresh",
+    "release",
+    "rename",
+    "repeat",
+    "resignal",
+    "restrict",
+    "result",
+    "result_set_locator",
+    "return",
+    "returns",
+    "revoke",
+    "right",
+    "role",
+    "rollback",
+    "round_ceiling",
+    "round_down",
+    "round_floor",
+    "round_half_down",
+    "round_half_even",
+    "round_half_up",
+    "round_up",
+    "row",
+    "rowset",
+    "run",
+    "savepoint",
+    "schema",
+    "scratchpad",
+    "second",
+    "seconds",
+    "secqty",
+    "security",
+    "select",
+    "sensitive",
+    "sequence",
+    "session_user",
+    "set",
+    "signal",
+    "simple",
+    "some",
+    "source",
+    "specific",
+    "standard",
+    "statement",
+    "static",
+    "stay",
+    "stogroup",
+    "stores",
+    "style",
+    "summary",
+    "synonym",
+    "sysdate1",
+    "system",
+    "systimestamp1",
+    "table",
+    "tablespace",
+    "then",
+    "to",
+    "trigger",
+    "truncate",
+    "type",
+    "undo",
+    "union",
+    "unique",
+    "until",
+    "update",
+    "user",
+    "using",
+    "validproc",
+    "value",
+    "values",
+    "variable",
+    "variant",
+    "vcat",
+    "view",
+    "volatile",
+    "volumes",
+    "when",
+    "whenever",
+    "where",
+    "while",
+    "with",
+    "wlm",
+    "xmlcast",
+    "xmlexists",
+    "xmlnamespaces",
+    "year",
+    "years",
+    "zone",
+)
+
+
 class Db2SqlDialect(AnsiSqlDialect):
     """
     SQL dialect used by IBM DB2.
     """
 
-    def __init__(self):
-        keywords = [
-            "add",
-            "after",
-            "all",
-            "allocate",
-            "allow",
-            "alter",
-            "and",
-            "any",
-            "as",
-            "asensitive",
-            "associate",
-            "asutime",
-            "at",
-            "audit",
-            "aux",
-            "auxiliary",
-            "before",
-            "begin",
-            "between",
-            "bufferpool",
-            "by",
-            "call",
-            "capture",
-            "cascaded",
-            "case",
-            "cast",
-            "ccsid",
-            "char",
-            "character",
-            "check",
-            "clone",
-            "close",
-            "cluster",
-            "collection",
-            "collid",
-            "column",
-            "comment",
-            "commit",
-            "concat",
-            "condition",
-            "connect",
-            "connection",
-            "constraint",
-            "contains",
-            "content",
-            "continue",
-            "create",
-            "current",
-            "current_date",
-            "current_lc_ctype",
-            "current_path",
-            "current_schema",
-            "current_time",
-            "current_timestamp",
-            "currval1",
-            "cursor",
-            "data",
-            "database",
-            "day",
-            "days",
-            "dbinfo",
-            "declare",
-            "default",
-            "delete",
-            "descriptor",
-            "deterministic",
-            "disable",
-            "disallow",
-            "distinct",
-            "do",
-            "document",
-            "double",
-            "drop",
-            "dssize",
-            "dynamic",
-            "editproc",
-            "else",
-            "elseif",
-            "encoding",
-            "encryption",
-            "end",
-            "end-exec2",
-            "ending",
-            "erase",
-            "escape",
-            "except",
-            "exception",
-            "execute",
-            "exists",
-            "exit",
-            "explain",
-            "external",
-            "fenced",
-            "fetch",
-            "fieldproc",
-            "final",
-            "first1",
-            "for",
-            "free",
-            "from",
-            "full",
-            "function",
-            "generated",
-            "get",
-            "global",
-            "go",
-            "goto",
-            "grant",
-            "group",
-            "handler",
-            "having",
-            "hold",
-            "hour",
-            "hours",
-            "if",
-            "immediate",
-            "in",
-            "inclusive",
-            "index",
-            "inherit",
-            "inner",
-            "inout",
-            "insensitive",
-            "insert",
-            "intersect",
-            "into",
-            "is",
-            "isobid",
-            "iterate",
-            "jar",
-            "join",
-            "keep",
-            "key",
-            "label",
-            "language",
-            "last1",
-            "lc_ctype",
-            "leave",
-            "left",
-            "like",
-            "local",
-            "locale",
-            "locator",
-            "locators",
-            "lock",
-            "lockmax",
-            "locksize",
-            "long",
-            "loop",
-            "maintained",
-            "materialized",
-            "microsecond",
-            "microseconds",
-            "minute",
-            "minutes",
-            "modifies",
-            "month",
-            "months",
-            "next1",
-            "nextval",
-            "no",
-            "none",
-            "not",
-            "null",
-            "nulls",
-            "numparts",
-            "obid",
-            "of",
-            "old1",
-            "on",
-            "open",
-            "optimization",
-            "optimize",
-            "or",
-            "order",
-            "organization1",
-            "out",
-            "outer",
-            "package",
-            "padded",
-            "parameter",
-            "part",
-            "partition",
-            "partitioned",
-            "partitioning",
-            "path",
-            "period1",
-            "piecesize",
-            "plan",
-            "precision",
-            "prepare",
-            "prevval",
-            "prior1",
-            "priqty",
-            "privileges",
-            "procedure",
-            "program",
-            "psid",
-            "public",
-            "query",
-            "queryno",
-            "reads",
-            "references",
-            "refresh",
-            "release",
-            "rename",
-            "repeat",
-            "resignal",
-            "restrict",
-            "result",
-            "result_set_locator",
-            "return",
-            "returns",
-            "revoke",
-            "right",
-            "role",
-            "rollback",
-            "round_ceiling",
-            "round_down",
-            "round_floor",
-            "round_half_down",
-            "round_half_even",
-            "round_half_up",
-            "round_up",
-            "row",
-            "rowset",
-            "run",
-            "savepoint",
-            "schema",
-            "scratchpad",
-            "second",
-            "seconds",
-            "secqty",
-            "security",
-            "select",
-            "sensitive",
-            "sequence",
-            "session_user",
-            "set",
-            "signal",
-            "simple",
-            "some",
-            "source",
-            "specific",
-            "standard",
-            "statement",
-            "static",
-            "stay",
-            "stogroup",
-            "stores",
-            "style",
-            "summary",
-            "synonym",
-            "sysdate1",
-            "system",
-            "systimestamp1",
-            "table",
-            "tablespace",
-            "then",
-            "to",
-            "trigger",
-            "truncate",
-            "type",
-            "undo",
-            "union",
-            "unique",
-            "until",
-            "update",
-            "user",
-            "using",
-            "validproc",
-            "value",
-            "values",
-            "variable",
-            "variant",
-            "vcat",
-            "view",
-            "volatile",
-            "volumes",
-            "when",
-            "whenever",
-            "where",
-            "while",
-            "with",
-            "wlm",
-            "xmlcast",
-            "xmlexists",
-            "xmlnamespaces",
-            "year",
-            "years",
-            "zone",
-        ]
-        self._keywords = set(keywords)
-
     def sql_type(self, sql_ansi_type):
         ansi_type = sql_ansi_type[0]
         result = sql_ansi_type
@@ -1311,6 +1342,15 @@ class Db2SqlDialect(AnsiSqlDialect):
         return DB2
 
 
+_DIALECT_NAME_TO_KEYWORD_NAMES_MAP = {
+    ANSI: _ANSI_KEYWORD_NAMES,
+    DB2: _DB2_KEYWORD_NAMES,
+    TRANSACT: _TRANSACT_KEYWORD_NAMES,
+    PL: _PL_KEYWORD_NAMES,
+}
+# Keywords of the dialects already used.
+_DIALECT_NAME_TO_KEYWORDS_MAP = {}
+
 ANSI_SQL_DIALECT = AnsiSqlDialect()
 DB2_SQL_DIALECT = Db2SqlDialect()
 TRANSACT_SQL_DIALECT = TransactSqlDialect()
@@ -1378,10 +1418,29 @@ def write_create(cid_path, cid_reader):
         # TODO: Add option for target SQL dialect
 
 
+_PLAIN_IDENTIFIER_REGEX = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+def _quoted_identifier(name, dialect=ANSI_SQL_DIALECT):
+    """
+    ``name`` as it can be used as SQL identifier: unchanged if it is a
+    plain identifier that is not a keyword of ``dialect``, otherwise in
+    double quotes with embedded double quotes doubled.
+    """
+    assert name is not None
+
+    if _PLAIN_IDENTIFIER_REGEX.fullmatch(name) is not None and not dialect.is_keyword(name):
+        result = name
+    else:
+        result = '"' + name.replace('"', '""') + '"'
+    return result
+
+
 class SqlFactory(object):
     def __init__(self, cid, table, dialect=ANSI_SQL_DIALECT):
         self._cid = cid
         self._table = table
+        self._quoted_table = _quoted_identifier(table, dialect)
         self._dialect = dialect
         # TODO: Add option to set SQL indent.
         self._indent = "    "
@@ -1397,19 +1456,28 @@ class SqlFactory(object):
         Tuples `(field_name, field_type, length, precision, is_not_null, default_value)`
         """
         for field in self._cid.field_formats:
-            assert_is_valid_ansi_type(field.sql_ansi_type())
-            sql_type, sql_length, sql_precision = (field.sql_ansi_type() + (None, None))[:3]
+            sql_ansi_type = field.sql_ansi_type()
+            assert_is_valid_ansi_type(sql_ansi_type)
             sql_type, sql_length, sql_precision = (
-                self._dialect.sql_type((sql_type, sql_length, sql_precision)) + (None, None)
+                self._dialect.sql_type((sql_ansi_type + (None, None))[:3]) + (None, None)
             )[:3]
-            field_name = field.field_name
-            if self._dialect.is_keyword(field_name):
-                field_name = '"' + field_name + '"'
+            field_name = _quoted_identifier(field.field_name, self._dialect)
             row = (field_name, sql_type, sql_length, sql_precision, field.is_allowed_to_be_empty, field.empty_value)
             yield row
 
+    def insert_statement(self):
+        """
+        Statement to insert a row with a ``?`` placeholder for each field.
+        """
+        field_names = [sql_field[0] for sql_field in self.sql_fields()]
+        return "insert into %s (%s) values (%s)" % (
+            self._quoted_table,
+            ", ".join(field_names),
+            ", ".join(["?"] * len(field_names)),
+        )
+
     def create_table_statement(self):
-        result = "create table " + self._table + " (\n"
+        result = "create table " + self._quoted_table + " (\n"
         first_field = True
 
         # get column definitions for all fields
@@ -1444,3 +1512,112 @@ class SqlFactory(object):
 
     def create_constraint_statements(self):
         pass
+
+
+class _SqliteLoadDialect(AnsiSqlDialect):
+    """
+    ANSI SQL dialect for the tables :py:func:`load_sqlite` creates, which
+    declares decimals as ``text`` so that SQLite stores them as they are
+    instead of converting them to integers or floating point numbers.
+    """
+
+    def sql_type(self, sql_ansi_type):
+        result = super().sql_type(sql_ansi_type)
+        if result[0] == "decimal":
+            result = ("text",)
+        return result
+
+
+_SQLITE_LOAD_DIALECT = _SqliteLoadDialect()
+
+
+def _sqlite_value_function(field_format):
+    """
+    Function to convert a native value of ``field_format`` to a value
+    SQLite can store or ``None`` if SQLite can store it as it is.
+    """
+    if isinstance(field_format, fields.DecimalFieldFormat):
+        # Keep all digits, the text column stores them as they are.
+        return lambda value: None if value is None else str(value)
+    if isinstance(field_format, fields.DateTimeFieldFormat):
+        if field_format.has_date and field_format.has_time:
+            strftime_format = "%Y-%m-%d %H:%M:%S"
+        elif field_format.has_time:
+            strftime_format = "%H:%M:%S"
+        else:
+            strftime_format = "%Y-%m-%d"
+        return lambda value: None if value is None else time.strftime(strftime_format, value)
+    return None
+
+
+def load_sqlite(
+    reader, database_path, table, batch_size=DEFAULT_LOAD_BATCH_SIZE, transaction_size=DEFAULT_LOAD_TRANSACTION_SIZE
+):
+    """
+    Insert the rows produced by ``reader`` into ``table`` of the SQLite
+    database stored in ``database_path``. The table is created as described
+    by :py:meth:`SqlFactory.create_table_statement` unless it already exists.
+
+    The data are read and validated only once: each batch of
+    ``batch_size`` rows is validated using
+    :py:meth:`cutplace.validio.Reader.row_batches` and its native values are
+    inserted with a single ``executemany()``. Dates are stored as text in
+    ISO format. Decimals are stored as text with all their digits in columns
+    declared as ``text`` instead of ``decimal``, which SQLite would convert
+    to integers or floating point numbers.
+
+    Once at least ``transaction_size`` rows have been inserted since the
+    last commit, they are committed after the current batch; 0 means all
+    rows are committed in a single transaction after the final checks
+    passed. If the data are broken, the rows inserted since the last commit
+    are rolled back.
+
+    :param cutplace.validio.Reader reader: reader for the data to load; \
+      with ``on_error='continue'`` broken rows are skipped
+    :return: the number of rows inserted
+    :raises cutplace.errors.DataError: on broken data if \
+      ``reader.on_error`` is ``'raise'``
+    """
+    assert reader is not None
+    assert reader.on_error != "yield", "rows to load cannot contain errors"
+    assert database_path is not None
+    assert table is not None
+    assert batch_size >= 1, "batch_size=%r" % batch_size
+    assert transaction_size >= 0, "transaction_size=%r" % transaction_size
+
+    sql_factory = SqlFactory(reader.cid, table, _SQLITE_LOAD_DIALECT)
+    field_index_and_value_functions = [
+        (field_index, value_function)
+        for field_index, value_function in enumerate(map(_sqlite_value_function, reader.cid.field_formats))
+        if value_function is not None
+    ]
+    result = 0
+    rows_to_commit_count = 0
+    with closing(sqlite3.connect(database_path)) as connection:
+        for pragma in _SQLITE_BULK_LOAD_PRAGMAS:
+            connection.execute(pragma)
+        has_table = (
+            connection.execute("select 1 from sqlite_master where type = 'table' and name = ?", (table,)).fetchone()
+            is not None
+        )
+        if not has_table:
+            _log.debug("create table %s", table)
+            connection.execute(sql_factory.create_table_statement())
+        insert_statement = sql_factory.insert_statement()
+        try:
+            for batch in reader.row_batches(batch_size, native=True):
+                for row in batch:
+                    for field_index, value_function in field_index_and_value_functions:
+                        row[field_index] = value_function(row[field_index])
+                connection.executemany(insert_statement, batch)
+                result += len(batch)
+                rows_to_commit_count += len(batch)
+                if (transaction_size >= 1) and (rows_to_commit_count >= transaction_size):
+                    connection.commit()
+                    rows_to_commit_count = 0
+            reader.close()
+            connection.commit()
+        except BaseException:
+            connection.rollback()
+            raise
+    return result
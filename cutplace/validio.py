@@ -16,20 +16,182 @@ Validated input and output of tabular data in various formats.
 #
 # You should have received a copy of the GNU Lesser General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import collections
+import collections.abc
+import concurrent.futures
+import contextlib
+import copy
+import io
 import itertools
+import os
+import time
 
-from cutplace import _compat, data, errors, interface, rowio
+from cutplace import _compat, checks, data, errors, interface, rowio
 
 # Valid choices for ``on_error`` parameter.
 _VALID_ON_ERROR_CHOICES = ("continue", "raise", "yield")
 
+#: Minimum number of bytes in a chunk of data validated by a parallel worker.
+_MIN_CHUNK_SIZE = 16 * 1024 * 1024
 
-def _create_field_map(field_names, field_values):
-    assert field_names
-    assert field_values
-    assert len(field_names) == len(field_values)
+#: Number of chunks each parallel worker should get to balance the load.
+_CHUNKS_PER_WORKER = 4
 
-    return dict(zip(field_names, field_values))
+#: Default number of error samples :py:class:`ValidationStats` keeps.
+DEFAULT_MAX_ERROR_SAMPLE_COUNT = 3
+
+#: Number of rows after which validators stop calling checks that are settled.
+_ROWS_BETWEEN_SETTLED_CHECKS_COUNT = 1000
+
+# The CID used by parallel workers, set by `_init_parallel_worker()`.
+_worker_cid = None
+
+
+class RowView(collections.abc.Mapping):
+    """
+    Read only map of field names to the values of a row that validators
+    pass to :py:meth:`cutplace.checks.AbstractCheck.check_row`. Unlike a
+    :py:class:`dict`, it does not copy the values but looks them up in the
+    row using the column index of each field. Validators reuse the same
+    view for all rows, so checks that need the values later have to copy
+    them, for example using ``dict(row_view)``.
+    """
+
+    __slots__ = ("_field_name_to_index_map", "_row")
+
+    def __init__(self, field_name_to_index_map, row=None):
+        """
+        :param dict field_name_to_index_map: map of each field name to its \
+          column index, typically \
+          :py:attr:`cutplace.interface.Cid.field_name_to_index_map`
+        :param list row: the values of the row
+        """
+        self._field_name_to_index_map = field_name_to_index_map
+        self._row = row
+
+    @property
+    def row(self):
+        """
+        The values of the row the view refers to.
+        """
+        return self._row
+
+    def __getitem__(self, field_name):
+        return self._row[self._field_name_to_index_map[field_name]]
+
+    def __iter__(self):
+        return iter(self._field_name_to_index_map)
+
+    def __len__(self):
+        return len(self._field_name_to_index_map)
+
+    def __repr__(self):
+        return "%s(%r)" % (self.__class__.__name__, dict(self))
+
+
+class ValidationStats(object):
+    """
+    Statistics about the validation of the values of a field or the rows of
+    a check, for example to find out which field format or check is slow or
+    rejects many rows.
+    """
+
+    def __init__(self, name, max_error_sample_count=DEFAULT_MAX_ERROR_SAMPLE_COUNT):
+        assert name is not None
+        assert max_error_sample_count >= 0
+
+        #: The name of the field or the description of the check.
+        self.name = name
+        #: Number of values or rows validated.
+        self.call_count = 0
+        #: Number of seconds spent validating.
+        self.seconds = 0.0
+        #: Number of values or rows rejected.
+        self.rejected_count = 0
+        #: List of tuples ``(location, message)`` for the first rejected values or rows.
+        self.error_samples = []
+        self._max_error_sample_count = max_error_sample_count
+
+    def add_error(self, location, message, cell=None):
+        """
+        Count a rejected value or row at ``location`` (possibly changed to
+        ``cell``) and remember ``message`` unless there already are enough
+        error samples.
+        """
+        assert location is not None
+        assert message is not None
+
+        self.rejected_count += 1
+        if len(self.error_samples) < self._max_error_sample_count:
+            sample_location = copy.copy(location)
+            if cell is not None:
+                sample_location.set_cell(cell)
+            self.error_samples.append((sample_location, message))
+
+    def merge(self, other, line_offset):
+        """
+        Add the statistics of ``other`` collected for data starting after
+        ``line_offset`` rows.
+        """
+        assert other is not None
+        assert line_offset >= 0
+
+        self.call_count += other.call_count
+        self.seconds += other.seconds
+        self.rejected_count += other.rejected_count
+        for location, message in other.error_samples:
+            if len(self.error_samples) >= self._max_error_sample_count:
+                break
+            location.line += line_offset
+            self.error_samples.append((location, message))
+
+    def __str__(self):
+        result = "%s: %d calls in %.3fs" % (_compat.text_repr(self.name), self.call_count, self.seconds)
+        if self.call_count >= 1:
+            result += " (%.1f us each)" % (1000000.0 * self.seconds / self.call_count)
+        result += ", %d rejected" % self.rejected_count
+        return result
+
+
+class ValidatorStats(object):
+    """
+    Statistics about the field formats and checks of a
+    :py:class:`BaseValidator` created with ``collect_stats=True``.
+    """
+
+    def __init__(self, cid, max_error_sample_count=DEFAULT_MAX_ERROR_SAMPLE_COUNT):
+        assert cid is not None
+
+        #: :py:class:`ValidationStats` for each field in the order of the CID.
+        self.field_stats = tuple(ValidationStats(field_name, max_error_sample_count) for field_name in cid.field_names)
+        #: :py:class:`ValidationStats` for each check in the order of the CID.
+        self.check_stats = tuple(ValidationStats(check_name, max_error_sample_count) for check_name in cid.check_names)
+
+    def merge(self, other, line_offset):
+        """
+        Add the statistics of ``other`` collected for data starting after
+        ``line_offset`` rows.
+        """
+        assert other is not None
+        assert len(self.field_stats) == len(other.field_stats)
+        assert len(self.check_stats) == len(other.check_stats)
+
+        for stats, other_stats in zip(self.field_stats + self.check_stats, other.field_stats + other.check_stats):
+            stats.merge(other_stats, line_offset)
+
+    def lines(self):
+        """
+        Human readable lines describing the statistics of all fields and
+        checks including their error samples.
+        """
+        for kind, all_stats in (("field", self.field_stats), ("check", self.check_stats)):
+            for stats in all_stats:
+                yield "%s %s" % (kind, stats)
+                for location, message in stats.error_samples:
+                    yield "  %s: %s" % (location, message)
+
+    def __str__(self):
+        return "\n".join(self.lines())
 
 
 class BaseValidator(object):
@@ -38,17 +200,31 @@ class BaseValidator(object):
     and perform row checks), perform final checks when done with all rows
     and finally release all resources required to do that.
 
-    The :py:attr:`~.location` has to be set by descendants. While
-    :py:meth:`~.validate_row` takes care of advancing the cell, descendants
-    are responsible for advancing the row (by calling
+    The :py:attr:`~.location` has to be set by descendants, which are
+    responsible for advancing the row (by calling
     :py:meth:`cutplace.errors.Location.advance_line`).
 
+    To keep the overhead per row small, the field formats are compiled to
+    validation functions once when the validator is created, see
+    :py:meth:`cutplace.fields.AbstractFieldFormat.compiled_validated`.
+
+    Fields that do not specify a
+    :py:attr:`~cutplace.fields.AbstractFieldFormat.value_cache_size`
+    themselves remember the results for up to ``value_cache_size`` recently
+    validated values; 0 means they validate all values.
+
+    If ``collect_stats`` is ``True``, the validator measures the time spent
+    on each field format and check and counts the rejected values and rows,
+    see :py:attr:`~.stats`. Otherwise the validation functions are used as
+    they are, so there is no overhead.
+
     It also provides a context manager and can consequently be used with the
     ``with`` statement.
     """
 
-    def __init__(self, cid_or_path):
+    def __init__(self, cid_or_path, collect_stats=False, value_cache_size=0):
         assert cid_or_path is not None
+        assert value_cache_size >= 0
 
         if isinstance(cid_or_path, str):
             self._cid = interface.Cid(cid_or_path)
@@ -58,6 +234,29 @@ class BaseValidator(object):
                 self._cid.data_format.is_valid
             ), "DataFormat.validate() must be called before using a CID for validation"
         self._expected_item_count = len(self._cid.field_formats)
+        self._value_cache_size = value_cache_size
+        self._field_validators = tuple(
+            field_format.compiled_validated(value_cache_size) for field_format in self._cid.field_formats
+        )
+        self._checks = tuple(self._cid.check_map[check_name] for check_name in self._cid.check_names)
+        self._check_row_functions = tuple(check.check_row for check in self._checks)
+        self._stats = None
+        if collect_stats:
+            self._stats = ValidatorStats(self._cid)
+            self._field_validators = tuple(
+                self._instrumented(field_stats, field_validator, field_index)
+                for field_index, (field_stats, field_validator) in enumerate(
+                    zip(self._stats.field_stats, self._field_validators)
+                )
+            )
+            self._check_row_functions = tuple(
+                self._instrumented(check_stats, check_row)
+                for check_stats, check_row in zip(self._stats.check_stats, self._check_row_functions)
+            )
+        self._row_view = RowView(self._cid.field_name_to_index_map)
+        self._active_check_row_functions = None
+        self._rows_until_settled_check_count = 0
+        self._reset_active_checks()
         self._location = None
         self._is_closed = False
 
@@ -88,6 +287,36 @@ class BaseValidator(object):
         """
         return self._location
 
+    @property
+    def stats(self):
+        """
+        The statistics collected so far if the validator was created with
+        ``collect_stats=True``, otherwise ``None``.
+
+        :rtype: cutplace.validio.ValidatorStats
+        """
+        return self._stats
+
+    def _instrumented(self, stats, function, cell=None):
+        """
+        Same as ``function`` but also collect ``stats`` about it, using
+        ``cell`` for the location of error samples if it is not ``None``.
+        """
+        perf_counter = time.perf_counter
+
+        def instrumented_function(*arguments):
+            start_time = perf_counter()
+            try:
+                return function(*arguments)
+            except errors.DataError as error:
+                stats.add_error(self.location, error.message, cell)
+                raise
+            finally:
+                stats.seconds += perf_counter() - start_time
+                stats.call_count += 1
+
+        return instrumented_function
+
     def validate_row(self, row):
         """
         Validate a single ``row``:
@@ -101,13 +330,37 @@ class BaseValidator(object):
            :py:meth:`cutplace.checks.AbstractCheck.check_row`)
 
         The caller is responsible for :py:attr:`~.location` pointing to the
-        correct row in the data while ``validate_row`` takes care of calling
-        :py:meth:`cutplace.errors.Location.set_cell` appropriately.
+        correct row in the data. The cell of :py:attr:`~.location` is only
+        changed in the location attached to a possible error, which refers to
+        the field that could not be accepted.
         """
         assert row is not None
         assert self.location is not None
 
-        # Validate that number of fields.
+        self._validate_item_count(row)
+
+        # Validate each field according to its format.
+        field_validators = self._field_validators
+        field_index = 0
+        try:
+            for field_index, field_value in enumerate(row):
+                if not isinstance(field_value, str):
+                    raise errors.FieldValueError(
+                        "type must be %s instead of %s: %s"
+                        % (str.__name__, type(field_value).__name__, _compat.text_repr(field_value))
+                    )
+                field_validators[field_index](field_value)
+        except errors.FieldValueError as error:
+            self._prepend_field_location(error, field_index)
+            raise
+
+        self._check_row(row)
+
+    def _validate_item_count(self, row):
+        """
+        Validate that the number of items in ``row`` matches the number of
+        fields in the CID.
+        """
         actual_item_count = len(row)
         if actual_item_count < self._expected_item_count:
             raise errors.DataError(
@@ -121,28 +374,39 @@ class BaseValidator(object):
                 self.location,
             )
 
-        # Validate each field according to its format.
-        for field_index, field_value in enumerate(row):
-            self.location.set_cell(field_index)
-            field_to_validate = self.cid.field_formats[field_index]
-            try:
-                if not isinstance(field_value, str):
-                    raise errors.FieldValueError(
-                        "type must be %s instead of %s: %s"
-                        % (str.__name__, type(field_value).__name__, _compat.text_repr(field_value))
-                    )
-                field_to_validate.validated(field_value)
-            except errors.FieldValueError as error:
-                error.prepend_message(
-                    "cannot accept field %s" % _compat.text_repr(field_to_validate.field_name), self.location
-                )
-                raise
+    def _prepend_field_location(self, error, field_index):
+        """
+        Change the location of ``error`` to the cell of the field at
+        ``field_index`` in the current row and mention the field name.
+        """
+        field_location = copy.copy(self.location)
+        field_location.set_cell(field_index)
+        error.prepend_message(
+            "cannot accept field %s" % _compat.text_repr(self.cid.field_names[field_index]), field_location
+        )
 
-        # Validate the whole row according to row checks.
-        self.location.set_cell(0)
-        field_map = _create_field_map(self.cid.field_names, row)
-        for check_name in self.cid.check_names:
-            self.cid.check_map[check_name].check_row(field_map, self.location)
+    def _reset_active_checks(self):
+        """
+        Set up the checks :py:meth:`_check_row` calls to all checks that are
+        not settled yet.
+        """
+        self._active_check_row_functions = tuple(
+            check_row for check, check_row in zip(self._checks, self._check_row_functions) if not check.is_settled
+        )
+        self._rows_until_settled_check_count = _ROWS_BETWEEN_SETTLED_CHECKS_COUNT
+
+    def _check_row(self, row):
+        """
+        Validate the whole ``row`` according to row checks.
+        """
+        if self._active_check_row_functions:
+            row_view = self._row_view
+            row_view._row = row
+            for check_row in self._active_check_row_functions:
+                check_row(row_view, self.location)
+            self._rows_until_settled_check_count -= 1
+            if self._rows_until_settled_check_count == 0:
+                self._reset_active_checks()
 
     def close(self):
         """
@@ -154,8 +418,11 @@ class BaseValidator(object):
         """
         if not self._is_closed:
             try:
-                for check_name in self.cid.check_names:
-                    self.cid.check_map[check_name].check_at_end(self.location)
+                for check_index, check in enumerate(self._checks):
+                    check_at_end = check.check_at_end
+                    if self._stats is not None:
+                        check_at_end = self._instrumented(self._stats.check_stats[check_index], check_at_end)
+                    check_at_end(self.location)
             finally:
                 for check in self.cid.check_map.values():
                     check.cleanup()
@@ -163,7 +430,16 @@ class BaseValidator(object):
 
 
 class Reader(BaseValidator):
-    def __init__(self, cid_or_path, source_data_stream_or_path, on_error="raise", validate_until=None):
+    def __init__(
+        self,
+        cid_or_path,
+        source_data_stream_or_path,
+        on_error="raise",
+        validate_until=None,
+        workers=1,
+        collect_stats=False,
+        value_cache_size=0,
+    ):
         """
         An iterator that produces possibly validated rows from
         ``source_data_stream_or_path`` conforming to ``cid_or_path``.
@@ -180,13 +456,25 @@ class Reader(BaseValidator):
           ``None`` all rows should be validated (the default); 0 means no \
           rows should be validated
         :type: int or None
+        :param int workers: number of processes \
+          :py:meth:`~cutplace.validio.Reader.validate_rows()` may use to \
+          validate chunks of the data in parallel; the default 1 validates \
+          all rows in the current process
+        :param bool collect_stats: if ``True``, collect \
+          :py:attr:`~cutplace.validio.BaseValidator.stats` about each field \
+          and check
+        :param int value_cache_size: number of recently validated values \
+          for which fields remember the result unless they specify a \
+          :py:attr:`~cutplace.fields.AbstractFieldFormat.value_cache_size` \
+          themselves; the default 0 validates all values
         """
         assert cid_or_path is not None
         assert source_data_stream_or_path is not None
         assert on_error in _VALID_ON_ERROR_CHOICES, "on_error=%r" % on_error
         assert (validate_until is None) or (validate_until >= 0)
+        assert workers >= 1, "workers=%r" % workers
 
-        super().__init__(cid_or_path)
+        super().__init__(cid_or_path, collect_stats, value_cache_size)
         # TODO: Consolidate obtaining source path with other code segments that do similar things.
         if isinstance(source_data_stream_or_path, str):
             source_path = source_data_stream_or_path
@@ -199,6 +487,11 @@ class Reader(BaseValidator):
         self._source_data_stream_or_path = source_data_stream_or_path
         self._on_error = on_error
         self._validate_until = validate_until
+        self._workers = workers
+        self._header_row_count = self._cid.data_format.header
+        # Indices ``(start, end)`` of the rows of fixed data without line
+        # delimiter to read, see `_chunk_reader()`; ``None`` means all rows.
+        self._fixed_row_range = None
         self.accepted_rows_count = None
         self.rejected_rows_count = None
 
@@ -214,6 +507,13 @@ class Reader(BaseValidator):
         elif format == data.FORMAT_DELIMITED:
             return rowio.delimited_rows(self._source_data_stream_or_path, data_format)
         elif format == data.FORMAT_FIXED:
+            if self._fixed_row_range is not None:
+                return rowio._fixed_rows_without_line_delimiter(
+                    self._source_data_stream_or_path,
+                    data_format.encoding,
+                    interface.field_names_and_lengths(self.cid),
+                    *self._fixed_row_range,
+                )
             return rowio.fixed_rows(
                 self._source_data_stream_or_path,
                 data_format.encoding,
@@ -241,7 +541,8 @@ class Reader(BaseValidator):
         self.rejected_rows_count = 0
         for check in self.cid.check_map.values():
             check.reset()
-        header_row_count = self._cid.data_format.header
+        self._reset_active_checks()
+        header_row_count = self._header_row_count
         for row_count, row in enumerate(self._raw_rows(), 1):
             try:
                 is_after_header_row = row_count > header_row_count
@@ -261,6 +562,177 @@ class Reader(BaseValidator):
                     assert self.on_error == "continue"
             self._location.advance_line()
 
+    def row_batches(self, batch_size, column_major=False, native=False):
+        """
+        Similar to :py:meth:`~cutplace.validio.Reader.rows()` but produces
+        lists of up to ``batch_size`` rows at a time. This reduces the
+        overhead per row for callers that process the data in bulk, for
+        example to insert them in a database.
+
+        The fields are validated for all rows of a batch at once using
+        :py:meth:`cutplace.fields.AbstractFieldFormat.validated_values()`.
+        Row checks and errors are still processed in the order of the rows,
+        so the result is the same as with ``rows()``. In particular, with
+        ``on_error='raise'`` the rows before a broken row are produced as
+        a last, possibly shorter batch before the error is raised.
+
+        :param int batch_size: maximum number of rows in each batch
+        :param bool column_major: if ``True``, a batch is a list with a \
+          tuple of values for each field instead of a list with a list of \
+          values for each row; this cannot be combined with \
+          ``on_error='yield'``
+        :param bool native: if ``True``, rows contain the value of each \
+          field in its native type as returned by \
+          :py:meth:`cutplace.fields.AbstractFieldFormat.validated()` \
+          instead of the ``str`` read from the data; this cannot be \
+          combined with ``validate_until``
+        :raises cutplace.errors.DataError: on broken data
+        """
+        assert batch_size >= 1, "batch_size=%r" % batch_size
+        assert not (column_major and (self.on_error == "yield")), "column_major batches cannot contain errors"
+        assert not (native and (self._validate_until is not None)), "native values require all rows to be validated"
+
+        self.accepted_rows_count = 0
+        self.rejected_rows_count = 0
+        for check in self.cid.check_map.values():
+            check.reset()
+        self._reset_active_checks()
+        raw_rows = self._raw_rows()
+        for _ in itertools.islice(raw_rows, self._header_row_count):
+            self._location.advance_line()
+        if self._validate_until is None:
+            rows_to_validate_count = None
+        else:
+            # Same as with rows(), header rows count towards validate_until.
+            rows_to_validate_count = max(0, self._validate_until - self._header_row_count)
+        has_more_raw_rows = True
+        while has_more_raw_rows:
+            raw_batch = []
+            raw_error = None
+            try:
+                for raw_row in raw_rows:
+                    raw_batch.append(raw_row)
+                    if len(raw_batch) == batch_size:
+                        break
+                else:
+                    has_more_raw_rows = False
+            except errors.DataError as error:
+                raw_error = error
+
+            if rows_to_validate_count is None:
+                rows_to_validate = raw_batch
+                rows_not_to_validate = []
+            else:
+                rows_to_validate = raw_batch[:rows_to_validate_count]
+                rows_not_to_validate = raw_batch[rows_to_validate_count:]
+                rows_to_validate_count -= len(rows_to_validate)
+
+            batch = []
+            try:
+                self._validate_batch(rows_to_validate, batch, native)
+            except errors.DataError:
+                if batch:
+                    yield list(zip(*batch)) if column_major else batch
+                raise
+            if rows_not_to_validate:
+                batch.extend(rows_not_to_validate)
+                self.accepted_rows_count += len(rows_not_to_validate)
+                self._location.advance_line(len(rows_not_to_validate))
+            if batch:
+                yield list(zip(*batch)) if column_major else batch
+            if raw_error is not None:
+                raise raw_error
+
+    def _validate_batch(self, rows, batch, native=False):
+        """
+        Validate ``rows`` and append the accepted ones to ``batch``, or in
+        case of ``on_error='yield'`` also the errors for rejected ones. If
+        ``native`` is ``True``, append lists with the native values of the
+        accepted rows instead of the rows themselves.
+
+        :raises cutplace.errors.DataError: on the first broken row if \
+          ``on_error='raise'``
+        """
+        # Validate all values of a field at once but remember only the first broken field of each row.
+        # Unlike validate_row(), this assumes that all values are str, which is the case for all raw rows.
+        row_indices_with_all_items = [
+            row_index for row_index, row in enumerate(rows) if len(row) == self._expected_item_count
+        ]
+        row_index_to_field_error_map = {}
+        native_columns = []
+        if row_indices_with_all_items:
+            if len(row_indices_with_all_items) == len(rows):
+                columns = zip(*rows)
+            else:
+                columns = zip(*(rows[row_index] for row_index in row_indices_with_all_items))
+            for field_index, (field_format, column) in enumerate(zip(self._cid.field_formats, columns)):
+                if self._stats is None:
+                    native_column, index_to_error_map = field_format._validated_values_and_errors(column)
+                else:
+                    native_column, index_to_error_map = self._instrumented_validated_values_and_errors(
+                        field_index, field_format, column, row_indices_with_all_items
+                    )
+                if native:
+                    native_columns.append(native_column)
+                for index, error in index_to_error_map.items():
+                    row_index = row_indices_with_all_items[index]
+                    if row_index not in row_index_to_field_error_map:
+                        row_index_to_field_error_map[row_index] = (field_index, error)
+
+        if native and (len(row_indices_with_all_items) != len(rows)):
+            row_index_to_native_index_map = {
+                row_index: native_index for native_index, row_index in enumerate(row_indices_with_all_items)
+            }
+        else:
+            row_index_to_native_index_map = None
+
+        # Process the rows in order to report errors and perform checks the same way as rows() does.
+        for row_index, row in enumerate(rows):
+            try:
+                self._validate_item_count(row)
+                field_index_and_error = row_index_to_field_error_map.get(row_index)
+                if field_index_and_error is not None:
+                    field_index, error = field_index_and_error
+                    self._prepend_field_location(error, field_index)
+                    raise error
+                self._check_row(row)
+                self.accepted_rows_count += 1
+                if native:
+                    native_index = (
+                        row_index if row_index_to_native_index_map is None else row_index_to_native_index_map[row_index]
+                    )
+                    batch.append([native_column[native_index] for native_column in native_columns])
+                else:
+                    batch.append(row)
+            except errors.DataError as error:
+                if self.on_error == "raise":
+                    raise
+                self.rejected_rows_count += 1
+                if self.on_error == "yield":
+                    batch.append(error)
+                else:
+                    assert self.on_error == "continue"
+            self._location.advance_line()
+
+    def _instrumented_validated_values_and_errors(self, field_index, field_format, column, row_indices):
+        """
+        Same as
+        :py:meth:`cutplace.fields.AbstractFieldFormat._validated_values_and_errors()`
+        but also collect stats for the field at ``field_index`` with
+        ``row_indices`` being the index of each value in ``column`` in the
+        current batch.
+        """
+        field_stats = self._stats.field_stats[field_index]
+        start_time = time.perf_counter()
+        result = field_format._validated_values_and_errors(column)
+        field_stats.seconds += time.perf_counter() - start_time
+        field_stats.call_count += len(column)
+        for index, error in result[1].items():
+            error_location = copy.copy(self._location)
+            error_location.advance_line(row_indices[index])
+            field_stats.add_error(error_location, error.message, field_index)
+        return result
+
     def validate_rows(self):
         """
         Validate that the data read from
@@ -270,18 +742,153 @@ class Reader(BaseValidator):
         In order to check everything, :py:meth:`~.Reader.close()` has to be
         called to also validate the checks at the end of the data.
 
+        If the reader has more than one ``workers``, the data are split in
+        chunks that are validated in parallel processes. This only works for
+        delimited and fixed data read from a path with ``on_error='raise'``
+        and without ``validate_until``, and only if all checks support
+        :py:meth:`cutplace.checks.AbstractCheck.merge`. Otherwise the data
+        are validated in the current process.
+
         :raises cutplace.errors.DataError: on broken data
         """
-        for _ in self.rows():
-            pass
+        chunks = self._parallel_chunks()
+        if chunks is None:
+            for _ in self.rows():
+                pass
+        else:
+            self._validate_chunks_in_parallel(chunks)
+
+    def _parallel_chunks(self):
+        """
+        Iterator for the byte ranges ``(start, end)`` of the data to validate
+        in parallel or ``None`` if the data have to be validated serially.
+        """
+        result = None
+        data_format = self.cid.data_format
+        can_validate_in_parallel = (
+            (self._workers >= 2)
+            and isinstance(self._source_data_stream_or_path, str)
+            and (self.on_error == "raise")
+            and (self._validate_until is None)
+            and (data_format.format in (data.FORMAT_DELIMITED, data.FORMAT_FIXED))
+            and all(type(check).merge is not checks.AbstractCheck.merge for check in self._checks)
+        )
+        if can_validate_in_parallel:
+            data_path = self._source_data_stream_or_path
+            chunk_size = max(_MIN_CHUNK_SIZE, os.path.getsize(data_path) // (self._workers * _CHUNKS_PER_WORKER))
+            if data_format.format == data.FORMAT_DELIMITED:
+                possible_chunks = rowio.delimited_chunks(data_path, data_format, chunk_size)
+            else:
+                possible_chunks = rowio.fixed_chunks(
+                    data_path,
+                    data_format.encoding,
+                    interface.field_names_and_lengths(self.cid),
+                    data_format.line_delimiter,
+                    chunk_size,
+                )
+            if possible_chunks is not None:
+                # Only go parallel if there actually are at least 2 chunks.
+                possible_chunks = iter(possible_chunks)
+                first_chunks = list(itertools.islice(possible_chunks, 2))
+                if len(first_chunks) == 2:
+                    result = itertools.chain(first_chunks, possible_chunks)
+        return result
+
+    def _validate_chunks_in_parallel(self, chunks):
+        """
+        Validate the byte ranges in ``chunks`` using parallel worker
+        processes and merge their results in the order of the chunks so that
+        errors and checks are the same as when validating serially.
+        """
+        assert self._location.line == 0
+
+        data_path = self._source_data_stream_or_path
+        self.accepted_rows_count = 0
+        self.rejected_rows_count = 0
+        for check in self._checks:
+            check.reset()
+        collect_stats = self._stats is not None
+        tasks = (
+            (chunk_index, data_path, start, end, collect_stats, self._value_cache_size)
+            for chunk_index, (start, end) in enumerate(chunks)
+        )
+        row_offset = 0
+        with concurrent.futures.ProcessPoolExecutor(
+            self._workers, None, _init_parallel_worker, (self.cid,)
+        ) as executor:
+            # Submit only a few chunks in advance to limit the memory needed for pending results.
+            max_pending_result_count = _CHUNKS_PER_WORKER * self._workers
+            pending_results = collections.deque()
+            try:
+                for task in tasks:
+                    pending_results.append(executor.submit(_validate_chunk, task))
+                    if len(pending_results) >= max_pending_result_count:
+                        row_offset = self._merged_chunk_row_offset(pending_results.popleft().result(), row_offset)
+                while pending_results:
+                    row_offset = self._merged_chunk_row_offset(pending_results.popleft().result(), row_offset)
+            except BaseException:
+                executor.shutdown(cancel_futures=True)
+                raise
+        if row_offset > 0:
+            self._location.advance_line(row_offset)
+
+    def _merged_chunk_row_offset(self, chunk_result, row_offset):
+        """
+        Merge the ``chunk_result`` of :py:func:`_validate_chunk` for a chunk
+        starting after ``row_offset`` rows and return the row offset for the
+        next chunk.
+
+        :raises cutplace.errors.DataError: for the first row in the chunk that \
+          would have resulted in an error during a serial validation
+        """
+        chunk_start, chunk_end, row_count, accepted_rows_count, chunk_error, chunk_checks, chunk_stats = chunk_result
+        if chunk_stats is not None:
+            self._stats.merge(chunk_stats, row_offset)
+        errors_found = []
+        if chunk_error is not None:
+            data_path = self._source_data_stream_or_path
+            if isinstance(chunk_error, errors.DataFormatError) and (
+                self.cid.data_format.format == data.FORMAT_DELIMITED
+            ):
+                # Errors of the CSV parser refer to physical lines instead of rows.
+                line_offset = _physical_line_count(data_path, chunk_start)
+            else:
+                line_offset = row_offset
+            _shift_error_lines(chunk_error, line_offset)
+            errors_found.append(chunk_error)
+        for check, chunk_check in zip(self._checks, chunk_checks):
+            try:
+                check.merge(chunk_check, row_offset)
+            except errors.CheckError as merge_error:
+                if isinstance(check, checks.IsUniqueCheck):
+                    # Workers keep only the digests of keys, so read the duplicate row again to report its key.
+                    duplicate_row = self._chunk_row(chunk_start, chunk_end, merge_error.location.line - row_offset)
+                    merge_error = check.duplicate_error_with_row_key(
+                        merge_error, RowView(self.cid.field_name_to_index_map, duplicate_row)
+                    )
+                errors_found.append(merge_error)
+        if errors_found:
+            # Report the error that a serial validation would have found first.
+            raise min(errors_found, key=lambda error: error.location.line)
+        self.accepted_rows_count += accepted_rows_count
+        return row_offset + row_count
+
+    def _chunk_row(self, chunk_start, chunk_end, row_index):
+        """
+        The raw row at ``row_index`` of the chunk from byte ``chunk_start``
+        to ``chunk_end``.
+        """
+        # NOTE: Do not close the reader because this would clean up the checks.
+        with _chunk_reader(self.cid, self._source_data_stream_or_path, chunk_start, chunk_end) as chunk_reader:
+            return next(itertools.islice(chunk_reader._raw_rows(), row_index, None))
 
 
 class Writer(BaseValidator):
-    def __init__(self, cid_or_path, target):
+    def __init__(self, cid_or_path, target, collect_stats=False, value_cache_size=0):
         assert cid_or_path is not None
         assert target is not None
 
-        super().__init__(cid_or_path)
+        super().__init__(cid_or_path, collect_stats, value_cache_size)
 
         data_format = cid_or_path.data_format
         assert self.cid.data_format.is_valid
@@ -345,6 +952,91 @@ class Writer(BaseValidator):
                 self._delegated_writer = None
 
 
+def _init_parallel_worker(cid):
+    global _worker_cid
+    _worker_cid = cid
+
+
+@contextlib.contextmanager
+def _chunk_reader(cid, data_path, start, end, collect_stats=False, value_cache_size=0):
+    """
+    Reader for the chunk of ``data_path`` from byte ``start`` to ``end``
+    as computed by :py:meth:`Reader._parallel_chunks()`. Fixed data
+    without line delimiter are read from a memory map using the indices of
+    the rows in the chunk, other data from a text stream of its bytes.
+    """
+    data_format = cid.data_format
+    chunk_stream = None
+    if (data_format.format == data.FORMAT_FIXED) and (data_format.line_delimiter is None):
+        row_width = sum(length for _, length in interface.field_names_and_lengths(cid))
+        assert start % row_width == 0, "start=%d must be at the start of a row of width %d" % (start, row_width)
+        result = Reader(cid, data_path, collect_stats=collect_stats, value_cache_size=value_cache_size)
+        # Round up the end row so that an incomplete last row results in an error.
+        result._fixed_row_range = (start // row_width, -(-end // row_width))
+    else:
+        newline = "" if data_format.format == data.FORMAT_DELIMITED else None
+        chunk_stream = rowio.open_byte_range(data_path, start, end, data_format.encoding, newline)
+        result = Reader(cid, chunk_stream, collect_stats=collect_stats, value_cache_size=value_cache_size)
+    try:
+        yield result
+    finally:
+        if chunk_stream is not None:
+            chunk_stream.close()
+
+
+def _validate_chunk(task):
+    """
+    Validate a chunk of data in a parallel worker process.
+
+    :return: tuple of chunk start and end, number of rows read, \
+      number of rows accepted, the first :py:exc:`cutplace.errors.DataError` \
+      or ``None``, the row checks with their state after the last row and \
+      the :py:class:`ValidatorStats` or ``None``
+    """
+    chunk_index, data_path, start, end, collect_stats, value_cache_size = task
+    chunk_error = None
+    # NOTE: Do not close the reader because this would call `check_at_end()`.
+    with _chunk_reader(_worker_cid, data_path, start, end, collect_stats, value_cache_size) as reader:
+        if chunk_index > 0:
+            # Only the first chunk contains the header.
+            reader._header_row_count = 0
+        try:
+            reader.validate_rows()
+        except errors.DataError as error:
+            chunk_error = error
+    return start, end, reader.location.line, reader.accepted_rows_count, chunk_error, reader._checks, reader.stats
+
+
+def _shift_error_lines(error, line_offset):
+    """
+    Shift the lines of the locations of ``error`` by ``line_offset``.
+    """
+    for location in (error.location, error.see_also_location):
+        if location is not None:
+            location.line += line_offset
+
+
+def _physical_line_count(data_path, end):
+    """
+    Number of lines as counted by :py:attr:`csv.reader.line_num` in the
+    first ``end`` bytes of ``data_path``, which must end with a line feed.
+    """
+    result = 0
+    is_after_carriage_return = False
+    with io.open(data_path, "rb") as data_file:
+        remaining_size = end
+        while remaining_size > 0:
+            block = data_file.read(min(remaining_size, 1024 * 1024))
+            assert block, "end=%d must be within data_path=%r" % (end, data_path)
+            remaining_size -= len(block)
+            # Count "\n", "\r\n" and "\r" each as one line.
+            result += block.count(b"\n") + block.count(b"\r") - block.count(b"\r\n")
+            if is_after_carriage_return and block.startswith(b"\n"):
+                result -= 1
+            is_after_carriage_return = block.endswith(b"\r")
+    return result
+
+
 def rows(cid_or_path, data_stream_or_path, on_error="raise", validate_until=None):
     """
     Rows read from ``data`` and validated against ``cid_or_path``.
@@ -370,7 +1062,7 @@ def rows(cid_or_path, data_stream_or_path, on_error="raise", validate_until=None
             yield row
 
 
-def validate(cid_or_path, data_stream_or_path, validate_until=None):
+def validate(cid_or_path, data_stream_or_path, validate_until=None, workers=1):
     """
     Validate that ``data_or_path`` conform to ``cid_or_path``.
 
@@ -378,16 +1070,18 @@ def validate(cid_or_path, data_stream_or_path, validate_until=None):
       describing a path pointing to a CID
     :param data_stream_or_path: filelike object or :py:class:`str` \
       describing a path pointing to the data to be read
+    :param int workers: same as ``workers`` for :py:class:`cutplace.Reader`
     :raises cutplace.errors.DataError: on broken data
     :raises cutplace.errors.InterfaceError: on a broken CID
     """
     assert cid_or_path is not None
     assert data_stream_or_path is not None
     assert (validate_until is None) or (validate_until >= 0)
+    assert workers >= 1, "workers=%r" % workers
 
-    with Reader(cid_or_path, data_stream_or_path, validate_until=validate_until) as reader:
-        rows_to_validate = reader.rows()
-        if validate_until is not None:
-            rows_to_validate = itertools.islice(rows_to_validate, validate_until)
-        for _ in rows_to_validate:
-            pass
+    with Reader(cid_or_path, data_stream_or_path, validate_until=validate_until, workers=workers) as reader:
+        if validate_until is None:
+            reader.validate_rows()
+        else:
+            for _ in itertools.islice(reader.rows(), validate_until):
+                pass
@@ -18,7 +18,13 @@ Tests for cutplace application.
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 import logging
 import os
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
 import unittest
+from contextlib import closing
 
 from cutplace import applications
 from tests import _ods, dev_test
@@ -214,6 +220,59 @@ class CutplaceMainTest(unittest.TestCase):
         data_path = dev_test.path_to_test_data("broken_customers.csv")
         self.assertEqual(1, applications.main(["test", _customers_cid_path, data_path]))
 
+    def test_can_validate_proper_data_with_jobs(self):
+        self.assertEqual(0, applications.main(["test", "--jobs", "2", _customers_cid_path, _valid_customers_csv_path]))
+
+    def test_can_validate_several_files_with_jobs(self):
+        broken_data_path = dev_test.path_to_test_data("broken_customers.csv")
+        data_paths = [_valid_customers_csv_path, broken_data_path, _valid_customers_csv_path]
+        with self.assertLogs("cutplace", logging.INFO) as logs:
+            self.assertEqual(1, applications.main(["test", "--jobs", "2", _customers_cid_path] + data_paths))
+        validated_paths = [record.args[0] for record in logs.records if record.msg == 'validate "%s"']
+        self.assertEqual(data_paths, validated_paths)
+        self.assertEqual(1, len([record for record in logs.records if record.levelno == logging.ERROR]))
+
+    def test_can_deal_with_non_existent_data_with_jobs(self):
+        self.assertEqual(
+            3,
+            applications.main(
+                ["test", "--jobs", "2", _customers_cid_path, _valid_customers_csv_path, "no_such_data.xxx"]
+            ),
+        )
+
+    def test_can_validate_proper_data_with_stats(self):
+        self.assertEqual(0, applications.main(["test", "--stats", _customers_cid_path, _valid_customers_csv_path]))
+
+    def test_can_validate_proper_data_with_value_cache(self):
+        self.assertEqual(
+            0, applications.main(["test", "--value-cache", "100", _customers_cid_path, _valid_customers_csv_path])
+        )
+
+    def test_fails_on_value_cache_less_than_0(self):
+        self._test_fails_with_system_exit(2, ["test", "--value-cache", "-1", _customers_cid_path])
+
+    def test_fails_on_jobs_less_than_1(self):
+        self._test_fails_with_system_exit(2, ["test", "--jobs", "0", _customers_cid_path])
+
+    def test_fails_on_invalid_port(self):
+        self._test_fails_with_system_exit(2, ["test", "--serve", "--port", "-1"])
+
+    def test_can_validate_proper_data_with_cached_cid(self):
+        previous_cache_home = os.environ.get("XDG_CACHE_HOME")
+        with tempfile.TemporaryDirectory() as cache_home:
+            os.environ["XDG_CACHE_HOME"] = cache_home
+            try:
+                for _ in range(2):
+                    self.assertEqual(
+                        0, applications.main(["test", "--cache", _customers_cid_path, _valid_customers_csv_path])
+                    )
+                self.assertEqual(1, len(os.listdir(os.path.join(cache_home, "cutplace"))))
+            finally:
+                if previous_cache_home is None:
+                    del os.environ["XDG_CACHE_HOME"]
+                else:
+                    os.environ["XDG_CACHE_HOME"] = previous_cache_home
+
     def test_can_deal_with_broken_cid(self):
         broken_cid_path = dev_test.path_to_test_cid("broken_syntax_error.ods")
         self.assertEqual(1, applications.main(["test", broken_cid_path]))
@@ -224,6 +283,88 @@ class CutplaceMainTest(unittest.TestCase):
     def test_can_deal_with_non_existent_data(self):
         self.assertEqual(3, applications.main(["test", _customers_cid_path, "no_such_data.xxx"]))
 
+    def test_can_start_without_importing_optional_modules(self):
+        optional_module_names = ["importlib.metadata", "numpy", "sqlite3", "tkinter", "xlrd", "xlsxwriter", "zipfile"]
+        imported_module_names = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, cutplace.applications; print(' '.join(sorted(sys.modules)))",
+            ],
+            check=True,
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+        ).stdout.split()
+        self.assertEqual([], [name for name in optional_module_names if name in imported_module_names])
+
+    def test_can_import_public_names_when_used(self):
+        import cutplace
+        from cutplace import validio
+
+        self.assertIs(validio.Reader, cutplace.Reader)
+        self.assertRegex(cutplace.__version__, r"^\d+\.\d+")
+        self.assertTrue(set(cutplace.__all__) <= set(dir(cutplace)))
+        self.assertRaises(AttributeError, getattr, cutplace, "no_such_name")
+
+    def test_has_same_server_defaults(self):
+        from cutplace import server
+
+        self.assertEqual(server.DEFAULT_HOST, applications.DEFAULT_HOST)
+        self.assertEqual(server.DEFAULT_PORT, applications.DEFAULT_PORT)
+
+    def test_has_same_load_defaults(self):
+        from cutplace import sql
+
+        self.assertEqual(sql.DEFAULT_LOAD_BATCH_SIZE, applications.DEFAULT_LOAD_BATCH_SIZE)
+        self.assertEqual(sql.DEFAULT_LOAD_TRANSACTION_SIZE, applications.DEFAULT_LOAD_TRANSACTION_SIZE)
+
+    def test_can_load_sqlite(self):
+        with tempfile.TemporaryDirectory() as temp_folder:
+            database_path = os.path.join(temp_folder, "customers.db")
+            for _ in range(2):
+                self.assertEqual(
+                    0,
+                    applications.main(
+                        ["test", "--load-sqlite", database_path, _customers_cid_path, _valid_customers_csv_path]
+                    ),
+                )
+            with closing(sqlite3.connect(database_path)) as connection:
+                (customer_count,) = connection.execute("select count(1) from cid_customers").fetchone()
+        self.assertEqual(20, customer_count)
+
+    def test_can_deal_with_broken_data_for_load_sqlite(self):
+        broken_data_path = dev_test.path_to_test_data("broken_customers.csv")
+        with tempfile.TemporaryDirectory() as temp_folder:
+            database_path = os.path.join(temp_folder, "customers.db")
+            self.assertEqual(
+                1, applications.main(["test", "--load-sqlite", database_path, _customers_cid_path, broken_data_path])
+            )
+
+    def test_fails_on_load_sqlite_with_until(self):
+        self._test_fails_with_system_exit(2, ["test", "--load-sqlite", "x.db", "--until", "1", _customers_cid_path])
+
+    def test_fails_on_load_sqlite_with_jobs(self):
+        self._test_fails_with_system_exit(
+            2, ["test", "--load-sqlite", "x.db", "--jobs", "2", _customers_cid_path, _valid_customers_csv_path]
+        )
+
+    def test_fails_on_load_sqlite_without_data(self):
+        self._test_fails_with_system_exit(2, ["test", "--load-sqlite", "x.db", _customers_cid_path])
+
+    def test_can_load_sqlite_into_table_named_after_cid_with_hyphen(self):
+        with tempfile.TemporaryDirectory() as temp_folder:
+            cid_path = os.path.join(temp_folder, "cid-customers.ods")
+            shutil.copyfile(_customers_cid_path, cid_path)
+            database_path = os.path.join(temp_folder, "customers.db")
+            self.assertEqual(
+                0, applications.main(["test", "--load-sqlite", database_path, cid_path, _valid_customers_csv_path])
+            )
+            with closing(sqlite3.connect(database_path)) as connection:
+                self.assertGreater(connection.execute('select count(1) from "cid-customers"').fetchone()[0], 0)
+
+    def test_fails_on_load_batch_less_than_1(self):
+        self._test_fails_with_system_exit(2, ["test", "--load-batch", "0", _customers_cid_path])
+
     def _test_fails_with_system_exit(self, expected_code, argv):
         try:
             applications.main(argv)
@@ -0,0 +1,94 @@
+"""
+Tests for the :py:mod:`cutplace.bench` module.
+"""
+
+# Copyright (C) 2009-2021 Thomas Aglassinger
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License
+# for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from cutplace import bench, interface, validio
+
+_ROW_COUNT = 20
+
+
+class BenchTest(unittest.TestCase):
+    def setUp(self):
+        self._bench_folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self._bench_folder)
+
+    def test_can_create_same_dataset_rows_for_same_seed(self):
+        self.assertEqual(list(bench.dataset_rows(_ROW_COUNT, 3)), list(bench.dataset_rows(_ROW_COUNT, 3)))
+        self.assertNotEqual(list(bench.dataset_rows(_ROW_COUNT, 3)), list(bench.dataset_rows(_ROW_COUNT, 4)))
+
+    def test_can_validate_written_datasets(self):
+        for data_format_name in bench.DATA_FORMATS:
+            cid_path, data_path = bench.write_dataset(self._bench_folder, data_format_name, _ROW_COUNT)
+            cid = interface.Cid(cid_path)
+            with validio.Reader(cid, data_path) as reader:
+                reader.validate_rows()
+            self.assertEqual(_ROW_COUNT, reader.accepted_rows_count, "data_format_name=%r" % data_format_name)
+
+    def test_can_run_benchmarks(self):
+        results = bench.run_benchmarks(self._bench_folder, _ROW_COUNT, ["delimited"])
+        self.assertEqual(_ROW_COUNT, results["row_count"])
+        name_to_result_map = {result["name"]: result for result in results["results"]}
+        for name in ["rowio-delimited", "reader-delimited", "writer-delimited", "field-id"]:
+            self.assertEqual(_ROW_COUNT, name_to_result_map[name]["rows"])
+            self.assertGreater(name_to_result_map[name]["rows_per_second"], 0)
+        self.assertGreater(name_to_result_map["startup"]["rows_per_second"], 0)
+        self.assertEqual(
+            len(bench.FIELD_NAMES), len([name for name in name_to_result_map if name.startswith("field-")])
+        )
+
+    def test_can_detect_regressions(self):
+        baseline = {"results": [{"name": "a", "rows_per_second": 100}, {"name": "b", "rows_per_second": 100}]}
+        results = {
+            "results": [
+                {"name": "a", "rows_per_second": 91},
+                {"name": "b", "rows_per_second": 89},
+                {"name": "c", "rows_per_second": 1},
+            ]
+        }
+        self.assertEqual([("b", 100, 89)], bench.regressions(results, baseline, 10))
+        self.assertEqual([("a", 100, 91), ("b", 100, 89)], bench.regressions(results, baseline, 0))
+
+    def test_can_compare_with_baseline(self):
+        baseline_path = os.path.join(self._bench_folder, "baseline.json")
+        results_path = os.path.join(self._bench_folder, "results.json")
+        bench_arguments = ["cutplace-bench", "--folder", self._bench_folder, "--rows", str(_ROW_COUNT), "--format"]
+        self.assertEqual(0, bench.main(bench_arguments + ["fixed", "--output", baseline_path]))
+        with io.open(baseline_path, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        for result in baseline["results"]:
+            result["rows_per_second"] *= 1000
+        with io.open(baseline_path, "w", encoding="utf-8") as baseline_file:
+            json.dump(baseline, baseline_file)
+        self.assertEqual(
+            1, bench.main(bench_arguments + ["fixed", "--output", results_path, "--baseline", baseline_path])
+        )
+
+    def test_fails_on_negative_rows(self):
+        self.assertRaises(SystemExit, bench.main, ["cutplace-bench", "--rows", "-1"])
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -16,10 +16,14 @@ Tests for `checks` module.
 #
 # You should have received a copy of the GNU Lesser General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import gc
 import logging
+import os
+import pickle
 import unittest
 
 from cutplace import checks, errors
+from tests import dev_test
 
 _TEST_FIELD_NAMES = "branch_id customer_id first_name surname gender date_of_birth".split()
 
@@ -104,6 +108,114 @@ class IsUniqueCheckTest(_AbstractCheckTest):
         check.check_at_end(location)
         check.cleanup()
 
+    def test_fails_on_duplicate_spilled_to_disk(self):
+        field_names = ["customer_id"]
+        check = checks.IsUniqueCheck("test check", "customer_id", field_names)
+        check.max_keys_in_memory = 3
+        location = errors.Location(self.test_fails_on_duplicate_spilled_to_disk, has_cell=True)
+        for customer_id in range(10):
+            location.advance_line()
+            check.check_row(_create_field_map(field_names, [customer_id]), location)
+        spill_path = check._spill_path
+        self.assertIsNotNone(spill_path)
+        self.assertTrue(os.path.exists(spill_path))
+        location.advance_line()
+        try:
+            check.check_row(_create_field_map(field_names, [1]), location)
+            self.fail("duplicate row must cause CheckError")
+        except errors.CheckError as error:
+            self.assertEqual(error.location.line, 11)
+            self.assertEqual(error.see_also_location.line, 2)
+            self.assertIn("must be unique: (1,)", str(error))
+        check.cleanup()
+        self.assertFalse(os.path.exists(spill_path))
+
+    def test_can_pickle_spilled_check(self):
+        field_names = ["customer_id"]
+        check = checks.IsUniqueCheck("test check", "customer_id", field_names)
+        check.max_keys_in_memory = 2
+        location = errors.Location(self.test_can_pickle_spilled_check, has_cell=True)
+        for customer_id in range(5):
+            location.advance_line()
+            check.check_row(_create_field_map(field_names, [customer_id]), location)
+        unpickled_check = pickle.loads(pickle.dumps(check))
+        location.advance_line()
+        self.assertRaises(errors.CheckError, unpickled_check.check_row, _create_field_map(field_names, [0]), location)
+        unpickled_check.cleanup()
+
+    def test_can_hand_over_spilled_keys_when_pickling(self):
+        field_names = ["customer_id"]
+        check = checks.IsUniqueCheck("test check", "customer_id", field_names)
+        check.max_keys_in_memory = 2
+        location = errors.Location(self.test_can_hand_over_spilled_keys_when_pickling, has_cell=True)
+        for customer_id in range(5):
+            location.advance_line()
+            check.check_row(_create_field_map(field_names, [customer_id]), location)
+        spill_path = check._spill_path
+        unpickled_check = pickle.loads(pickle.dumps(check))
+        self.assertIsNone(check._spill_path)
+        check.cleanup()
+        self.assertTrue(os.path.exists(spill_path))
+        self.assertEqual(spill_path, unpickled_check._spill_path)
+        unpickled_check.cleanup()
+        self.assertFalse(os.path.exists(spill_path))
+
+    def test_can_remove_spilled_keys_without_cleanup(self):
+        field_names = ["customer_id"]
+        check = checks.IsUniqueCheck("test check", "customer_id", field_names)
+        check.max_keys_in_memory = 2
+        location = errors.Location(self.test_can_remove_spilled_keys_without_cleanup, has_cell=True)
+        for customer_id in range(5):
+            location.advance_line()
+            check.check_row(_create_field_map(field_names, [customer_id]), location)
+        spill_path = check._spill_path
+        self.assertTrue(os.path.exists(spill_path))
+        del check
+        gc.collect()
+        self.assertFalse(os.path.exists(spill_path))
+
+    def test_can_skip_lookup_of_keys_not_spilled(self):
+        field_names = ["customer_id"]
+        check = checks.IsUniqueCheck("test check", "customer_id", field_names)
+        check.max_keys_in_memory = 100
+        location = errors.Location(self.test_can_skip_lookup_of_keys_not_spilled, has_cell=True)
+        for customer_id in range(1000):
+            location.advance_line()
+            check.check_row(_create_field_map(field_names, [customer_id]), location)
+        self.assertTrue(all(check._might_be_spilled(checks._key_digest((customer_id,))) for customer_id in range(1000)))
+        possibly_spilled_count = sum(
+            check._might_be_spilled(checks._key_digest((customer_id,))) for customer_id in range(1000, 11000)
+        )
+        self.assertLess(possibly_spilled_count, 100)
+        check.cleanup()
+
+    def test_fails_on_duplicate_in_merged_check(self):
+        field_names = ["customer_id"]
+        location = errors.Location(self.test_fails_on_duplicate_in_merged_check, has_cell=True)
+        check = checks.IsUniqueCheck("test check", "customer_id", field_names)
+        for customer_id in [1, 2, 3]:
+            check.check_row(_create_field_map(field_names, [customer_id]), location)
+            location.advance_line()
+        other_location = errors.Location(self.test_fails_on_duplicate_in_merged_check, has_cell=True)
+        other_check = checks.IsUniqueCheck("test check", "customer_id", field_names)
+        other_check.max_keys_in_memory = 2
+        for customer_id in [4, 5, 6, 2]:
+            other_check.check_row(_create_field_map(field_names, [customer_id]), other_location)
+            other_location.advance_line()
+        try:
+            check.merge(other_check, 3)
+            self.fail("duplicate row must cause CheckError")
+        except errors.CheckError as error:
+            self.assertEqual(error.location.line, 6)
+            self.assertEqual(error.see_also_location.line, 1)
+            self.assertNotIn("must be unique:", str(error))
+            error_with_row_key = check.duplicate_error_with_row_key(error, _create_field_map(field_names, [2]))
+            self.assertIn("must be unique: (2,)", str(error_with_row_key))
+            self.assertEqual(6, error_with_row_key.location.line)
+            self.assertEqual(1, error_with_row_key.see_also_location.line)
+        self.assertIsNone(other_check._spill_path)
+        check.cleanup()
+
     def test_fails_on_rule_without_fields(self):
         field_names = _TEST_FIELD_NAMES
         self.assertRaises(errors.InterfaceError, checks.IsUniqueCheck, "test check", "", field_names)
@@ -141,6 +253,28 @@ class IsUniqueCheckTest(_AbstractCheckTest):
         )
 
 
+class DigestToLineTableTest(unittest.TestCase):
+    def test_can_grow_and_find_digests(self):
+        table = checks._DigestToLineTable()
+        key_count = 3 * checks._MIN_DIGEST_TABLE_CAPACITY
+        digests = [checks._key_digest((customer_id,)) for customer_id in range(key_count)]
+        for line, digest in enumerate(digests):
+            table.add(digest, line)
+        self.assertEqual(key_count, len(table))
+        self.assertEqual(list(range(key_count)), [table.get(digest) for digest in digests])
+        self.assertIsNone(table.get(checks._key_digest((key_count,))))
+        self.assertEqual(sorted(zip(digests, range(key_count))), sorted(table.items()))
+
+    def test_can_store_line_0_and_clear(self):
+        table = checks._DigestToLineTable()
+        digest = checks._key_digest(("x",))
+        table.add(digest, 0)
+        self.assertEqual(0, table.get(digest))
+        table.clear()
+        self.assertEqual(0, len(table))
+        self.assertIsNone(table.get(digest))
+
+
 class DistinctCountCheckTest(unittest.TestCase):
     def test_fails_on_too_many_distinct_values(self):
         field_names = _TEST_FIELD_NAMES
@@ -155,6 +289,93 @@ class DistinctCountCheckTest(unittest.TestCase):
         check.check_row(_create_field_map(field_names, [38003, 59, "Jane", "Miller", "female", "04.10.1946"]), location)
         self.assertRaises(errors.CheckError, check.check_at_end, location)
 
+    def test_can_settle_early(self):
+        field_names = ["customer_id"]
+        check = checks.DistinctCountCheck("test check", "customer_id < 3", field_names)
+        location = errors.Location(self.test_can_settle_early, has_cell=True)
+        for customer_id in [1, 2, 2, 1]:
+            check.check_row(_create_field_map(field_names, [customer_id]), location)
+        self.assertFalse(check.is_settled)
+        for customer_id in [3, 4, 5]:
+            check.check_row(_create_field_map(field_names, [customer_id]), location)
+        self.assertTrue(check.is_settled)
+        dev_test.assert_raises_and_fnmatches(
+            self,
+            errors.CheckError,
+            "*distinct count is at least 3 but check requires: 'count < 3'",
+            check.check_at_end,
+            location,
+        )
+
+    def test_can_merge_distinct_values(self):
+        field_names = ["customer_id"]
+        location = errors.Location(self.test_can_merge_distinct_values, has_cell=True)
+        check = checks.DistinctCountCheck("test check", "customer_id <= 4", field_names)
+        other_check = checks.DistinctCountCheck("test check", "customer_id <= 4", field_names)
+        for customer_id in [1, 2, 3]:
+            check.check_row(_create_field_map(field_names, [customer_id]), location)
+            other_check.check_row(_create_field_map(field_names, [customer_id + 1]), location)
+        check.merge(other_check, 3)
+        check.check_at_end(location)
+        other_check.reset()
+        other_check.check_row(_create_field_map(field_names, [5]), location)
+        check.merge(other_check, 6)
+        self.assertTrue(check.is_settled)
+        self.assertRaises(errors.CheckError, check.check_at_end, location)
+
+    def test_can_approximate_distinct_count(self):
+        field_names = ["customer_id"]
+        location = errors.Location(self.test_can_approximate_distinct_count, has_cell=True)
+        check = checks.DistinctCountCheck("test check", "approximate: customer_id >= 9500", field_names)
+        self.assertEqual(check.approximate_error, checks.DEFAULT_APPROXIMATE_DISTINCT_COUNT_ERROR)
+        other_check = checks.DistinctCountCheck("test check", "approximate: customer_id >= 9500", field_names)
+        for customer_id in range(5000):
+            check.check_row(_create_field_map(field_names, [customer_id]), location)
+            other_check.check_row(_create_field_map(field_names, [customer_id + 5000]), location)
+        check.merge(other_check, 5000)
+        self.assertAlmostEqual(check._distinct_count(), 10000, delta=300)
+        check.check_at_end(location)
+
+    def test_can_approximate_with_error(self):
+        field_names = ["customer_id"]
+        check = checks.DistinctCountCheck("test check", "approximate(0.05): customer_id < 3", field_names)
+        self.assertEqual(check.approximate_error, 0.05)
+        self.assertFalse(check.is_settled)
+
+    def test_can_approximate_with_smallest_error(self):
+        field_names = ["customer_id"]
+        check = checks.DistinctCountCheck("test check", "approximate(0.00204): customer_id < 3", field_names)
+        self.assertEqual(checks._MAX_HYPER_LOG_LOG_PRECISION, check._sketch._precision)
+        check.approximate_error = checks.MIN_APPROXIMATE_DISTINCT_COUNT_ERROR
+        self.assertEqual(checks._MAX_HYPER_LOG_LOG_PRECISION, check._sketch._precision)
+
+    def test_fails_on_too_small_approximate_error(self):
+        dev_test.assert_raises_and_fnmatches(
+            self,
+            errors.InterfaceError,
+            "*error of approximate must be at least 0.00203 but is: 0.001",
+            checks.DistinctCountCheck,
+            "broken",
+            "approximate(0.001): customer_id < 3",
+            ["customer_id"],
+        )
+
+    def test_can_count_field_named_approximate(self):
+        field_names = ["approximate"]
+        check = checks.DistinctCountCheck("test check", "approximate < 3", field_names)
+        self.assertIsNone(check.approximate_error)
+
+    def test_fails_on_broken_approximate_option(self):
+        field_names = ["customer_id"]
+        for broken_rule in [
+            "approximate(): customer_id < 3",
+            "approximate(x): customer_id < 3",
+            "approximate(0): customer_id < 3",
+            "approximate(1.5): customer_id < 3",
+            "approximate(0.1) customer_id < 3",
+        ]:
+            self.assertRaises(errors.InterfaceError, checks.DistinctCountCheck, "broken", broken_rule, field_names)
+
     def test_fails_on_broken_check_rule(self):
         field_names = _TEST_FIELD_NAMES
         self.assertRaises(errors.InterfaceError, checks.DistinctCountCheck, "broken", "", field_names)
@@ -17,6 +17,7 @@ Tests for data formats.
 # You should have received a copy of the GNU Lesser General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 import doctest
+import gc
 import os.path
 import unittest
 
@@ -29,6 +30,9 @@ def _path_to_docs_file(file_name):
 class DocumentationTest(unittest.TestCase):
     def test_can_run_examples_in_api_rst(self):
         doctest.testfile(_path_to_docs_file("api.rst"))
+        # Remove the plugin classes defined by the examples, which otherwise
+        # might clash with the plugins imported by later tests.
+        gc.collect()
 
 
 if __name__ == "__main__":
@@ -2,6 +2,7 @@
 """
 Tests  for field formats.
 """
+
 # Copyright (C) 2009-2021 Thomas Aglassinger
 #
 # This program is free software: you can redistribute it and/or modify it
@@ -18,9 +19,13 @@ Tests  for field formats.
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 import decimal
 import logging
+import os
+import pickle
+import tempfile
+import time
 import unittest
 
-from cutplace import data, errors, fields
+from cutplace import _vectorized, data, errors, fields
 from tests import dev_test
 
 _ANY_FORMAT = data.DataFormat(data.FORMAT_DELIMITED)
@@ -81,6 +86,58 @@ class AbstractFieldFormatTest(unittest.TestCase):
             "abxba",
         )
 
+    def test_can_validate_characters_with_open_ranges(self):
+        data_format = data.DataFormat(data.FORMAT_DELIMITED)
+        data_format.set_property(data.KEY_ALLOWED_CHARACTERS, '..."\\t", " "...')
+        field_format = fields.TextFieldFormat("something", False, None, "", data_format)
+        data_format.validate()
+        validated = field_format.compiled_validated()
+        self.assertEqual("a\tb \U0001f600", validated("a\tb \U0001f600"))
+        dev_test.assert_raises_and_fnmatches(
+            self,
+            errors.FieldValueError,
+            "character '\\n' (code point U+000a, decimal 10) in field 'something' at column 2 *",
+            validated,
+            "a\nb",
+        )
+
+    def test_can_validate_with_value_cache(self):
+        field_format = fields.IntegerFieldFormat("x", False, None, "1...10", _ANY_FORMAT)
+        field_format.value_cache_size = 2
+        validated = field_format.compiled_validated()
+        for _ in range(3):
+            self.assertEqual(7, validated("7"))
+            self.assertEqual(8, validated("8"))
+            self.assertEqual(9, validated("9"))
+            dev_test.assert_raises_and_fnmatches(
+                self, errors.FieldValueError, "* must be within range: *", validated, "11"
+            )
+
+    def test_can_validate_with_default_value_cache(self):
+        field_format = fields.IntegerFieldFormat("x", True, None, "1...10", _ANY_FORMAT)
+        validated = field_format.compiled_validated(2)
+        for _ in range(2):
+            self.assertIsNone(validated(""))
+            self.assertEqual(7, validated("7"))
+
+    def test_can_turn_off_value_cache_for_many_distinct_values(self):
+        field_format = fields.IntegerFieldFormat("x", False, None, "", _ANY_FORMAT)
+        field_format.value_cache_size = 10
+        validated = field_format.compiled_validated()
+        for value in range(2 * fields._VALUE_CACHE_PROBE_COUNT):
+            self.assertEqual(value, validated(str(value)))
+
+    def test_can_turn_off_value_cache_if_last_probed_value_is_found(self):
+        validated_values = []
+        validated = fields._memoized_validated(lambda value: validated_values.append(value) or value, 10)
+        for value in range(fields._VALUE_CACHE_PROBE_COUNT - 1):
+            validated(value)
+        # The last probed value is found in the cache, but the hit rate still is too low.
+        self.assertEqual(fields._VALUE_CACHE_PROBE_COUNT - 2, validated(fields._VALUE_CACHE_PROBE_COUNT - 2))
+        validated_values.clear()
+        validated(fields._VALUE_CACHE_PROBE_COUNT - 2)
+        self.assertEqual([fields._VALUE_CACHE_PROBE_COUNT - 2], validated_values)
+
     def test_can_raise_not_implemented_error(self):
         field_format = fields.AbstractFieldFormat("x", False, "3...5", "", _ANY_FORMAT)
         self.assertRaises(NotImplementedError, field_format.validated_value, 4)
@@ -89,6 +146,42 @@ class AbstractFieldFormatTest(unittest.TestCase):
         field_format = fields.AbstractFieldFormat("x", False, "3...5", "", _ANY_FORMAT)
         self.assertEqual(str(field_format), "AbstractFieldFormat('x', False, Range('3...5'), '')")
 
+    def test_can_compile_validated(self):
+        data_format = data.DataFormat(data.FORMAT_DELIMITED)
+        data_format.set_property(data.KEY_ALLOWED_CHARACTERS, '"0"..."9"')
+        field_format = fields.IntegerFieldFormat("x", True, "1...3", "", data_format)
+        validated = field_format.compiled_validated()
+        self.assertEqual(123, validated("123"))
+        self.assertIsNone(validated(""))
+        for broken_value in ("1x", "1234"):
+            with self.assertRaises(errors.FieldValueError) as compiled_error:
+                validated(broken_value)
+            with self.assertRaises(errors.FieldValueError) as error:
+                field_format.validated(broken_value)
+            self.assertEqual(str(error.exception), str(compiled_error.exception))
+
+    def test_can_compile_validated_for_fixed_format(self):
+        field_format = fields.TextFieldFormat("x", False, "3", "", _FIXED_FORMAT)
+        validated = field_format.compiled_validated()
+        self.assertEqual("ab", validated("ab "))
+        self.assertEqual("", validated("   "))
+        dev_test.assert_raises_and_fnmatches(self, errors.FieldValueError, "value must not be empty", validated, "")
+        dev_test.assert_raises_and_fnmatches(
+            self,
+            errors.FieldValueError,
+            "fixed format field must have at most 3 characters instead of 4: 'abcd'",
+            validated,
+            "abcd",
+        )
+
+    def test_can_compile_validated_with_overridden_validation(self):
+        class _UpperTextFieldFormat(fields.TextFieldFormat):
+            def validated(self, value):
+                return super().validated(value).upper()
+
+        field_format = _UpperTextFieldFormat("x", False, "", "", _ANY_FORMAT)
+        self.assertEqual("ABC", field_format.compiled_validated()("abc"))
+
 
 class DateTimeFieldFormatTest(unittest.TestCase):
     """
@@ -122,6 +215,32 @@ class DateTimeFieldFormatTest(unittest.TestCase):
         field_format = fields.DateTimeFieldFormat("x", False, None, "%YYYY-MM-DD", _ANY_FORMAT)
         field_format.validated("%2000-01-01")
 
+    def test_can_validate_same_as_strptime(self):
+        for rule, value in (
+            ("YYYY-MM-DD hh:mm:ss", "2000-02-29 23:59:60"),
+            ("DD.MM.YY", "31.12.68"),
+            ("DD.MM.YY", "1.1.69"),
+            ("hh:mm", "7:05"),
+            ("MM DD", "02 29"),
+        ):
+            field_format = fields.DateTimeFieldFormat("x", False, None, rule, _ANY_FORMAT)
+            self.assertEqual(time.strptime(value, field_format.strptime_format), field_format.validated(value))
+
+    def test_can_validate_without_cache(self):
+        field_format = fields.DateTimeFieldFormat("x", False, None, "YYYY-MM-DD", _ANY_FORMAT, cache_size=0)
+        self.assertEqual(0, field_format.cache_size)
+        for _ in range(2):
+            self.assertEqual(time.strptime("2000-01-02", "%Y-%m-%d"), field_format.validated("2000-01-02"))
+            self.assertRaises(errors.FieldValueError, field_format.validated, "2000-02-30")
+        field_format.cache_size = 2
+        self.assertEqual(time.strptime("2000-01-02", "%Y-%m-%d"), field_format.validated("2000-01-02"))
+
+    def test_can_pickle_date_time_field_format(self):
+        field_format = fields.DateTimeFieldFormat("x", False, None, "YYYY-MM-DD", _ANY_FORMAT)
+        field_format.validated("2000-01-02")
+        unpickled_field_format = pickle.loads(pickle.dumps(field_format))
+        self.assertEqual(field_format.validated("2000-01-02"), unpickled_field_format.validated("2000-01-02"))
+
 
 class DecimalFieldFormatTest(unittest.TestCase):
     """
@@ -182,6 +301,42 @@ class DecimalFieldFormatTest(unittest.TestCase):
         field_format.decimal_separator = ","
         self.assertRaises(errors.FieldValueError, field_format.validated, "3000,300.234")
 
+    def test_fails_on_thousands_separator_after_decimal_separator_before_another_decimal_separator(self):
+        german_decimal_field_format = _create_german_decimal_format()
+        dev_test.assert_raises_and_fnmatches(
+            self,
+            errors.FieldValueError,
+            "decimal field must contain thousands separator ('.') only before decimal separator (',')*",
+            german_decimal_field_format.validated,
+            "1,2.3,4",
+        )
+        dev_test.assert_raises_and_fnmatches(
+            self,
+            errors.FieldValueError,
+            "decimal field must contain only one decimal separator (',')*",
+            german_decimal_field_format.validated,
+            "1.234,5,6",
+        )
+
+    def test_can_validate_scaled_value(self):
+        field_format = fields.DecimalFieldFormat("x", False, None, "-10...999.99", _ANY_FORMAT)
+        self.assertEqual(1234, field_format.validated_scaled_value("12.34"))
+        self.assertEqual(1230, field_format.validated_scaled_value("12.3"))
+        self.assertEqual(1200, field_format.validated_scaled_value("12"))
+        self.assertEqual(-50, field_format.validated_scaled_value("-0.5"))
+        self.assertEqual(1200, field_format.validated_scaled_value("1.2e1"))
+        self.assertEqual(1230, field_format.validated_scaled_value("12.3000"))
+        self.assertRaises(errors.FieldValueError, field_format.validated_scaled_value, "12.345")
+        self.assertRaises(errors.FieldValueError, field_format.validated_scaled_value, "1000")
+        self.assertRaises(errors.FieldValueError, field_format.validated_scaled_value, "abc")
+
+    def test_can_validate_german_scaled_value(self):
+        german_decimal_field_format = _create_german_decimal_format()
+        precision = german_decimal_field_format.valid_range.precision
+        self.assertEqual(
+            17123456789 * 10 ** (precision - 2), german_decimal_field_format.validated_scaled_value("171.234.567,89")
+        )
+
     def test_can_use_default_rule(self):
         field_format = fields.DecimalFieldFormat("x", False, None, "", _ANY_FORMAT)
         self.assertEqual(field_format.valid_range.upper_limit, decimal.Decimal("9999999999999999999.999999999999"))
@@ -209,6 +364,24 @@ class IntegerFieldFormatTest(unittest.TestCase):
         field_format = fields.IntegerFieldFormat("x", False, None, "123", _ANY_FORMAT)
         self.assertEqual(field_format.validated("123"), 123)
 
+    def test_can_validate_values(self):
+        field_format = fields.IntegerFieldFormat("x", True, "1...3", "1...100", _ANY_FORMAT)
+        validated_values = field_format.validated_values(["1", "", "7", "1234", "123", "x", "100"])
+        self.assertEqual([1, None, 7], validated_values[:3])
+        self.assertEqual(
+            str(validated_values[3]), "length of 'x' with value '1234' is 4 but must be within range: 1...3"
+        )
+        self.assertEqual(str(validated_values[4]), "value is 123 but must be within range: 1...100")
+        self.assertEqual(str(validated_values[5]), "value must be an integer number: 'x'")
+        self.assertEqual(100, validated_values[6])
+
+    def test_can_validate_values_with_range_error(self):
+        field_format = fields.IntegerFieldFormat("x", False, None, "1...100", _ANY_FORMAT)
+        validated_values = field_format.validated_values(["1", "123", "100"])
+        self.assertEqual([1, 100], [validated_values[0], validated_values[2]])
+        self.assertIsInstance(validated_values[1], errors.FieldValueError)
+        self.assertEqual(str(validated_values[1]), "value is 123 but must be within range: 1...100")
+
     def test_can_set_range_from_length(self):
         field_format = fields.IntegerFieldFormat("x", False, "1...3", "", _ANY_FORMAT)
         self.assertEqual(field_format.valid_range.items, [(-99, 999)])
@@ -408,6 +581,58 @@ class ChoiceFieldFormatTest(unittest.TestCase):
             errors.InterfaceError, fields.ChoiceFieldFormat, "color", False, None, "red,,green", _ANY_FORMAT
         )
 
+    def test_can_match_choice_ignoring_case(self):
+        field_format = fields.ChoiceFieldFormat("color", False, None, "ignore_case: red, grEEn", _ANY_FORMAT)
+        self.assertTrue(field_format.is_ignoring_case)
+        self.assertEqual(["red", "grEEn"], field_format.choices)
+        self.assertEqual("GREEN", field_format.validated("GREEN"))
+        self.assertEqual("Red", field_format.validated("Red"))
+        self.assertRaises(errors.FieldValueError, field_format.validated, "blue")
+
+    def test_can_match_choice_named_like_option(self):
+        field_format = fields.ChoiceFieldFormat("option", False, None, "ignore_case, other", _ANY_FORMAT)
+        self.assertFalse(field_format.is_ignoring_case)
+        self.assertEqual(["ignore_case", "other"], field_format.choices)
+
+    def test_can_match_choice_from_file(self):
+        with tempfile.TemporaryDirectory() as temp_folder:
+            choices_path = os.path.join(temp_folder, "colors.txt")
+            with open(choices_path, "w", encoding="utf-8") as choices_file:
+                choices_file.write("red\ngreen\n\nred\nblue\n")
+            field_format = fields.ChoiceFieldFormat("color", False, None, '@"%s"' % choices_path, _ANY_FORMAT)
+        self.assertEqual(["red", "green", "blue"], field_format.choices)
+        self.assertEqual("green", field_format.validated("green"))
+        self.assertRaises(errors.FieldValueError, field_format.validated, "tree")
+
+    def test_fails_on_missing_choices_file(self):
+        dev_test.assert_raises_and_fnmatches(
+            self,
+            errors.InterfaceError,
+            "cannot read choices from 'no_such_file.txt': *",
+            fields.ChoiceFieldFormat,
+            "color",
+            False,
+            None,
+            '@"no_such_file.txt"',
+            _ANY_FORMAT,
+        )
+        self.assertRaises(errors.InterfaceError, fields.ChoiceFieldFormat, "color", False, None, "@", _ANY_FORMAT)
+        self.assertRaises(
+            errors.InterfaceError, fields.ChoiceFieldFormat, "color", False, None, '@"a.txt", red', _ANY_FORMAT
+        )
+
+    def test_can_shorten_message_for_many_choices(self):
+        rule = ", ".join('"%d"' % code for code in range(1000))
+        field_format = fields.ChoiceFieldFormat("code", False, None, rule, _ANY_FORMAT)
+        self.assertEqual("999", field_format.validated("999"))
+        dev_test.assert_raises_and_fnmatches(
+            self,
+            errors.FieldValueError,
+            "value is 'x' but must be one of: '0', '1', *, '19', ... (980 more)",
+            field_format.validated,
+            "x",
+        )
+
 
 class ConstantFieldFormatTest(unittest.TestCase):
     """
@@ -512,6 +737,60 @@ class PatternFieldFormatTest(unittest.TestCase):
         self.assertRaises(errors.FieldValueError, field_format.validated, "hang")
 
 
+@unittest.skipUnless(_vectorized.has_numpy, "numpy must be installed")
+class VectorizedValidationTest(unittest.TestCase):
+    """
+    Test that vectorized validation using NumPy has the same results as
+    validating each value on its own.
+    """
+
+    def _assert_has_same_validated_values(self, field_format, values):
+        # Repeat the values so there are enough of them to validate them vectorized.
+        values = values * _vectorized.MIN_VALUE_COUNT
+        self.assertTrue(field_format._can_validate_vectorized(values))
+        for value, validated_value in zip(values, field_format.validated_values(values)):
+            try:
+                expected_value = field_format.validated(value)
+            except errors.FieldValueError as error:
+                expected_value = error
+            if isinstance(expected_value, errors.FieldValueError):
+                self.assertIsInstance(validated_value, errors.FieldValueError)
+                self.assertEqual(str(expected_value), str(validated_value))
+            else:
+                self.assertEqual(expected_value, validated_value)
+                self.assertEqual(type(expected_value), type(validated_value))
+
+    def test_can_validate_integer_values(self):
+        field_format = fields.IntegerFieldFormat("x", True, "1...4", "-999...5000", _ANY_FORMAT)
+        values = ["1", "", "-999", "+5", "5001", "-1000", "12345", "1_0", " 7", "x", "--1", "-", "\u0663", "7\0", "0"]
+        self._assert_has_same_validated_values(field_format, values)
+
+    def test_can_validate_large_integer_values(self):
+        field_format = fields.IntegerFieldFormat("x", False, "", "...-9223372036854775809, 100...", _ANY_FORMAT)
+        values = ["-9223372036854775809", "9223372036854775808", "99", "100", "123456789012345678", "1" * 30]
+        self._assert_has_same_validated_values(field_format, values)
+
+    def test_can_validate_decimal_values(self):
+        field_format = fields.DecimalFieldFormat("x", True, None, "-10...999.99", _ANY_FORMAT)
+        values = ["1", "", "1.5", "-10", "-10.01", "999.99", "1000", ".5", "5.", "1.2.3", "1,000", "1e2", "-", "x"]
+        self._assert_has_same_validated_values(field_format, values)
+        self._assert_has_same_validated_values(_create_german_decimal_format(), ["1,5", "1.000,5", "1.5", ""])
+
+    def test_can_validate_decimal_values_with_length(self):
+        field_format = fields.DecimalFieldFormat("x", True, "1...3", "", _ANY_FORMAT)
+        self._assert_has_same_validated_values(field_format, ["1.5", "12.5", "123", "1234", ""])
+
+    def test_can_validate_choice_values(self):
+        field_format = fields.ChoiceFieldFormat("x", True, "1...5", "red, green, blue, yellow", _ANY_FORMAT)
+        values = ["red", "", "blue", "yellow", "Red", "purple", "red\0", "gree"]
+        self._assert_has_same_validated_values(field_format, values)
+
+    def test_can_validate_many_choice_values(self):
+        choices = ["c%d" % choice_number for choice_number in range(100)]
+        field_format = fields.ChoiceFieldFormat("x", False, "", ",".join(choices), _ANY_FORMAT)
+        self._assert_has_same_validated_values(field_format, ["c0", "c99", "c100", "c", ""])
+
+
 class PublicFieldFunctionTest(unittest.TestCase):
     """
     Test for public functions in the fields module
@@ -18,6 +18,8 @@ Tests for `cid` module
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 import fnmatch
 import os.path
+import shutil
+import tempfile
 import unittest
 
 from cutplace import checks, data, errors, fields, interface, ranges, rowio
@@ -519,6 +521,102 @@ class CidTest(unittest.TestCase):
             cid_text, "*check description must be used only once: 'duplicate_check' (see also: *: first declaration)"
         )
 
+    def test_can_set_cached_fields(self):
+        cid_text = "\n".join(
+            [
+                ",CID with cached fields",
+                "D,Format,%s" % data.FORMAT_DELIMITED,
+                'D,Cached fields,"country, status"',
+                "F,name",
+                "F,country",
+                "F,status",
+            ]
+        )
+        cid = interface.create_cid_from_string(cid_text)
+        self.assertEqual(["country", "status"], cid.data_format.cached_fields)
+        self.assertEqual(0, cid.field_format_for("name").value_cache_size)
+        self.assertEqual(fields.DEFAULT_VALUE_CACHE_SIZE, cid.field_format_for("country").value_cache_size)
+        self.assertEqual(fields.DEFAULT_VALUE_CACHE_SIZE, cid.field_format_for("status").value_cache_size)
+
+    def test_fails_on_unknown_cached_field(self):
+        cid_text = "\n".join(
+            [
+                ",CID with unknown cached field",
+                "D,Format,%s" % data.FORMAT_DELIMITED,
+                "D,Cached fields,no_such_field",
+                "F,some",
+            ]
+        )
+        self._test_fails_on_broken_cid_from_text(
+            cid_text, "*field 'no_such_field' in data format property 'cached_fields' must be one of: 'some'"
+        )
+
+
+class ChoicesPathTest(unittest.TestCase):
+    def test_can_read_choices_relative_to_cid(self):
+        with tempfile.TemporaryDirectory() as cid_folder:
+            with open(os.path.join(cid_folder, "colors.txt"), "w", encoding="utf-8") as choices_file:
+                choices_file.write("red\ngreen\n")
+            cid_path = os.path.join(cid_folder, "cid_colors.csv")
+            with open(cid_path, "w", encoding="utf-8") as cid_file:
+                cid_file.write('d,format,delimited\nf,color,,,,Choice,"@""colors.txt"""\n')
+            cid = interface.Cid(cid_path)
+            self.assertEqual(["red", "green"], cid.field_formats[0].choices)
+            self.assertEqual([os.path.join(cid_folder, "colors.txt")], cid.choices_paths)
+
+
+class CachedCidTest(unittest.TestCase):
+    def setUp(self):
+        self._cache_folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self._cache_folder)
+
+    def _cached_paths(self):
+        return [os.path.join(self._cache_folder, name) for name in os.listdir(self._cache_folder)]
+
+    def test_can_read_cached_cid(self):
+        cid_path = dev_test.CID_CUSTOMERS_ODS_PATH
+        expected_cid = interface.Cid(cid_path)
+        for _ in range(2):
+            cid = interface.cached_cid(cid_path, self._cache_folder)
+            self.assertEqual(str(expected_cid), str(cid))
+            self.assertEqual(expected_cid.field_names, cid.field_names)
+            self.assertEqual(expected_cid.check_names, cid.check_names)
+            self.assertEqual(1, len(self._cached_paths()))
+
+    def test_can_read_changed_cid(self):
+        cid_path = os.path.join(self._cache_folder, "cid.csv")
+        for field_name in ("a", "b"):
+            with open(cid_path, "w", encoding="utf-8") as cid_file:
+                cid_file.write("d,format,delimited\nf,%s\n" % field_name)
+            self.assertEqual([field_name], interface.cached_cid(cid_path, self._cache_folder).field_names)
+        self.assertEqual(3, len(self._cached_paths()))
+
+    def test_can_read_cid_with_changed_choices(self):
+        cid_path = os.path.join(self._cache_folder, "cid.csv")
+        with open(cid_path, "w", encoding="utf-8") as cid_file:
+            cid_file.write('d,format,delimited\nf,color,,,,Choice,"@""colors.txt"""\n')
+        for choices in (["red"], ["red", "green"]):
+            with open(os.path.join(self._cache_folder, "colors.txt"), "w", encoding="utf-8") as choices_file:
+                choices_file.write("\n".join(choices))
+            self.assertEqual(choices, interface.cached_cid(cid_path, self._cache_folder).field_formats[0].choices)
+
+    def test_can_replace_broken_cached_cid(self):
+        cid_path = dev_test.CID_CUSTOMERS_ODS_PATH
+        interface.cached_cid(cid_path, self._cache_folder)
+        (cached_path,) = self._cached_paths()
+        with open(cached_path, "wb") as cached_file:
+            cached_file.write(b"broken")
+        self.assertEqual(
+            interface.Cid(cid_path).field_names, interface.cached_cid(cid_path, self._cache_folder).field_names
+        )
+        with open(cached_path, "rb") as cached_file:
+            self.assertNotEqual(b"broken", cached_file.read())
+
+    def test_can_use_default_cid_cache_folder(self):
+        self.assertEqual("cutplace", os.path.basename(interface.default_cid_cache_folder()))
+
 
 if __name__ == "__main__":
     unittest.main()
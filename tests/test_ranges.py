@@ -96,8 +96,32 @@ class RangeTest(unittest.TestCase):
         self.assertEqual(ranges.Range("...1, 3...").upper_limit, None)
         self.assertEqual(ranges.Range("1...2, 5...9").upper_limit, 9)
 
+    def test_can_validate_range_with_many_items(self):
+        many_items_range = ranges.Range(", ".join("%d...%d" % (item * 10, item * 10 + 5) for item in range(1000)))
+        self.assertEqual(1000, len(many_items_range.items))
+        self.assertIn(0, many_items_range)
+        self.assertIn(4993, many_items_range)
+        self.assertIn(9995, many_items_range)
+        self.assertNotIn(-1, many_items_range)
+        self.assertNotIn(4997, many_items_range)
+        self.assertNotIn(9996, many_items_range)
+
+    def test_can_validate_range_with_unsorted_items(self):
+        unsorted_range = ranges.Range("20..., 5...6, 1...3, ...-3")
+        for value in (-5, -3, 1, 3, 5, 6, 20, 30):
+            self.assertIn(value, unsorted_range)
+        for value in (-2, 0, 4, 7, 19):
+            self.assertNotIn(value, unsorted_range)
+
     def test_fails_on_inconsistent_overlapping_multi_range(self):
         self.assertRaises(errors.InterfaceError, ranges.Range, "1...5, 2...3")
+        self.assertRaises(errors.InterfaceError, ranges.Range, "2...3, 1...5")
+        self.assertRaises(errors.InterfaceError, ranges.Range, "2...3, 1...")
+        self.assertRaises(errors.InterfaceError, ranges.Range, "2...3, ...5")
+        self.assertRaises(errors.InterfaceError, ranges.Range, "2, ...5")
+        self._test_fails_with_interface_error(
+            "5...6, 1...10", "overlapping parts in range must be cleaned up: '5...6' and '1...10'"
+        )
         self.assertRaises(errors.InterfaceError, ranges.Range, "1..., 2...3")
         self.assertRaises(errors.InterfaceError, ranges.Range, "...5, 2...3")
         self.assertRaises(errors.InterfaceError, ranges.Range, "...5, ...3")
@@ -423,6 +447,13 @@ class DecimalRangeTest(unittest.TestCase):
             "1...2.4, 9...10, 2.3...3.4",
         )
         self.assertRaises(errors.InterfaceError, ranges.DecimalRange, "1...2.4, 2.3...3.4")
+        dev_test.assert_raises_and_fnmatches(
+            self,
+            errors.InterfaceError,
+            "overlapping parts in decimal range must be cleaned up: '2.5...3.0' and '1.0...5.0'",
+            ranges.DecimalRange,
+            "2.5...3, 1...5",
+        )
         self.assertRaises(errors.InterfaceError, ranges.DecimalRange, "1..., 2...3.1")
         self.assertRaises(errors.InterfaceError, ranges.DecimalRange, "...5.9, 2...3")
         self.assertRaises(errors.InterfaceError, ranges.DecimalRange, "...5, ...4.9")
@@ -19,6 +19,7 @@ Tests for the :py:mod:`cutplace.rowio` module.
 import io
 import os
 import unittest
+import zipfile
 
 from cutplace import _tools, data, errors, interface, rowio
 from cutplace.data import KEY_QUOTING, QUOTING_ALL, DataFormat
@@ -110,6 +111,63 @@ class OdsRowsTest(_BaseRowsTest):
             error_message = "%s" % error
             self.assertTrue("ODS must contain at least" in error_message, "error_message=%r" % error_message)
 
+    def _write_ods(self, ods_path, table_rows_xml):
+        content_xml = (
+            '<office:document-content xmlns:office="%s" xmlns:table="%s" xmlns:text="%s">'
+            "<office:body><office:spreadsheet><table:table>%s</table:table></office:spreadsheet></office:body>"
+            "</office:document-content>"
+        ) % (
+            rowio._OOO_NAMESPACES["office"],
+            rowio._OOO_NAMESPACES["table"],
+            rowio._OOO_NAMESPACES["text"],
+            table_rows_xml,
+        )
+        with zipfile.ZipFile(ods_path, "w") as ods_archive:
+            ods_archive.writestr("content.xml", content_xml)
+
+    def test_can_read_ods_with_repeated_rows(self):
+        ods_path = dev_test.path_to_test_result("test_can_read_ods_with_repeated_rows.ods")
+        self._write_ods(
+            ods_path,
+            '<table:table-row table:number-rows-repeated="2">'
+            '<table:table-cell table:number-columns-repeated="2"><text:p>a</text:p></table:table-cell>'
+            "</table:table-row>"
+            "<table:table-row><table:table-cell/><table:table-cell><text:p>b</text:p></table:table-cell>"
+            "</table:table-row>",
+        )
+        self.assertEqual([["a", "a"], ["a", "a"], ["", "b"]], list(rowio.ods_rows(ods_path)))
+
+    def test_can_read_ods_without_trailing_filler(self):
+        ods_path = dev_test.path_to_test_result("test_can_read_ods_without_trailing_filler.ods")
+        self._write_ods(
+            ods_path,
+            "<table:table-row>"
+            "<table:table-cell><text:p>a</text:p></table:table-cell>"
+            '<table:table-cell table:number-columns-repeated="2"/>'
+            '<table:table-cell table:number-columns-repeated="1000"/>'
+            "</table:table-row>"
+            '<table:table-row table:number-rows-repeated="2"><table:table-cell/></table:table-row>'
+            "<table:table-row><table:table-cell><text:p>b</text:p></table:table-cell></table:table-row>"
+            '<table:table-row table:number-rows-repeated="65000">'
+            '<table:table-cell table:number-columns-repeated="1024"/>'
+            "</table:table-row>"
+            "<table:table-row><table:table-cell/></table:table-row>",
+        )
+        self.assertEqual([["a", "", ""], [""], [""], ["b"]], list(rowio.ods_rows(ods_path)))
+
+    def test_fails_on_ods_with_broken_number_rows_repeated(self):
+        ods_path = dev_test.path_to_test_result("test_fails_on_ods_with_broken_number_rows_repeated.ods")
+        self._write_ods(
+            ods_path, '<table:table-row table:number-rows-repeated="x"><table:table-cell/></table:table-row>'
+        )
+        dev_test.assert_raises_and_fnmatches(
+            self,
+            errors.DataFormatError,
+            "*: table:number-rows-repeated is 'x' but must be an integer",
+            list,
+            rowio.ods_rows(ods_path),
+        )
+
     def test_fails_on_ods_from_excel(self):
         excel_path = dev_test.path_to_test_data("valid_customers.xls")
         try:
@@ -231,6 +289,22 @@ class FixedRowsTest(_BaseRowsTest):
             )
         self.assertEqual([["john", "172"], ["mary", "163"]], rows)
 
+    def test_can_read_fixed_rows_across_blocks(self):
+        data_format, field_names_and_lengths = FixedRowsTest._create_fixed_data_format_and_fields_for_name_and_height()
+        initial_fixed_block_size = rowio._FIXED_BLOCK_SIZE
+        try:
+            for fixed_block_size in range(1, 12):
+                rowio._FIXED_BLOCK_SIZE = fixed_block_size
+                with io.StringIO("john172\rmary163\r\nbill167\njane184\r") as data_io:
+                    rows = list(
+                        rowio.fixed_rows(
+                            data_io, data_format.encoding, field_names_and_lengths, data_format.line_delimiter
+                        )
+                    )
+                self.assertEqual([["john", "172"], ["mary", "163"], ["bill", "167"], ["jane", "184"]], rows)
+        finally:
+            rowio._FIXED_BLOCK_SIZE = initial_fixed_block_size
+
     def _fails_on_fixed_rows_from_stringio(self, data_text, expected_error_pattern="*", data_format=None):
         assert (data_format is None) or data_format.is_valid
 
@@ -279,6 +353,73 @@ class FixedRowsTest(_BaseRowsTest):
         data_format.validate()
         self._test_can_read_fixed_rows_from_stringio("hugo172sepp163", data_format)
 
+    def _write_fixed_without_line_delimiter(self, fixed_path, data_text):
+        with io.open(fixed_path, "w", encoding="cp1252", newline="") as fixed_file:
+            fixed_file.write(data_text)
+
+    def test_can_read_mapped_fixed_rows(self):
+        _, field_names_and_lengths = FixedRowsTest._create_fixed_data_format_and_fields_for_name_and_height()
+        fixed_path = dev_test.path_to_test_result("test_can_read_mapped_fixed_rows.prn")
+        self._write_fixed_without_line_delimiter(fixed_path, "hugo172sepp163j\u00fcrg182\u20acuro199")
+        self.assertEqual(
+            [["hugo", "172"], ["sepp", "163"], ["j\u00fcrg", "182"], ["\u20acuro", "199"]],
+            list(rowio.fixed_rows(fixed_path, "cp1252", field_names_and_lengths, None)),
+        )
+        self.assertEqual(
+            [["sepp", "163"], ["j\u00fcrg", "182"]],
+            list(rowio.mapped_fixed_rows(fixed_path, "cp1252", field_names_and_lengths, 1, 3)),
+        )
+        self.assertEqual([], list(rowio.mapped_fixed_rows(fixed_path, "cp1252", field_names_and_lengths, 5)))
+
+    def test_can_read_fixed_rows_with_carriage_return_from_path_and_stream(self):
+        _, field_names_and_lengths = FixedRowsTest._create_fixed_data_format_and_fields_for_name_and_height()
+        fixed_path = dev_test.path_to_test_result("test_can_read_fixed_rows_with_carriage_return.prn")
+        self._write_fixed_without_line_delimiter(fixed_path, "h\r\nug172sepp163")
+        with io.open(fixed_path, "r", encoding="cp1252") as fixed_stream:
+            expected_rows = list(rowio.fixed_rows(fixed_stream, "cp1252", field_names_and_lengths, None))
+        self.assertEqual([["h\nug", "172"], ["sepp", "163"]], expected_rows)
+        self.assertEqual(expected_rows, list(rowio.fixed_rows(fixed_path, "cp1252", field_names_and_lengths, None)))
+
+    def test_can_read_fixed_rows_with_carriage_return_in_later_block(self):
+        _, field_names_and_lengths = FixedRowsTest._create_fixed_data_format_and_fields_for_name_and_height()
+        fixed_path = dev_test.path_to_test_result("test_can_read_fixed_rows_with_carriage_return_in_later_block.prn")
+        self._write_fixed_without_line_delimiter(fixed_path, "hugo172sepp163h\r\nug172mary16")
+        initial_fixed_block_size = rowio._FIXED_BLOCK_SIZE
+        try:
+            # Use blocks of 1 row so that the first rows are read from the memory map.
+            rowio._FIXED_BLOCK_SIZE = 7
+            rows = rowio.fixed_rows(fixed_path, "cp1252", field_names_and_lengths, None)
+            self.assertEqual(["hugo", "172"], next(rows))
+            self.assertEqual(["sepp", "163"], next(rows))
+            self.assertEqual(["h\nug", "172"], next(rows))
+            dev_test.assert_raises_and_fnmatches(
+                self,
+                errors.DataFormatError,
+                "*(4;5): cannot read field 'size': need 3 characters but found only 2: '16'",
+                next,
+                rows,
+            )
+        finally:
+            rowio._FIXED_BLOCK_SIZE = initial_fixed_block_size
+
+    def test_can_read_empty_mapped_fixed_rows(self):
+        _, field_names_and_lengths = FixedRowsTest._create_fixed_data_format_and_fields_for_name_and_height()
+        fixed_path = dev_test.path_to_test_result("test_can_read_empty_mapped_fixed_rows.prn")
+        self._write_fixed_without_line_delimiter(fixed_path, "")
+        self.assertEqual([], list(rowio.mapped_fixed_rows(fixed_path, "cp1252", field_names_and_lengths)))
+
+    def test_fails_on_mapped_fixed_rows_with_incomplete_record(self):
+        _, field_names_and_lengths = FixedRowsTest._create_fixed_data_format_and_fields_for_name_and_height()
+        fixed_path = dev_test.path_to_test_result("test_fails_on_mapped_fixed_rows_with_incomplete_record.prn")
+        self._write_fixed_without_line_delimiter(fixed_path, "hugo172sepp16")
+        dev_test.assert_raises_and_fnmatches(
+            self,
+            errors.DataFormatError,
+            "*(2;5): cannot read field 'size': need 3 characters but found only 2: '16'",
+            list,
+            rowio.mapped_fixed_rows(fixed_path, "cp1252", field_names_and_lengths, 1),
+        )
+
     def test_can_auto_read_excel_rows(self):
         excel_path = dev_test.path_to_test_data("valid_customers.xls")
         self._assert_rows_contain_data(rowio.auto_rows(excel_path))
@@ -0,0 +1,148 @@
+"""
+Tests for the validation server.
+"""
+
+# Copyright (C) 2009-2021 Thomas Aglassinger
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License
+# for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import json
+import os
+import tempfile
+import threading
+import unittest
+import urllib.error
+import urllib.parse
+import urllib.request
+
+from cutplace import server
+from tests import dev_test
+
+_customers_cid_path = dev_test.path_to_example("cid_customers.ods")
+_valid_customers_csv_path = dev_test.path_to_example("customers.csv")
+_broken_customers_csv_path = dev_test.path_to_test_data("broken_customers.csv")
+
+
+class CidRegistryTest(unittest.TestCase):
+    def test_can_reuse_cid(self):
+        cid_registry = server.CidRegistry()
+        cid = cid_registry.cid(_customers_cid_path)
+        self.assertIs(cid, cid_registry.cid(_customers_cid_path))
+        self.assertEqual([os.path.abspath(_customers_cid_path)], cid_registry.cid_paths)
+
+    def test_can_read_changed_cid_again(self):
+        cid_registry = server.CidRegistry()
+        with tempfile.TemporaryDirectory() as temp_folder:
+            cid_path = os.path.join(temp_folder, "cid_digit.csv")
+            with open(cid_path, "w", encoding="utf-8") as cid_file:
+                cid_file.write("d,format,delimited\nf,digit,,,1,Integer\n")
+            cid = cid_registry.cid(cid_path)
+            self.assertEqual(["digit"], cid.field_names)
+            with open(cid_path, "w", encoding="utf-8") as cid_file:
+                cid_file.write("d,format,delimited\nf,number,,,1:3,Integer\n")
+            self.assertEqual(["number"], cid_registry.cid(cid_path).field_names)
+
+    def test_can_read_cid_with_changed_choices_again(self):
+        cid_registry = server.CidRegistry()
+        with tempfile.TemporaryDirectory() as temp_folder:
+            cid_path = os.path.join(temp_folder, "cid_colors.csv")
+            with open(cid_path, "w", encoding="utf-8") as cid_file:
+                cid_file.write('d,format,delimited\nf,color,,,,Choice,"@""colors.txt"""\n')
+            for choices in (["red"], ["red", "green"]):
+                with open(os.path.join(temp_folder, "colors.txt"), "w", encoding="utf-8") as choices_file:
+                    choices_file.write("\n".join(choices))
+                self.assertEqual(choices, cid_registry.cid(cid_path).field_formats[0].choices)
+
+    def test_fails_on_non_existent_cid(self):
+        self.assertRaises(EnvironmentError, server.CidRegistry().cid, "no_such_cid.xxx")
+
+
+class ValidationServerTest(unittest.TestCase):
+    def setUp(self):
+        self._server = server.ValidationServer(port=0)
+        self._server_thread = threading.Thread(target=self._server.serve_forever)
+        self._server_thread.start()
+
+    def tearDown(self):
+        self._server.shutdown()
+        self._server_thread.join()
+        self._server.server_close()
+
+    def _response(self, path, body=None, headers=None):
+        url = "http://%s:%d%s" % (server.DEFAULT_HOST, self._server.server_address[1], path)
+        request = urllib.request.Request(url, data=body, headers=headers or {}, method="GET" if path == "/" else "POST")
+        try:
+            with urllib.request.urlopen(request) as response:
+                return response.status, json.loads(response.read().decode("utf-8"))
+        except urllib.error.HTTPError as error:
+            return error.code, json.loads(error.read().decode("utf-8"))
+
+    def _validate_path(self, **query):
+        return "/validate?" + urllib.parse.urlencode(query)
+
+    def test_can_validate_data_path(self):
+        status, result = self._response(self._validate_path(cid=_customers_cid_path, data=_valid_customers_csv_path))
+        self.assertEqual(200, status)
+        self.assertTrue(result["is_valid"])
+        self.assertGreater(result["accepted_rows"], 0)
+        self.assertEqual([], result["errors"])
+
+    def test_can_validate_broken_data_path(self):
+        status, result = self._response(self._validate_path(cid=_customers_cid_path, data=_broken_customers_csv_path))
+        self.assertEqual(200, status)
+        self.assertFalse(result["is_valid"])
+        self.assertGreater(result["error_count"], 0)
+        self.assertEqual(result["error_count"], len(result["errors"]))
+
+    def test_can_validate_body(self):
+        with open(_valid_customers_csv_path, "rb") as data_file:
+            body = data_file.read()
+        status, result = self._response(self._validate_path(cid=_customers_cid_path), body)
+        self.assertEqual(200, status)
+        self.assertTrue(result["is_valid"])
+        self.assertIsNone(result["data"])
+        self.assertEqual([os.path.abspath(_customers_cid_path)], self._response("/")[1]["cids"])
+
+    def test_fails_on_missing_cid(self):
+        status, result = self._response(self._validate_path(data=_valid_customers_csv_path))
+        self.assertEqual(400, status)
+        dev_test.assert_fnmatches(self, result["error"], "*'cid' must be specified")
+
+    def test_fails_on_missing_data(self):
+        status, _ = self._response(self._validate_path(cid=_customers_cid_path))
+        self.assertEqual(400, status)
+
+    def test_fails_on_non_existent_data(self):
+        status, result = self._response(self._validate_path(cid=_customers_cid_path, data="no_such_data.csv"))
+        self.assertEqual(400, status)
+        dev_test.assert_fnmatches(self, result["error"], "cannot read file: *no_such_data.csv*")
+
+    def test_fails_on_broken_content_length(self):
+        status, result = self._response(
+            self._validate_path(cid=_customers_cid_path), b"x", {"Content-Length": "no_number"}
+        )
+        self.assertEqual(400, status)
+        dev_test.assert_fnmatches(self, result["error"], "header Content-Length must be a number but is: 'no_number'")
+
+    def test_fails_on_undecodable_body(self):
+        status, result = self._response(self._validate_path(cid=_customers_cid_path), b"\xff\xfe\xfd")
+        self.assertEqual(400, status)
+        dev_test.assert_fnmatches(self, result["error"], "cannot decode request body: *")
+
+    def test_fails_on_unknown_path(self):
+        status, _ = self._response("/no_such_path")
+        self.assertEqual(404, status)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -16,11 +16,14 @@ Tests for `sql` module
 #
 # You should have received a copy of the GNU Lesser General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import io
+import os
 import sqlite3
+import tempfile
 import unittest
 from contextlib import closing
 
-from cutplace import data, interface, sql
+from cutplace import data, errors, interface, sql, validio
 
 _ANY_FORMAT = data.DataFormat(data.FORMAT_DELIMITED)
 _FIXED_FORMAT = data.DataFormat(data.FORMAT_FIXED)
@@ -347,3 +350,112 @@ class SqlFactoryTest(unittest.TestCase):
         sql_factory = sql.SqlFactory(cid, "customers", sql.DB2_SQL_DIALECT)
         sql_field_name = list(sql_factory.sql_fields())[0][0]
         self.assertEqual(sql_field_name, '"add"')
+
+
+class SqlDialectTest(unittest.TestCase):
+    def test_can_share_dialect(self):
+        self.assertIs(sql.ANSI_SQL_DIALECT, sql.AnsiSqlDialect())
+        self.assertIs(sql.PL_SQL_DIALECT, sql.PlSqlDialect())
+        self.assertIsNot(sql.ANSI_SQL_DIALECT, sql.PL_SQL_DIALECT)
+
+    def test_can_detect_keywords(self):
+        for dialect in sql.SQL_NAME_TO_DIALECT_MAP.values():
+            self.assertIsInstance(dialect.keywords, frozenset)
+            self.assertIs(dialect.keywords, dialect.keywords)
+            self.assertTrue(dialect.is_keyword("Select"), str(dialect))
+            self.assertFalse(dialect.is_keyword("customer_id"), str(dialect))
+        self.assertTrue(sql.PL_SQL_DIALECT.is_keyword("agent"))
+        self.assertFalse(sql.ANSI_SQL_DIALECT.is_keyword("agent"))
+
+
+class LoadSqliteTest(unittest.TestCase):
+    _CID_TEXT = "\n".join(
+        [
+            "d,format,delimited",
+            "f,customer_id,,,,Integer",
+            "f,name",
+            "f,balance,,X,,Decimal",
+            "f,date_of_birth,,X,,DateTime,YYYY-MM-DD",
+            "c,customer_id must be unique,IsUnique,customer_id",
+        ]
+    )
+
+    def setUp(self):
+        self._temp_folder = tempfile.TemporaryDirectory()
+        self._database_path = os.path.join(self._temp_folder.name, "customers.db")
+
+    def tearDown(self):
+        self._temp_folder.cleanup()
+
+    def _loaded_rows(self, data_text, **keywords):
+        cid = interface.create_cid_from_string(LoadSqliteTest._CID_TEXT)
+        with io.StringIO(data_text) as data_stream:
+            with validio.Reader(cid, data_stream, keywords.pop("on_error", "raise")) as reader:
+                sql.load_sqlite(reader, self._database_path, "customers", **keywords)
+        with closing(sqlite3.connect(self._database_path)) as connection:
+            return connection.execute("select * from customers order by customer_id").fetchall()
+
+    def test_can_create_insert_statement(self):
+        cid = interface.create_cid_from_string(LoadSqliteTest._CID_TEXT)
+        self.assertEqual(
+            "insert into customers (customer_id, name, balance, date_of_birth) values (?, ?, ?, ?)",
+            sql.SqlFactory(cid, "customers").insert_statement(),
+        )
+
+    def test_can_load_into_table_with_quoted_name(self):
+        cid = interface.create_cid_from_string(LoadSqliteTest._CID_TEXT)
+        table = 'cid-"customers"'
+        self.assertEqual(
+            'insert into "cid-""customers""" (customer_id, name, balance, date_of_birth) values (?, ?, ?, ?)',
+            sql.SqlFactory(cid, table).insert_statement(),
+        )
+        for data_text in ("1,Doe,,\n", "2,Smith,,\n"):
+            with io.StringIO(data_text) as data_stream:
+                with validio.Reader(cid, data_stream) as reader:
+                    sql.load_sqlite(reader, self._database_path, table)
+        with closing(sqlite3.connect(self._database_path)) as connection:
+            self.assertEqual(2, connection.execute('select count(*) from "cid-""customers"""').fetchone()[0])
+
+    def test_can_count_loaded_rows(self):
+        cid = interface.create_cid_from_string(LoadSqliteTest._CID_TEXT)
+        with io.StringIO("1,Doe,,\n2,Smith,,\n") as data_stream:
+            with validio.Reader(cid, data_stream) as reader:
+                self.assertEqual(2, sql.load_sqlite(reader, self._database_path, "customers"))
+
+    def test_can_load_native_values(self):
+        self.assertEqual(
+            [(1, "Doe", "12.50", "1975-04-08"), (2, "Smith", None, None)],
+            self._loaded_rows("1,Doe,12.50,1975-04-08\n2,Smith,,\n", batch_size=1, transaction_size=1),
+        )
+
+    def test_can_load_decimals_with_all_digits(self):
+        self._loaded_rows("1,Doe,12345678901234567.89,\n2,Smith,1.50,\n")
+        with closing(sqlite3.connect(self._database_path)) as connection:
+            self.assertEqual(
+                [("12345678901234567.89", "text"), ("1.50", "text")],
+                connection.execute("select balance, typeof(balance) from customers order by customer_id").fetchall(),
+            )
+
+    def test_can_skip_broken_rows(self):
+        self.assertEqual(
+            [(1, "Doe", None, None), (3, "Smith", None, None)],
+            self._loaded_rows("1,Doe,,\n2,Broken,,x\n3,Smith,,\n", on_error="continue"),
+        )
+
+    def test_can_append_to_existing_table(self):
+        self._loaded_rows("1,Doe,,\n")
+        self.assertEqual(2, len(self._loaded_rows("2,Smith,,\n")))
+
+    def test_can_roll_back_broken_data(self):
+        self.assertRaises(errors.FieldValueError, self._loaded_rows, "1,Doe,,\n2,Broken,,x\n")
+        self.assertEqual([], self._loaded_rows(""))
+
+    def test_can_roll_back_failed_final_check(self):
+        self.assertRaises(errors.CheckError, self._loaded_rows, "1,Doe,,\n1,Smith,,\n", batch_size=1)
+        self.assertEqual([], self._loaded_rows(""))
+
+    def test_can_keep_committed_rows_of_broken_data(self):
+        self.assertRaises(
+            errors.FieldValueError, self._loaded_rows, "1,Doe,,\n2,Broken,,x\n", batch_size=1, transaction_size=1
+        )
+        self.assertEqual([(1, "Doe", None, None)], self._loaded_rows(""))
@@ -197,6 +197,341 @@ class ReaderTest(unittest.TestCase):
                         "* (R3C1): cannot accept field 'digit': value must be an integer number: 'a'",
                     )
 
+    def test_can_read_row_batches(self):
+        cid = interface.Cid(dev_test.CID_CUSTOMERS_ODS_PATH)
+        with validio.Reader(cid, dev_test.CUSTOMERS_CSV_PATH) as reader:
+            expected_rows = list(reader.rows())
+        with validio.Reader(cid, dev_test.CUSTOMERS_CSV_PATH) as reader:
+            batches = list(reader.row_batches(3))
+            self.assertEqual(len(expected_rows), reader.accepted_rows_count)
+        self.assertTrue(all(len(batch) <= 3 for batch in batches))
+        self.assertEqual(expected_rows, [row for batch in batches for row in batch])
+
+    def test_can_read_column_major_row_batches(self):
+        with io.StringIO("digit\n1\n2\n3\n") as data:
+            cid = interface.create_cid_from_string(_DIGIT_CID_TEXT + "\nd,header,1")
+            with validio.Reader(cid, data) as reader:
+                self.assertEqual([[("1", "2")], [("3",)]], list(reader.row_batches(2, column_major=True)))
+
+    def test_fails_on_broken_row_batch_after_previous_rows(self):
+        with io.StringIO("1\n2\n3\na\n5\n") as data:
+            with validio.Reader(_DIGIT_CID, data) as reader:
+                batches = reader.row_batches(2)
+                self.assertEqual([["1"], ["2"]], next(batches))
+                self.assertEqual([["3"]], next(batches))
+                try:
+                    next(batches)
+                    self.fail()
+                except errors.FieldValueError as anticipated_error:
+                    dev_test.assert_fnmatches(
+                        self,
+                        str(anticipated_error),
+                        "* (R4C1): cannot accept field 'digit': value must be an integer number: 'a'",
+                    )
+
+    def test_can_yield_errors_in_row_batches(self):
+        with io.StringIO("1\n12\n3,4\na\n5\n") as data:
+            with validio.Reader(_DIGIT_CID, data, "yield", validate_until=4) as reader:
+                rows = [row for batch in reader.row_batches(4) for row in batch]
+                self.assertEqual(2, reader.accepted_rows_count)
+                self.assertEqual(3, reader.rejected_rows_count)
+        self.assertEqual(["1"], rows[0])
+        dev_test.assert_error_fnmatches(self, rows[1], "* (R2C1): cannot accept field 'digit': *")
+        dev_test.assert_error_fnmatches(self, rows[2], "* (R3C1): row must contain 1 fields but has 2, *")
+        dev_test.assert_error_fnmatches(self, rows[3], "* (R4C1): cannot accept field 'digit': *")
+        self.assertEqual(["5"], rows[4])
+
+    def test_can_continue_after_errors_in_row_batches(self):
+        with io.StringIO("1\nabc\n3") as partially_broken_data:
+            with validio.Reader(_DIGIT_CID, partially_broken_data, "continue") as reader:
+                self.assertEqual([[("1", "3")]], list(reader.row_batches(10, column_major=True)))
+
+    def test_can_reject_too_long_decimal_in_rows_and_row_batches(self):
+        cid = interface.create_cid_from_string("d,format,delimited\nf,amount,,,1...3,Decimal")
+        # Use enough values to validate them vectorized if NumPy is installed.
+        data_text = "1.5\n" * 100 + "12.5\n"
+        with validio.Reader(cid, io.StringIO(data_text), "continue") as reader:
+            rows = list(reader.rows())
+        with validio.Reader(cid, io.StringIO(data_text), "continue") as reader:
+            batched_rows = [row for batch in reader.row_batches(200) for row in batch]
+            self.assertEqual(1, reader.rejected_rows_count)
+        self.assertEqual(100, len(rows))
+        self.assertEqual(rows, batched_rows)
+
+    def test_can_read_native_row_batches(self):
+        cid_text = "\n".join([_DIGIT_CID_TEXT, "f,name"])
+        cid = interface.create_cid_from_string(cid_text)
+        with io.StringIO("1,a\n2\nx,b\n3,c\n") as data:
+            with validio.Reader(cid, data, "continue") as reader:
+                self.assertEqual([[[1, "a"], [3, "c"]]], list(reader.row_batches(10, native=True)))
+
+    def test_can_refer_to_cell_of_broken_field(self):
+        cid_text = "\n".join(
+            [
+                "d,format,delimited",
+                "f,name",
+                "f,some_number,,,,Integer",
+            ]
+        )
+        cid = interface.create_cid_from_string(cid_text)
+        with io.StringIO("a,1\nb,x\n") as broken_data:
+            with validio.Reader(cid, broken_data) as reader:
+                try:
+                    list(reader.rows())
+                    self.fail()
+                except errors.FieldValueError as anticipated_error:
+                    dev_test.assert_fnmatches(
+                        self,
+                        str(anticipated_error),
+                        "* (R2C2): cannot accept field 'some_number': value must be an integer number: 'x'",
+                    )
+                self.assertEqual(0, reader.location.cell)
+
+    def test_can_collect_stats(self):
+        cid_text = "\n".join([_DIGIT_CID_TEXT, "c,digit must be unique,IsUnique,digit"])
+        cid = interface.create_cid_from_string(cid_text)
+        with io.StringIO("1\nx\n2\n1\ny\n") as data_stream:
+            with validio.Reader(cid, data_stream, on_error="continue", collect_stats=True) as reader:
+                reader.validate_rows()
+        self.assertEqual(2, reader.accepted_rows_count)
+        digit_stats = reader.stats.field_stats[0]
+        self.assertEqual("digit", digit_stats.name)
+        self.assertEqual(5, digit_stats.call_count)
+        self.assertEqual(2, digit_stats.rejected_count)
+        self.assertGreater(digit_stats.seconds, 0)
+        self.assertEqual([1, 4], [location.line for location, _ in digit_stats.error_samples])
+        self.assertEqual(0, digit_stats.error_samples[0][0].cell)
+        unique_stats = reader.stats.check_stats[0]
+        # 3 rows and 1 check at the end.
+        self.assertEqual(4, unique_stats.call_count)
+        self.assertEqual(1, unique_stats.rejected_count)
+        dev_test.assert_fnmatches(self, str(reader.stats), "field 'digit': 5 calls in *, 2 rejected\n  *(R2C1): *")
+
+    def test_can_collect_stats_for_row_batches(self):
+        with io.StringIO("1\nx\n2\n") as data_stream:
+            with validio.Reader(_DIGIT_CID, data_stream, on_error="continue", collect_stats=True) as reader:
+                list(reader.row_batches(2))
+        digit_stats = reader.stats.field_stats[0]
+        self.assertEqual(3, digit_stats.call_count)
+        self.assertEqual(1, digit_stats.rejected_count)
+        self.assertEqual(1, digit_stats.error_samples[0][0].line)
+
+    def test_can_stop_calling_settled_checks(self):
+        cid_text = "\n".join([_DIGIT_CID_TEXT, "c,digit must have several values,DistinctCount,digit >= 2"])
+        cid = interface.create_cid_from_string(cid_text)
+        row_count = 3 * validio._ROWS_BETWEEN_SETTLED_CHECKS_COUNT
+        with io.StringIO("".join("%d\n" % (row_index % 10) for row_index in range(row_count))) as data_stream:
+            with validio.Reader(cid, data_stream, collect_stats=True) as reader:
+                reader.validate_rows()
+        self.assertEqual(row_count, reader.accepted_rows_count)
+        distinct_count_stats = reader.stats.check_stats[0]
+        # Rows until the settled check is removed and 1 check at the end.
+        self.assertEqual(validio._ROWS_BETWEEN_SETTLED_CHECKS_COUNT + 1, distinct_count_stats.call_count)
+
+    def test_can_pass_row_view_to_checks(self):
+        cid_text = "\n".join(
+            [_DIGIT_CID_TEXT, "f,other_digit,,,1,Integer", "c,other digit must be unique,IsUnique,other_digit"]
+        )
+        cid = interface.create_cid_from_string(cid_text)
+        with io.StringIO("1,2\n2,3\n3,2\n") as data_stream:
+            with validio.Reader(cid, data_stream) as reader:
+                dev_test.assert_raises_and_fnmatches(
+                    self,
+                    errors.CheckError,
+                    "* (R3C1): values for *other_digit* must be unique: ('2',)*",
+                    reader.validate_rows,
+                )
+
+    def test_has_no_stats_by_default(self):
+        with io.StringIO("1\n") as data_stream:
+            with validio.Reader(_DIGIT_CID, data_stream) as reader:
+                reader.validate_rows()
+        self.assertIsNone(reader.stats)
+
+
+class RowViewTest(unittest.TestCase):
+    def test_can_look_up_values_by_field_name(self):
+        row_view = validio.RowView({"a": 0, "b": 1}, [1, "x"])
+        self.assertEqual(1, row_view["a"])
+        self.assertEqual("x", row_view["b"])
+        self.assertEqual("x", row_view.get("b"))
+        self.assertIsNone(row_view.get("c"))
+        self.assertIn("a", row_view)
+        self.assertEqual(2, len(row_view))
+        self.assertEqual({"a": 1, "b": "x"}, dict(row_view))
+        self.assertEqual("RowView({'a': 1, 'b': 'x'})", repr(row_view))
+
+    def test_fails_on_unknown_field_name(self):
+        row_view = validio.RowView({"a": 0}, [1])
+        self.assertRaises(KeyError, row_view.__getitem__, "c")
+
+    def test_has_no_dict(self):
+        row_view = validio.RowView({"a": 0}, [1])
+        self.assertRaises(AttributeError, setattr, row_view, "some_attribute", 1)
+
+
+class ParallelReaderTest(unittest.TestCase):
+    """
+    Tests for validating chunks of data in parallel processes.
+    """
+
+    _CID_TEXT = "\n".join(
+        [
+            "d,format,delimited",
+            "d,encoding,utf-8",
+            "d,header,1",
+            "f,id,,,,Integer",
+            "f,name",
+            "c,id must be unique,IsUnique,id",
+            "c,name must have few values,DistinctCount,name <= 3",
+        ]
+    )
+
+    def setUp(self):
+        self._previous_min_chunk_size = validio._MIN_CHUNK_SIZE
+        # Use tiny chunks so that even small test data are split into several chunks.
+        validio._MIN_CHUNK_SIZE = 64
+        self._cid = interface.create_cid_from_string(ParallelReaderTest._CID_TEXT)
+
+    def tearDown(self):
+        validio._MIN_CHUNK_SIZE = self._previous_min_chunk_size
+
+    def _write_data(self, test_name, rows):
+        data_path = dev_test.path_to_test_result(test_name + ".csv")
+        with io.open(data_path, "w", encoding="utf-8", newline="") as data_stream:
+            data_stream.write("id,name\r\n")
+            for row in rows:
+                data_stream.write(",".join(row) + "\r\n")
+        return data_path
+
+    def _rows(self, row_count):
+        return [[str(row_number), '"%s\nline"' % "abc"[row_number % 3]] for row_number in range(row_count)]
+
+    def _validated_error(self, data_path, workers):
+        try:
+            with validio.Reader(self._cid, data_path, workers=workers) as reader:
+                reader.validate_rows()
+            self.fail()
+        except errors.CutplaceError as anticipated_error:
+            return anticipated_error
+
+    def test_can_validate_in_parallel(self):
+        data_path = self._write_data("test_can_validate_in_parallel", self._rows(100))
+        with validio.Reader(self._cid, data_path, workers=3) as reader:
+            self.assertIsNotNone(reader._parallel_chunks())
+            reader.validate_rows()
+            self.assertEqual(100, reader.accepted_rows_count)
+
+    def test_fails_on_duplicate_in_other_chunk(self):
+        rows = self._rows(100)
+        rows[90][0] = "7"
+        data_path = self._write_data("test_fails_on_duplicate_in_other_chunk", rows)
+        serial_error = self._validated_error(data_path, 1)
+        parallel_error = self._validated_error(data_path, 3)
+        self.assertIsInstance(parallel_error, errors.CheckError)
+        self.assertEqual(str(serial_error), str(parallel_error))
+
+    def test_fails_on_broken_field_in_later_chunk(self):
+        rows = self._rows(100)
+        rows[80][0] = "x"
+        data_path = self._write_data("test_fails_on_broken_field_in_later_chunk", rows)
+        serial_error = self._validated_error(data_path, 1)
+        parallel_error = self._validated_error(data_path, 3)
+        self.assertIsInstance(parallel_error, errors.FieldValueError)
+        self.assertEqual(str(serial_error), str(parallel_error))
+
+    def test_fails_on_distinct_count_across_chunks(self):
+        rows = self._rows(100)
+        rows[95][1] = "d"
+        data_path = self._write_data("test_fails_on_distinct_count_across_chunks", rows)
+        parallel_error = self._validated_error(data_path, 3)
+        self.assertIsInstance(parallel_error, errors.CheckError)
+        self.assertEqual(str(self._validated_error(data_path, 1)), str(parallel_error))
+
+    def test_can_validate_fixed_in_parallel(self):
+        cid = interface.Cid(dev_test.path_to_test_cid("customers_fixed.xls"))
+        data_path = dev_test.path_to_test_data("valid_customers_fixed.txt")
+        with validio.Reader(cid, data_path) as reader:
+            reader.validate_rows()
+            expected_accepted_rows_count = reader.accepted_rows_count
+        with validio.Reader(cid, data_path, workers=2) as reader:
+            reader.validate_rows()
+            self.assertEqual(expected_accepted_rows_count, reader.accepted_rows_count)
+
+    def _fixed_without_line_delimiter_cid_and_data_path(self, test_name, data_text):
+        cid = interface.create_cid_from_string(
+            "\n".join(
+                [
+                    "d,format,fixed",
+                    "d,encoding,cp1252",
+                    "d,line delimiter,none",
+                    "f,id,,,3,Integer",
+                    "f,name,,,1",
+                    "c,id must be unique,IsUnique,id",
+                ]
+            )
+        )
+        data_path = dev_test.path_to_test_result(test_name + ".prn")
+        with io.open(data_path, "w", encoding="cp1252", newline="") as data_stream:
+            data_stream.write(data_text)
+        return cid, data_path
+
+    def test_can_validate_fixed_without_line_delimiter_in_parallel(self):
+        data_text = "".join("%03d%s" % (row_number, "abc"[row_number % 3]) for row_number in range(100))
+        cid, data_path = self._fixed_without_line_delimiter_cid_and_data_path(
+            "test_can_validate_fixed_without_line_delimiter_in_parallel", data_text
+        )
+        with validio.Reader(cid, data_path, workers=3) as reader:
+            self.assertEqual(
+                [(0, 64), (64, 128), (128, 192), (192, 256), (256, 320), (320, 384), (384, 400)],
+                list(reader._parallel_chunks()),
+            )
+            reader.validate_rows()
+            self.assertEqual(100, reader.accepted_rows_count)
+        with validio._chunk_reader(cid, data_path, 64, 128) as chunk_reader:
+            self.assertEqual((16, 32), chunk_reader._fixed_row_range)
+            self.assertEqual(["016", "b"], next(chunk_reader._raw_rows()))
+
+    def test_fails_on_duplicate_and_incomplete_fixed_without_line_delimiter_in_parallel(self):
+        data_rows = ["%03d%s" % (row_number, "abc"[row_number % 3]) for row_number in range(100)]
+        for test_name, data_text in (
+            ("test_fails_on_duplicate_in_fixed_without_line_delimiter", "".join(data_rows[:90] + ["007x"])),
+            ("test_fails_on_incomplete_fixed_without_line_delimiter", "".join(data_rows) + "10"),
+        ):
+            cid, data_path = self._fixed_without_line_delimiter_cid_and_data_path(test_name, data_text)
+            serial_error = None
+            try:
+                with validio.Reader(cid, data_path) as reader:
+                    reader.validate_rows()
+            except errors.CutplaceError as error:
+                serial_error = error
+            self.assertIsNotNone(serial_error)
+            try:
+                with validio.Reader(cid, data_path, workers=3) as reader:
+                    self.assertIsNotNone(reader._parallel_chunks())
+                    reader.validate_rows()
+                self.fail()
+            except errors.CutplaceError as parallel_error:
+                self.assertEqual(str(serial_error), str(parallel_error))
+
+    def test_can_collect_stats_in_parallel(self):
+        rows = self._rows(100)
+        rows[80][0] = "x"
+        rows[90][0] = "y"
+        data_path = self._write_data("test_can_collect_stats_in_parallel", rows)
+        with validio.Reader(self._cid, data_path, workers=3, collect_stats=True) as reader:
+            self.assertRaises(errors.FieldValueError, reader.validate_rows)
+        id_stats = reader.stats.field_stats[0]
+        self.assertGreaterEqual(id_stats.rejected_count, 1)
+        self.assertEqual(81, id_stats.error_samples[0][0].line)
+
+    def test_can_validate_stream_with_several_workers(self):
+        with io.StringIO("1\n2\n") as data_stream:
+            with validio.Reader(_DIGIT_CID, data_stream, workers=2) as reader:
+                self.assertIsNone(reader._parallel_chunks())
+                reader.validate_rows()
+                self.assertEqual(2, reader.accepted_rows_count)
+
 
 class WriterTest(unittest.TestCase):
     def setUp(self):